@@ -0,0 +1,71 @@
+"""
+Бенчмарк агрегации сумм.
+
+Сравнивает aggregate_amounts (целые минимальные единицы) с ручным
+циклом на Decimal, считающим те же count/sum/min/max при группировке
+по валюте и статусу.
+
+Запуск:
+    python -m benchmarks.bench_aggregation [число_операций]
+"""
+
+import random
+import sys
+import timeit
+from decimal import Decimal
+from typing import Any
+
+from benchmarks.data import CURRENCIES, SEED, STATES
+from src.aggregation import aggregate_amounts
+
+
+def make_operations(size: int) -> list[dict[str, Any]]:
+    rng = random.Random(SEED)
+    return [
+        {
+            "state": rng.choice(STATES),
+            "operationAmount": {
+                "amount": f"{rng.randrange(10**6)}.{rng.randrange(100):02d}",
+                "currency": {"code": rng.choice(CURRENCIES)},
+            },
+        }
+        for _ in range(size)
+    ]
+
+
+def decimal_stats(operations: list[dict[str, Any]]) -> dict[tuple[Any, ...], list[Any]]:
+    groups: dict[tuple[Any, ...], list[Any]] = {}
+    for operation in operations:
+        key = (operation["operationAmount"]["currency"]["code"], operation["state"])
+        amount = Decimal(operation["operationAmount"]["amount"])
+        stats = groups.get(key)
+        if stats is None:
+            groups[key] = [1, amount, amount, amount]
+        else:
+            stats[0] += 1
+            stats[1] += amount
+            stats[2] = min(stats[2], amount)
+            stats[3] = max(stats[3], amount)
+    return groups
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    operations = make_operations(size)
+    by = ("currency", "state")
+
+    expected = decimal_stats(operations)
+    result = aggregate_amounts(operations, by)
+    assert {key: list(stats.as_decimal().values()) for key, stats in result.items()} == expected
+
+    print(f"Операций: {size}")
+    for name, func in (
+        ("Decimal", lambda: decimal_stats(operations)),
+        ("aggregate_amounts", lambda: aggregate_amounts(operations, by)),
+    ):
+        elapsed = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:18} {elapsed:.3f} c")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Бенчмарк бинарного колоночного файла против JSON-выгрузки.
+
+Сравнивает старт задачи (json.load против открытия через mmap) и
+фильтрацию по статусу и валюте и сортировку по дате: по словарям из JSON
+и по столбцам MappedTransactionStore (позиции, без создания словарей).
+
+Запуск:
+    python -m benchmarks.bench_binary_store [число_транзакций]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.bench_store import iter_transactions
+from src.binary_store import MappedTransactionStore, write_binary_store
+from src.generators import filter_by_currency
+from src.processing import filter_by_state, sort_by_date
+
+
+def timed(run: Callable[[], Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = run()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    with tempfile.TemporaryDirectory() as directory:
+        json_path, binary_path = Path(directory, "operations.json"), Path(directory, "operations.bin")
+        transactions = list(iter_transactions(size))
+        json_path.write_text(json.dumps(transactions, ensure_ascii=False), encoding="utf-8")
+        start = time.perf_counter()
+        write_binary_store(transactions, binary_path)
+        write_seconds = time.perf_counter() - start
+        del transactions
+
+        print(f"Транзакций: {size}")
+        print(f"JSON:   {os.path.getsize(json_path) / 2**20:8.1f} МБ")
+        print(f"бинарный: {os.path.getsize(binary_path) / 2**20:6.1f} МБ (запись {write_seconds:.2f} c)")
+
+        data, load_seconds = timed(lambda: json.loads(json_path.read_text(encoding="utf-8")))
+        store, open_seconds = timed(lambda: MappedTransactionStore(binary_path))
+        rows = (
+            (
+                "filter_by_state",
+                lambda: filter_by_state(data, "EXECUTED"),
+                lambda: store.positions_by_state("EXECUTED"),
+            ),
+            (
+                "filter_by_currency",
+                lambda: list(filter_by_currency(data, "USD")),
+                lambda: store.positions_by_currency("USD"),
+            ),
+            ("sort_by_date", lambda: sort_by_date(data), lambda: store.positions_by_date()),
+        )
+        print(f"{'':20} {'JSON + словари':>16} {'mmap + столбцы':>16}")
+        print(f"{'старт':20} {load_seconds:14.3f} c {open_seconds:14.3f} c")
+        for name, on_dicts, on_columns in rows:
+            dict_result, dict_seconds = timed(on_dicts)
+            column_result, column_seconds = timed(on_columns)
+            assert len(dict_result) == len(column_result)
+            print(f"{name:20} {dict_seconds:14.3f} c {column_seconds:14.3f} c")
+        # Хранилище передаётся в типизированные функции так же, как список словарей
+        executed: list[dict[str, Any]] = filter_by_state(store, "EXECUTED")
+        assert len(executed) == len(filter_by_state(data, "EXECUTED"))
+        assert len(sort_by_date(store)) == len(data)
+        assert len(list(filter_by_currency(store, "USD"))) == len(list(filter_by_currency(data, "USD")))
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Бенчмарк внешней сортировки по дате.
+
+Сравнивает время и пик аллокаций sort_by_date на списке в памяти
+с external_sort_by_date на потоке операций с бюджетом памяти.
+
+Запуск:
+    python -m benchmarks.bench_external_sort [число_операций] [бюджет_МБ]
+"""
+
+import sys
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Iterator
+
+from benchmarks.data import make_operations
+from src.external_sort import external_sort_by_date
+from src.processing import sort_by_date
+
+BATCH = 10000
+
+
+def stream(size: int) -> Iterator[dict[str, Any]]:
+    """Операции порциями, чтобы источник сам не держал весь набор в памяти."""
+    for start in range(0, size, BATCH):
+        batch = make_operations(min(BATCH, size - start), seed=start)
+        yield from batch
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    budget = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    print(f"Операций: {size}, бюджет: {budget} МБ")
+
+    for name, run in (
+        ("sort_by_date", lambda: sort_by_date(list(stream(size)))),
+        ("external_sort_by_date", lambda: deque(external_sort_by_date(stream(size), memory_budget=budget << 20), 0)),
+    ):
+        tracemalloc.start()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:22} время: {elapsed:7.2f} c  пик аллокаций: {peak / 1024 / 1024:8.1f} МБ")
+
+
+if __name__ == "__main__":
+    main()
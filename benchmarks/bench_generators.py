@@ -0,0 +1,39 @@
+"""
+Бенчмарк генерации номеров карт.
+
+Сравнивает пропускную способность (номеров в секунду)
+card_number_generator, card_number_chunks и card_number_records.
+
+Запуск:
+    python -m benchmarks.bench_generators [количество_номеров]
+"""
+
+import sys
+import time
+from typing import Callable, Iterable, Sized
+
+from src.generators import card_number_chunks, card_number_generator, card_number_records
+
+START = 4000000000000000
+
+
+def throughput(name: str, produce: Callable[[], Iterable[Sized]], record_size: int = 1) -> None:
+    start = time.perf_counter()
+    produced = sum(len(item) for item in produce()) // record_size
+    elapsed = time.perf_counter() - start
+    print(f"{name:32} {produced:>10} номеров  {produced / elapsed:14,.0f} номеров/с")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    stop = START + count - 1
+    print(f"Номеров: {count}")
+
+    throughput("card_number_generator", lambda: card_number_generator(START, stop), record_size=19)
+    throughput("card_number_chunks", lambda: card_number_chunks(START, stop))
+    throughput("card_number_records", lambda: card_number_records(START, stop), record_size=20)
+    throughput("card_number_chunks (luhn)", lambda: card_number_chunks(START, stop, luhn=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Бенчмарк инкрементальной истории операций.
+
+Сценарий виджета: к истории из N операций по одной поступают новые,
+после каждого поступления выводятся 10 последних. Сравниваются
+пересортировка всего списка (sort_by_date), ограниченная куча
+(latest_operations) и SortedHistory.add + latest; время SortedHistory
+включает однократное построение из начальной истории.
+
+Запуск:
+    python -m benchmarks.bench_history [размер_истории] [число_поступлений]
+"""
+
+import sys
+import time
+from typing import Any, Callable
+
+from benchmarks.data import make_operations
+from src.history import SortedHistory
+from src.processing import latest_operations, sort_by_date
+
+
+def resort(history: list[dict[str, Any]], arrivals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    history = list(history)
+    latest: list[dict[str, Any]] = []
+    for operation in arrivals:
+        history.append(operation)
+        latest = sort_by_date(history)[:10]
+    return latest
+
+
+def heap(history: list[dict[str, Any]], arrivals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    history = list(history)
+    latest: list[dict[str, Any]] = []
+    for operation in arrivals:
+        history.append(operation)
+        latest = latest_operations(history, 10)
+    return latest
+
+
+def incremental(history: list[dict[str, Any]], arrivals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    sorted_history = SortedHistory(history)
+    latest: list[dict[str, Any]] = []
+    for operation in arrivals:
+        sorted_history.add(operation)
+        latest = sorted_history.latest(10)
+    return latest
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    operations = make_operations(size + count)
+    history, arrivals = operations[:size], operations[size:]
+
+    print(f"История: {size}, поступлений: {count}")
+    expected = None
+    runs: tuple[tuple[str, Callable[..., list[dict[str, Any]]]], ...] = (
+        ("sort_by_date на каждое", resort),
+        ("latest_operations на каждое", heap),
+        ("SortedHistory", incremental),
+    )
+    for name, run in runs:
+        start = time.perf_counter()
+        latest = run(history, arrivals)
+        elapsed = time.perf_counter() - start
+        assert expected is None or latest == expected
+        expected = latest
+        print(f"{name:28} {elapsed:8.3f} c  {elapsed / count * 1e6:10.1f} мкс/событие")
+
+    sorted_history = SortedHistory(history)
+    start = time.perf_counter()
+    for operation in arrivals:
+        sorted_history.add(operation)
+    elapsed = time.perf_counter() - start
+    print(f"{'SortedHistory.add':28} {elapsed:8.3f} c  {elapsed / count * 1e6:10.1f} мкс/вставку")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Бенчмарк индекса транзакций.
+
+Сравнивает три запроса filter_by_currency (USD, RUB, EUR) к списку
+с теми же запросами к TransactionIndex, включая время построения индекса.
+
+Запуск:
+    python -m benchmarks.bench_index [число_операций]
+"""
+
+import sys
+import time
+
+from benchmarks.data import CURRENCIES, make_operations
+from src.generators import filter_by_currency
+from src.index import TransactionIndex
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    operations = make_operations(size)
+    print(f"Операций: {size}")
+
+    start = time.perf_counter()
+    scanned = [list(filter_by_currency(operations, currency)) for currency in CURRENCIES]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = TransactionIndex(operations)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [list(filter_by_currency(index, currency)) for currency in CURRENCIES]
+    query_time = time.perf_counter() - start
+
+    assert scanned == indexed
+    print(f"список, 3 запроса:  {scan_time:.3f} c")
+    print(f"построение индекса: {build_time:.3f} c")
+    print(f"индекс, 3 запроса:  {query_time:.3f} c")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Бенчмарк кэша маскирования mask_account_card.
+
+Поток платёжных строк, где 80% строк принадлежат постоянным клиентам
+(5000 карт и счетов), а 20% — новые номера. Повторные строки создаются
+заново, как при чтении JSON.
+
+Запуск:
+    python -m benchmarks.bench_mask_cache [число_строк] [доля_повторов]
+"""
+
+import random
+import sys
+import timeit
+
+from benchmarks.data import SEED
+from src.widget import configure_mask_cache, mask_account_card, mask_cache_info
+
+REGULAR_CUSTOMERS = 5000
+
+
+def make_payment(rng: random.Random) -> str:
+    if rng.random() < 0.3:
+        return f"Счет {rng.randrange(10**19, 10**20)}"
+    return f"{rng.choice(['Visa Classic', 'Visa Platinum', 'Maestro', 'MasterCard'])} {rng.randrange(10**15, 10**16)}"
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    repeat_rate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.8
+    rng = random.Random(SEED)
+
+    regular = [make_payment(rng) for _ in range(REGULAR_CUSTOMERS)]
+    payments = [
+        "".join(rng.choice(regular).partition(" ")) if rng.random() < repeat_rate else make_payment(rng)
+        for _ in range(size)
+    ]
+
+    expected = [mask_account_card(p) for p in payments]
+    print(f"Строк: {size}, повторов: {repeat_rate:.0%}")
+
+    for name, maxsize in (("без кэша", 0), ("кэш 10000", 10000)):
+        configure_mask_cache(maxsize)
+        assert [mask_account_card(p) for p in payments] == expected
+        configure_mask_cache(maxsize)
+        elapsed = min(timeit.repeat(lambda: [mask_account_card(p) for p in payments], number=1, repeat=3))
+        print(f"{name:10} {elapsed:.3f} c")
+
+    info = mask_cache_info()
+    print(f"{info}, доля попаданий {info.hits / (info.hits + info.misses):.1%}")
+    configure_mask_cache(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Бенчмарк пакетного маскирования номеров карт.
+
+Сравнивает цикл вызовов get_mask_card_number с mask_card_numbers
+на 10^6 номеров.
+
+Запуск:
+    python -m benchmarks.bench_masks
+"""
+
+import random
+import time
+
+from src.masks import get_mask_card_number, mask_card_numbers
+
+SIZE = 10**6
+SEED = 42
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    card_numbers = [str(rng.randrange(10**15, 10**16)) for _ in range(SIZE)]
+
+    start = time.perf_counter()
+    scalar = [get_mask_card_number(number) for number in card_numbers]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = mask_card_numbers(card_numbers)
+    batch_time = time.perf_counter() - start
+
+    assert scalar == batch
+
+    print(f"Номеров: {SIZE}")
+    print(f"get_mask_card_number (цикл): {scalar_time:.3f} c")
+    print(f"mask_card_numbers:           {batch_time:.3f} c")
+    print(f"Ускорение:                   x{scalar_time / batch_time:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Бенчмарк параллельного маскирования выгрузки.
+
+Измеряет время mask_transactions_parallel для разного числа процессов
+и выводит кривую ускорения относительно обработки в одном процессе.
+
+Запуск:
+    python -m benchmarks.bench_pipeline [число_транзакций] [число_процессов,...]
+
+По умолчанию число процессов удваивается от 1 до числа ядер.
+"""
+
+import os
+import random
+import sys
+import time
+from typing import Any
+
+from benchmarks.data import SEED
+from src.pipeline import mask_transactions_parallel
+
+
+def make_transactions(size: int) -> list[dict[str, Any]]:
+    rng = random.Random(SEED)
+    return [
+        {
+            "id": index,
+            "date": f"20{rng.randrange(10, 25)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}T02:08:58.425572",
+            "from": f"Visa Classic {rng.randrange(10**15, 10**16)}",
+            "to": f"Счет {rng.randrange(10**19, 10**20)}",
+        }
+        for index in range(size)
+    ]
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    transactions = make_transactions(size)
+    cpus = os.cpu_count() or 1
+    print(f"Транзакций: {size}, ядер: {cpus}")
+
+    if len(sys.argv) > 2:
+        worker_counts = [int(value) for value in sys.argv[2].split(",")]
+    else:
+        worker_counts = [2**power for power in range(cpus.bit_length()) if 2**power <= cpus]
+
+    baseline = 0.0
+    for workers in worker_counts:
+        start = time.perf_counter()
+        for _ in mask_transactions_parallel(transactions, workers=workers):
+            pass
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"процессов: {workers:3}  время: {elapsed:7.2f} c  ускорение: x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
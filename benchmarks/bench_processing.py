@@ -0,0 +1,41 @@
+"""
+Бенчмарк выборки последних операций.
+
+Сравнивает sort_by_date(data)[:n] с latest_operations(data, n),
+а также три вызова filter_by_state (по одному на статус)
+с одним проходом partition_by_state и count_by_state.
+
+Запуск:
+    python -m benchmarks.bench_processing [число_операций]
+"""
+
+import sys
+import timeit
+
+from benchmarks.data import STATES, make_operations
+from src.processing import count_by_state, filter_by_state, latest_operations, partition_by_state, sort_by_date
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    operations = make_operations(size)
+    print(f"Операций: {size}")
+
+    for n in (10, 50):
+        assert latest_operations(operations, n) == sort_by_date(operations)[:n]
+        full = min(timeit.repeat(lambda: sort_by_date(operations)[:n], number=1, repeat=3))
+        heap = min(timeit.repeat(lambda: latest_operations(operations, n), number=1, repeat=3))
+        print(f"n={n:<3} sort_by_date[:n]: {full:.3f} c  latest_operations: {heap:.3f} c  x{full / heap:.2f}")
+
+    groups = partition_by_state(operations)
+    assert all(groups[state] == filter_by_state(operations, state) for state in STATES)
+    for name, run in (
+        ("filter_by_state x3", lambda: [filter_by_state(operations, state) for state in STATES]),
+        ("partition_by_state", lambda: partition_by_state(operations)),
+        ("count_by_state", lambda: count_by_state(operations)),
+    ):
+        print(f"{name:20} {min(timeit.repeat(run, number=1, repeat=3)):.3f} c")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Бенчмарк ленивого запроса Transactions.
+
+Сравнивает цепочку filter_by_state → filter_by_currency → sort_by_date
+с эквивалентным запросом Transactions на синтетическом наборе операций.
+
+Запуск:
+    python -m benchmarks.bench_query [число_операций]
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks.data import make_operations
+from src.generators import filter_by_currency
+from src.processing import filter_by_state, sort_by_date
+from src.query import Transactions
+
+
+def run(name: str, func: Callable[[], list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:14} время: {elapsed:7.3f} c  пик аллокаций: {peak / 1024 / 1024:8.1f} МБ")
+    return result
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    operations = make_operations(size)
+    print(f"Операций: {size}")
+
+    chained = run(
+        "функции",
+        lambda: sort_by_date(list(filter_by_currency(filter_by_state(operations, "EXECUTED"), "USD"))),
+    )
+    query = run(
+        "Transactions",
+        lambda: Transactions(operations).state("EXECUTED").currency("USD").sort_by_date().to_list(),
+    )
+    assert chained == query
+
+
+if __name__ == "__main__":
+    main()
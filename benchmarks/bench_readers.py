@@ -0,0 +1,94 @@
+"""
+Бенчмарк потокового чтения транзакций.
+
+Генерирует JSON-массив заданного размера (по умолчанию 1 ГБ), затем
+в отдельном процессе читает его через read_json_array с фильтрацией
+filter_by_currency и выводит пиковое потребление памяти (RSS).
+С флагом --json-load для сравнения выполняется json.load всего файла.
+
+Запуск:
+    python -m benchmarks.bench_readers [размер_в_МБ] [--json-load]
+"""
+
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SEED = 42
+
+
+def generate_dump(path: Path, size_mb: int) -> int:
+    """Записывает JSON-массив транзакций размером около size_mb мегабайт."""
+    rng = random.Random(SEED)
+    limit = size_mb * 1024 * 1024
+    written = 0
+    count = 0
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("[\n")
+        while written < limit:
+            transaction = {
+                "id": rng.randrange(10**8, 10**9),
+                "state": rng.choice(["EXECUTED", "CANCELED"]),
+                "date": f"20{rng.randrange(10, 25)}-0{rng.randrange(1, 10)}-1{rng.randrange(0, 10)}T02:08:58.425572",
+                "operationAmount": {
+                    "amount": f"{rng.randrange(1, 10**6)}.{rng.randrange(100):02d}",
+                    "currency": {"name": "USD", "code": rng.choice(["USD", "RUB", "EUR"])},
+                },
+                "description": "Перевод организации",
+                "from": f"Счет {rng.randrange(10**19, 10**20)}",
+                "to": f"Счет {rng.randrange(10**19, 10**20)}",
+            }
+            line = ("," if count else "") + json.dumps(transaction, ensure_ascii=False) + "\n"
+            file.write(line)
+            written += len(line.encode("utf-8"))
+            count += 1
+        file.write("]\n")
+
+    return count
+
+
+def measure(path: str, mode: str) -> None:
+    """Читает файл выбранным способом и печатает время и пиковый RSS."""
+    from src.generators import filter_by_currency
+    from src.readers import read_json_array
+
+    start = time.perf_counter()
+    if mode == "stream":
+        found = sum(1 for _ in filter_by_currency(read_json_array(path), "USD"))
+    else:
+        with open(path, encoding="utf-8") as file:
+            found = sum(1 for _ in filter_by_currency(json.load(file), "USD"))
+    elapsed = time.perf_counter() - start
+
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode:10} USD: {found:>10}  время: {elapsed:8.2f} c  пиковый RSS: {peak_mb:8.1f} МБ")
+
+
+def main() -> None:
+    if len(sys.argv) == 4 and sys.argv[1] == "--measure":
+        measure(sys.argv[2], sys.argv[3])
+        return
+
+    size_mb = int(next((arg for arg in sys.argv[1:] if arg.isdigit()), "1024"))
+    modes = ["stream"] + (["json.load"] if "--json-load" in sys.argv else [])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "operations.json"
+        count = generate_dump(path, size_mb)
+        print(f"Файл: {path.stat().st_size / 1024 / 1024:.0f} МБ, транзакций: {count}")
+
+        for mode in modes:
+            # Каждый режим в отдельном процессе, чтобы пиковый RSS не смешивался
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_readers", "--measure", str(path), mode], check=True
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Бенчмарк функций без исключений на грязных данных.
+
+Сравнивает try/except вокруг каждого вызова get_mask_card_number,
+mask_account_card и get_date с вариантами try_*, а также построчную
+обработку операций с try/except с RecordTransformer.apply_report.
+Доля некорректных значений задаётся вторым аргументом (по умолчанию 5%).
+
+Запуск:
+    python -m benchmarks.bench_results [число_строк] [доля_ошибок]
+"""
+
+import random
+import sys
+import timeit
+from typing import Any, Callable
+
+from benchmarks.data import SEED, make_card_numbers, make_dates, make_operations, make_payments
+from src.masks import get_mask_card_number, try_get_mask_card_number
+from src.transform import DEFAULT_SCHEMA, RecordTransformer
+from src.widget import get_date, mask_account_card, try_get_date, try_mask_account_card
+
+BAD_VALUES = ("", "bad", "12345", "Visa Platinum", "2024/03/11", "70007922896063xx")
+
+
+def spoil(values: list[str], ratio: float, seed: int = SEED) -> list[str]:
+    rng = random.Random(seed)
+    return [rng.choice(BAD_VALUES) if rng.random() < ratio else value for value in values]
+
+
+def with_except(func: Callable[[Any], str], values: list[str]) -> list[str | None]:
+    result: list[str | None] = []
+    for value in values:
+        try:
+            result.append(func(value))
+        except ValueError:
+            result.append(None)
+    return result
+
+
+def with_status(func: Callable[[Any], Any], values: list[str]) -> list[str | None]:
+    result: list[str | None] = []
+    for value in values:
+        status, masked = func(value)
+        result.append(None if status else masked)
+    return result
+
+
+def records_with_except(operations: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[tuple[int, str]]]:
+    """Обработка операций вручную: try/except на каждое поле и список ошибок."""
+    result, errors = [], []
+    for index, operation in enumerate(operations):
+        masked = dict(operation)
+        for field, func in (("from", mask_account_card), ("to", mask_account_card), ("date", get_date)):
+            value = operation.get(field)
+            if value:
+                try:
+                    masked[field] = func(value)
+                except ValueError as e:
+                    masked[field] = None
+                    errors.append((index, str(e).split(":", 1)[0]))
+        result.append(masked)
+    return result, errors
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+
+    cards = spoil(make_card_numbers(size), ratio)
+    payments = spoil(make_payments(size), ratio)
+    dates = spoil(make_dates(size), ratio)
+    operations = make_operations(size)
+    for operation, payment, date in zip(operations, payments, dates):
+        operation["to"] = payment
+        operation["date"] = date
+    transformer = RecordTransformer(DEFAULT_SCHEMA)
+
+    print(f"Строк: {size}, некорректных: {ratio:.0%}")
+    for name, run in (
+        ("get_mask_card_number + except", lambda: with_except(get_mask_card_number, cards)),
+        ("try_get_mask_card_number", lambda: with_status(try_get_mask_card_number, cards)),
+        ("mask_account_card + except", lambda: with_except(mask_account_card, payments)),
+        ("try_mask_account_card", lambda: with_status(try_mask_account_card, payments)),
+        ("get_date + except", lambda: with_except(get_date, dates)),
+        ("try_get_date", lambda: with_status(try_get_date, dates)),
+        ("операции + except", lambda: records_with_except(operations)),
+        ("apply_report", lambda: transformer.apply_report(operations)),
+    ):
+        elapsed = min(timeit.repeat(run, number=1, repeat=3))
+        print(f"{name:30} {elapsed:.3f} c")
+
+
+if __name__ == "__main__":
+    main()
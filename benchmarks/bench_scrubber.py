@@ -0,0 +1,61 @@
+"""
+Бенчмарк маскирования номеров в свободном тексте.
+
+Описания операций: около 8% содержат номер карты (слитно, через пробел
+или дефис) или счёта, ещё 12% — короткие числа (номера заказов), остальные
+без цифр. Пропускная способность считается в МБ/с текста в UTF-8.
+
+Запуск:
+    python -m benchmarks.bench_scrubber [число_описаний]
+"""
+
+import random
+import sys
+import timeit
+from typing import Any
+
+from benchmarks.data import SEED
+from src.scrubber import scrub_descriptions, scrub_text
+
+WORDS = (
+    "Перевод организации с карты на карту счет оплата услуг комментарий клиента возврат средств по заказу номер"
+).split()
+
+
+def make_descriptions(size: int, seed: int = SEED) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    operations = []
+    for _ in range(size):
+        description = " ".join(rng.choice(WORDS) for _ in range(rng.randrange(3, 12)))
+        kind = rng.random()
+        if kind < 0.05:
+            card = str(rng.randrange(10**15, 10**16))
+            separator = rng.choice(["", " ", "-"])
+            description += " " + separator.join(card[i : i + 4] for i in range(0, 16, 4))
+        elif kind < 0.08:
+            description += f" {rng.randrange(10**19, 10**20)}"
+        elif kind < 0.2:
+            description += f" заказ {rng.randrange(10**5)}"
+        operations.append({"description": description})
+    return operations
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    operations = make_descriptions(size)
+    texts = [operation["description"] for operation in operations]
+    megabytes = sum(len(text.encode("utf-8")) for text in texts) / 1e6
+    print(f"Описаний: {size}, {megabytes:.1f} МБ")
+
+    for name, run in (
+        ("scrub_text", lambda: [scrub_text(text) for text in texts]),
+        ("scrub_text(luhn=True)", lambda: [scrub_text(text, luhn=True) for text in texts]),
+        ("scrub_descriptions", lambda: list(scrub_descriptions(operations))),
+        ("одна строка", lambda: scrub_text("\n".join(texts))),
+    ):
+        elapsed = min(timeit.repeat(run, number=1, repeat=3))
+        print(f"{name:22} {elapsed:.3f} c  {megabytes / elapsed:6.1f} МБ/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Бенчмарк времени старта подкоманд main.py.
+
+Время импортов сверх пустого интерпретатора — сумма self-времени модулей
+по выводу python -X importtime, лучший из нескольких запусков. Превышение
+бюджета отмечается в выводе; состав загружаемых модулей проверяет
+tests/test_main.py, а не этот замер, потому что время зависит от машины.
+
+Запуск:
+    python -m benchmarks.bench_startup
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+MAIN = Path(__file__).resolve().parent.parent / "main.py"
+
+# Бюджет времени импортов, мс. Замер на момент добавления:
+# mask/format-date ~17 мс, generate-cards ~27 мс, sort ~29 мс, filter ~39 мс
+STARTUP_BUDGET_MS = {"mask": 50, "format-date": 50, "generate-cards": 80, "filter": 100, "sort": 80}
+
+# OPERATIONS заменяется путём к файлу с операциями
+COMMAND_ARGS = {
+    "mask": ["Visa Platinum 7000792289606361"],
+    "format-date": ["2024-03-11T02:26:18.671407"],
+    "generate-cards": ["1", "10"],
+    "filter": ["--state", "EXECUTED", "--currency", "USD", "OPERATIONS"],
+    "sort": ["OPERATIONS"],
+}
+
+RUNS = 5
+
+
+def import_time_us(args: list[str], env: dict[str, str]) -> int:
+    """Сумма self-времени импортов (мкс) по выводу python -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], capture_output=True, text=True, env=env, check=True
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "self [us]" not in line:
+            total += int(line[len("import time:") :].split("|")[0])
+    return total
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        # Кэш байт-кода в отдельном каталоге, как при обычном запуске
+        env = dict(os.environ)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env["PYTHONPYCACHEPREFIX"] = os.path.join(tmp, "pycache")
+        operations = os.path.join(tmp, "operations.json")
+        with open(operations, "w", encoding="utf-8") as file:
+            json.dump([{"id": 1, "state": "EXECUTED", "date": "2019-07-03T18:35:29.512364"}], file)
+
+        baseline = min(import_time_us(["-c", "pass"], env) for _ in range(RUNS))
+        for command, command_args in COMMAND_ARGS.items():
+            args = [str(MAIN), command, *(operations if arg == "OPERATIONS" else arg for arg in command_args)]
+            import_time_us(args, env)  # прогрев кэша байт-кода
+            elapsed_ms = (min(import_time_us(args, env) for _ in range(RUNS)) - baseline) / 1000
+            budget = STARTUP_BUDGET_MS[command]
+            mark = "" if elapsed_ms < budget else "  ПРЕВЫШЕН БЮДЖЕТ"
+            print(f"{command:15} {elapsed_ms:6.1f} мс (бюджет {budget} мс){mark}")
+
+
+if __name__ == "__main__":
+    main()
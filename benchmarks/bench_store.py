@@ -0,0 +1,61 @@
+"""
+Бенчмарк памяти колоночного хранилища.
+
+Измеряет через tracemalloc объём памяти на миллион транзакций
+в словарной форме и в TransactionStore.
+
+Запуск:
+    python -m benchmarks.bench_store [число_транзакций]
+"""
+
+import gc
+import random
+import sys
+import tracemalloc
+from typing import Any, Callable, Iterator
+
+from benchmarks.data import CURRENCIES, SEED, STATES
+from src.store import TransactionStore
+
+
+def iter_transactions(size: int) -> Iterator[dict[str, Any]]:
+    rng = random.Random(SEED)
+    descriptions = ["Перевод организации", "Перевод с карты на карту", "Открытие вклада", "Перевод со счета на счет"]
+    for _ in range(size):
+        yield {
+            "id": rng.randrange(10**8, 10**9),
+            "state": rng.choice(STATES),
+            "date": f"20{rng.randrange(10, 25)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}T02:08:58.425572",
+            "operationAmount": {
+                "amount": f"{rng.randrange(1, 10**6)}.{rng.randrange(100):02d}",
+                "currency": {"name": (code := rng.choice(CURRENCIES)), "code": code},
+            },
+            "description": rng.choice(descriptions),
+            "from": f"Visa Classic {rng.randrange(10**15, 10**16)}",
+            "to": f"Счет {rng.randrange(10**19, 10**20)}",
+        }
+
+
+def measure(build: Callable[[], Any]) -> tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    # Хранилище строится из потока, чтобы в замер попали и его собственные строки 'from'/'to'
+    _, dict_bytes = measure(lambda: list(iter_transactions(size)))
+    _, store_bytes = measure(lambda: TransactionStore.from_dicts(iter_transactions(size)))
+
+    per_million = 10**6 / size / 1024 / 1024
+    print(f"Транзакций: {size}")
+    print(f"словари:          {dict_bytes * per_million:8.1f} МБ на 10^6 ({dict_bytes / size:6.0f} байт на запись)")
+    print(f"TransactionStore: {store_bytes * per_million:8.1f} МБ на 10^6 ({store_bytes / size:6.0f} байт на запись)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Бенчмарк сортировки по разобранным датам.
+
+Сравнивает три способа сортировки операций:
+- sort_by_date: сравнение исходных строк;
+- sort_by_date(parse_dates=True): ключи parse_timestamp;
+- sorted с ключом datetime.fromisoformat.
+
+Запуск:
+    python -m benchmarks.bench_timestamps [число_операций]
+"""
+
+import random
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import Any
+
+from benchmarks.data import SEED
+from src.processing import sort_by_date
+
+
+def make_operations(size: int) -> list[dict[str, Any]]:
+    """Операции с датами в смешанных форматах: 'Z', смещения, разная точность секунд."""
+    rng = random.Random(SEED)
+    suffixes = ["", "Z", "+03:00", ".123Z", ".051309", ".5-02:00"]
+    return [
+        {
+            "id": index,
+            "date": f"20{rng.randrange(10, 25)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}"
+            f"T{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}{rng.choice(suffixes)}",
+        }
+        for index in range(size)
+    ]
+
+
+def fromisoformat_key(operation: dict[str, Any]) -> datetime:
+    dt = datetime.fromisoformat(operation["date"])
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    operations = make_operations(size)
+    print(f"Операций: {size}")
+
+    cases = {
+        "строки": lambda: sort_by_date(operations),
+        "parse_timestamp": lambda: sort_by_date(operations, parse_dates=True),
+        "fromisoformat": lambda: sorted(operations, key=fromisoformat_key, reverse=True),
+    }
+    assert cases["parse_timestamp"]() == cases["fromisoformat"]()
+
+    for name, func in cases.items():
+        elapsed = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:16} {elapsed:.3f} c")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Бенчмарк функций модуля widget.
+
+Сравнивает get_date (быстрый путь с кэшем) с прямым разбором
+datetime.fromisoformat + strftime на строках с повторяющимися датами,
+а также mask_account_card с прежним разбором через split/join/lower.
+
+Запуск:
+    python -m benchmarks.bench_widget [число_строк]
+"""
+
+import random
+import sys
+import timeit
+from datetime import datetime
+
+from benchmarks.data import SEED
+from src.masks import get_mask_account, get_mask_card_number
+from src.widget import date_cache_info, get_date, mask_account_card
+
+
+def fromisoformat_date(date_str: str) -> str:
+    return datetime.fromisoformat(date_str).strftime("%d.%m.%Y")
+
+
+def split_mask_account_card(payment_info: str) -> str:
+    """Прежняя реализация mask_account_card для сравнения."""
+    parts = payment_info.strip().split(" ")
+    number = parts[-1]
+    description = " ".join(parts[:-1])
+    if description.lower() == "счет":
+        return f"{description} {get_mask_account(number)}"
+    return f"{description} {get_mask_card_number(number)}"
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    rng = random.Random(SEED)
+    # Выписка: тысячи строк за несколько десятков дней
+    dates = [
+        f"2024-03-{rng.randrange(1, 29):02d}T{rng.randrange(24):02d}:{rng.randrange(60):02d}:00"
+        f".{rng.randrange(10**6):06d}"
+        for _ in range(size)
+    ]
+    assert [get_date(d) for d in dates[:1000]] == [fromisoformat_date(d) for d in dates[:1000]]
+
+    print(f"Строк: {size}")
+    for name, func in (("fromisoformat", fromisoformat_date), ("get_date", get_date)):
+        elapsed = min(timeit.repeat(lambda: [func(d) for d in dates], number=1, repeat=3))
+        print(f"{name:14} {elapsed:.3f} c")
+    print(date_cache_info())
+
+    kinds = ["Счет", "Visa Classic", "Visa Platinum", "Maestro", "MasterCard"]
+    payments = [
+        f"{kind} {rng.randrange(10**19, 10**20) if kind == 'Счет' else rng.randrange(10**15, 10**16)}"
+        for kind in (rng.choice(kinds) for _ in range(size))
+    ]
+    assert [mask_account_card(p) for p in payments[:1000]] == [split_mask_account_card(p) for p in payments[:1000]]
+
+    for name, mask in (("split/join", split_mask_account_card), ("mask_account_card", mask_account_card)):
+        elapsed = min(timeit.repeat(lambda: [mask(p) for p in payments], number=1, repeat=3))
+        print(f"{name:18} {elapsed:.3f} c")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Синтетические данные для бенчмарков.
+
+Все генераторы детерминированы: одинаковый seed даёт одинаковый набор.
+"""
+
+import random
+from typing import Any
+
+SEED = 42
+
+STATES = ["EXECUTED", "CANCELED", "PENDING"]
+CURRENCIES = ["USD", "RUB", "EUR"]
+
+
+def make_operations(size: int, seed: int = SEED) -> list[dict[str, Any]]:
+    """Создаёт size операций со статусом, датой и валютой."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": index,
+            "state": rng.choice(STATES),
+            "date": f"20{rng.randrange(10, 25)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}T02:08:58",
+            "operationAmount": {"amount": "1.00", "currency": {"code": rng.choice(CURRENCIES)}},
+        }
+        for index in range(size)
+    ]
+
+
+def make_card_numbers(size: int, seed: int = SEED) -> list[str]:
+    """Создаёт size номеров карт из 16 цифр."""
+    rng = random.Random(seed)
+    return [str(rng.randrange(10**15, 10**16)) for _ in range(size)]
+
+
+def make_account_numbers(size: int, seed: int = SEED) -> list[str]:
+    """Создаёт size номеров счетов из 20 цифр."""
+    rng = random.Random(seed)
+    return [str(rng.randrange(10**19, 10**20)) for _ in range(size)]
+
+
+def make_payments(size: int, seed: int = SEED) -> list[str]:
+    """Создаёт size строк платёжной информации: около 30% счетов, остальное — карты."""
+    rng = random.Random(seed)
+    kinds = ["Visa Classic", "Visa Platinum", "Maestro", "MasterCard"]
+    return [
+        (
+            f"Счет {rng.randrange(10**19, 10**20)}"
+            if rng.random() < 0.3
+            else f"{rng.choice(kinds)} {rng.randrange(10**15, 10**16)}"
+        )
+        for _ in range(size)
+    ]
+
+
+def make_dates(size: int, seed: int = SEED) -> list[str]:
+    """Создаёт size дат ISO 8601 с микросекундами."""
+    rng = random.Random(seed)
+    return [
+        f"20{rng.randrange(10, 25)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}"
+        f"T{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}.{rng.randrange(10**6):06d}"
+        for _ in range(size)
+    ]
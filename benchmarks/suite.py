@@ -0,0 +1,181 @@
+"""
+Набор бенчмарков публичных функций с сохранением результатов в JSON.
+
+Для каждой функции и размера набора (10^3 … 10^7 записей) данные
+генерируются детерминированно по seed, время берётся как минимум
+из нескольких повторов. Режим compare сравнивает результаты с сохранённой
+базовой линией и завершается с кодом 1, если хотя бы одна функция
+замедлилась больше порога.
+
+Запуск:
+    python -m benchmarks.suite run --sizes 1000,100000 --output results.json
+    python -m benchmarks.suite compare baseline.json results.json --threshold 0.2
+    python -m benchmarks.suite run --baseline baseline.json  # запуск и сравнение сразу
+
+Размер 10^7 требует нескольких гигабайт памяти на наборы операций.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from collections import deque
+from typing import Any, Callable, NamedTuple
+
+from benchmarks.data import SEED, make_account_numbers, make_card_numbers, make_dates, make_operations, make_payments
+from src.generators import card_number_generator, filter_by_currency, transaction_descriptions
+from src.masks import get_mask_account, get_mask_card_number
+from src.processing import filter_by_state, sort_by_date
+from src.widget import get_date, mask_account_card
+
+DEFAULT_SIZES = (10**3, 10**4, 10**5, 10**6)
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.2
+
+CARD_START = 4000000000000000
+
+
+class Case(NamedTuple):
+    """Бенчмарк одной функции: генератор данных и замеряемое действие над ними."""
+
+    make_data: Callable[[int, int], Any]
+    run: Callable[[Any], Any]
+
+
+CASES: dict[str, Case] = {
+    "get_mask_card_number": Case(make_card_numbers, lambda data: [get_mask_card_number(n) for n in data]),
+    "get_mask_account": Case(make_account_numbers, lambda data: [get_mask_account(n) for n in data]),
+    "mask_account_card": Case(make_payments, lambda data: [mask_account_card(p) for p in data]),
+    "get_date": Case(make_dates, lambda data: [get_date(d) for d in data]),
+    "filter_by_state": Case(make_operations, filter_by_state),
+    "sort_by_date": Case(make_operations, sort_by_date),
+    "filter_by_currency": Case(make_operations, lambda data: deque(filter_by_currency(data, "USD"), maxlen=0)),
+    "transaction_descriptions": Case(make_operations, lambda data: deque(transaction_descriptions(data), maxlen=0)),
+    "card_number_generator": Case(
+        lambda size, seed: size, lambda size: deque(card_number_generator(CARD_START, CARD_START + size - 1), maxlen=0)
+    ),
+}
+
+
+def measure(case: Case, size: int, seed: int = SEED, repeat: int = DEFAULT_REPEAT) -> float:
+    """Лучшее время из repeat запусков на наборе из size записей; набор освобождается после замера."""
+    data = case.make_data(size, seed)
+    return min(timeit.repeat(lambda: case.run(data), number=1, repeat=repeat))
+
+
+def run_suite(
+    functions: list[str], sizes: list[int], seed: int = SEED, repeat: int = DEFAULT_REPEAT
+) -> dict[str, Any]:
+    """
+    Замеряет функции на наборах указанных размеров.
+
+    Возвращает:
+        dict: {"meta": {...}, "results": [{"function", "size", "seconds", "ns_per_record"}, ...]}
+    """
+    results = []
+    for name in functions:
+        case = CASES[name]
+        for size in sizes:
+            seconds = measure(case, size, seed, repeat)
+            results.append({"function": name, "size": size, "seconds": seconds, "ns_per_record": seconds / size * 1e9})
+            print(f"{name:24} {size:>10}  {seconds:9.4f} c  {seconds / size * 1e9:10.1f} нс/запись", file=sys.stderr)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """
+    Сравнивает результаты с базовой линией.
+
+    Сравниваются пары (функция, размер), присутствующие в обоих наборах.
+
+    Аргументы:
+        baseline (dict): Результаты run_suite, принятые за эталон.
+        current (dict): Проверяемые результаты run_suite.
+        threshold (float): Допустимое замедление, 0.2 — на 20%.
+
+    Возвращает:
+        list[str]: Описания регрессий; пустой список, если регрессий нет.
+    """
+    reference = {(r["function"], r["size"]): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        key = (result["function"], result["size"])
+        if key not in reference:
+            continue
+        ratio = result["seconds"] / reference[key]
+        status = "OK"
+        if ratio > 1 + threshold:
+            status = "РЕГРЕССИЯ"
+            regressions.append(f"{key[0]} (n={key[1]}): медленнее в {ratio:.2f} раза")
+        print(f"{key[0]:24} {key[1]:>10}  x{ratio:5.2f}  {status}", file=sys.stderr)
+    return regressions
+
+
+def _load(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as file:
+        result: dict[str, Any] = json.load(file)
+    return result
+
+
+def _report(regressions: list[str]) -> int:
+    for regression in regressions:
+        print(regression, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="замерить функции и вывести JSON")
+    run_parser.add_argument("--functions", default=",".join(CASES), help="имена функций через запятую")
+    run_parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="размеры через запятую")
+    run_parser.add_argument("--seed", type=int, default=SEED)
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument("--output", help="файл для результатов (по умолчанию stdout)")
+    run_parser.add_argument("--baseline", help="сравнить с базовой линией после замера")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = commands.add_parser("compare", help="сравнить результаты с базовой линией")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return _report(compare(_load(args.baseline), _load(args.current), args.threshold))
+
+    functions = args.functions.split(",")
+    unknown = [name for name in functions if name not in CASES]
+    if unknown:
+        parser.error(f"неизвестные функции: {', '.join(unknown)}")
+    sizes = [int(float(size)) for size in args.sizes.split(",")]
+
+    results = run_suite(functions, sizes, args.seed, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+    else:
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+
+    if args.baseline:
+        return _report(compare(_load(args.baseline), results, args.threshold))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
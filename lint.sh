@@ -4,15 +4,16 @@
 set -e
 
 echo "--- Running flake8 ---"
-flake8 src/ tests/
+flake8 src/ tests/ benchmarks/ main.py
 
 echo "--- Running black ---"
-black src/ tests/
+black src/ tests/ benchmarks/ main.py
 
 echo "--- Running isort ---"
-isort src/ tests/
+isort src/ tests/ benchmarks/ main.py
 
 echo "--- Running mypy ---"
-mypy src/ tests/
+# tests/ исключены из проверки mypy в pyproject.toml
+mypy src/ benchmarks/ main.py
 
 echo "--- All checks passed! ---"
@@ -1,13 +1,206 @@
-from src.processing import filter_by_state, sort_by_date
-from src.widget import get_date, mask_account_card
-from src.generators import (
-    filter_by_currency,
-    transaction_descriptions,
-    card_number_generator,
-)
+"""
+Командная строка виджета банковских операций.
 
+    python main.py mask "Visa Platinum 7000792289606361"
+    python main.py format-date < dates.txt
+    python main.py filter --state EXECUTED operations.json
+    python main.py sort --asc operations.ndjson
+    python main.py generate-cards 1 100
+
+Без аргументов запускается демонстрация всех модулей.
+
+Задания запускаются тысячи раз в день, поэтому время старта важнее всего:
+модули src импортируются внутри обработчика подкоманды и только те,
+что ей нужны. Состав загружаемых модулей проверяет tests/test_main.py,
+время старта — benchmarks/bench_startup.py.
+"""
+
+import sys
+from itertools import chain
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import argparse
+
+
+def _lines(values: list[str]) -> Iterable[str]:
+    """Значения из аргументов, а если их нет — непустые строки stdin."""
+    if values:
+        return values
+    return (line.rstrip("\r\n") for line in sys.stdin if line.strip())
+
+
+def _convert(values: list[str], convert: Callable[[str], str]) -> int:
+    """Построчно применяет convert; ошибки выводятся в stderr, обработка продолжается."""
+    status = 0
+    write = sys.stdout.write
+    for value in _lines(values):
+        try:
+            write(convert(value) + "\n")
+        except ValueError as e:
+            print(f"Ошибка: {e}", file=sys.stderr)
+            status = 1
+    return status
+
+
+def _read_stdin(stream: IO[str]) -> Iterator[dict[str, Any]]:
+    """Операции из stdin: JSON-массив или NDJSON (определяется по первому символу)."""
+    import json
+
+    first = ""
+    for first in iter(lambda: stream.read(1), ""):
+        if not first.isspace():
+            break
+    if first == "[":
+        yield from json.loads(first + stream.read())
+        return
+
+    if not first:
+        return
+    for line in chain([first + stream.readline()], stream):
+        if line.strip():
+            yield json.loads(line)
+
+
+def _read_operations(path: str | None) -> Iterator[dict[str, Any]]:
+    if path is None or path == "-":
+        return _read_stdin(sys.stdin)
+
+    from src.readers import read_transactions
+
+    return read_transactions(path)
+
+
+def _write_operations(operations: Iterable[dict[str, Any]]) -> int:
+    import json
+
+    write = sys.stdout.write
+    for operation in operations:
+        write(json.dumps(operation, ensure_ascii=False))
+        write("\n")
+    return 0
+
+
+def cmd_mask(values: list[str]) -> int:
+    from src.widget import mask_account_card
+
+    return _convert(values, mask_account_card)
+
+
+def cmd_format_date(values: list[str]) -> int:
+    from src.widget import get_date
+
+    return _convert(values, get_date)
+
+
+def cmd_filter(args: "argparse.Namespace") -> int:
+    operations: Iterable[dict[str, Any]] = _read_operations(args.file)
+    if args.state is not None:
+        from src.processing import iter_by_state
+
+        operations = (operation for _, operation in iter_by_state(operations, [args.state]))
+    if args.currency is not None:
+        from src.generators import filter_by_currency
+
+        operations = filter_by_currency(operations, args.currency)
+    return _write_operations(operations)
+
+
+def cmd_sort(args: "argparse.Namespace") -> int:
+    operations = _read_operations(args.file)
+    if args.memory_budget is not None:
+        from src.external_sort import external_sort_by_date
+
+        budget = int(args.memory_budget * 1024 * 1024)
+        return _write_operations(external_sort_by_date(operations, not args.asc, args.parse_dates, budget))
+
+    from src.processing import sort_by_date
+
+    return _write_operations(sort_by_date(list(operations), not args.asc, args.parse_dates))
+
+
+def cmd_generate_cards(args: "argparse.Namespace") -> int:
+    from src.generators import card_number_records
+
+    output = sys.stdout.buffer
+    for record in card_number_records(args.start, args.stop, luhn=args.luhn):
+        output.write(record)
+    return 0
+
+
+def build_parser() -> "argparse.ArgumentParser":
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="main.py", description="Виджет банковских операций")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+
+    mask = commands.add_parser("mask", help="замаскировать карты и счета ('Visa Platinum 7000792289606361')")
+    mask.add_argument("values", nargs="*", help="строки платёжной информации (по умолчанию stdin)")
+    mask.set_defaults(handler=lambda args: cmd_mask(args.values))
+
+    format_date = commands.add_parser("format-date", help="дата ISO 8601 → ДД.ММ.ГГГГ")
+    format_date.add_argument("values", nargs="*", help="даты (по умолчанию stdin)")
+    format_date.set_defaults(handler=lambda args: cmd_format_date(args.values))
+
+    filter_ = commands.add_parser("filter", help="отфильтровать операции по статусу и/или валюте")
+    filter_.add_argument("file", nargs="?", help="JSON/NDJSON-файл (по умолчанию stdin)")
+    filter_.add_argument("--state", help="статус, например EXECUTED")
+    filter_.add_argument("--currency", help="код валюты, например USD")
+    filter_.set_defaults(handler=cmd_filter)
+
+    sort = commands.add_parser("sort", help="отсортировать операции по дате")
+    sort.add_argument("file", nargs="?", help="JSON/NDJSON-файл (по умолчанию stdin)")
+    sort.add_argument("--asc", action="store_true", help="сначала старые операции")
+    sort.add_argument("--parse-dates", action="store_true", help="сравнивать даты как моменты времени")
+    sort.add_argument("--memory-budget", type=float, metavar="MB", help="внешняя сортировка с бюджетом памяти")
+    sort.set_defaults(handler=cmd_sort)
+
+    cards = commands.add_parser("generate-cards", help="номера карт XXXX XXXX XXXX XXXX из диапазона")
+    cards.add_argument("start", type=int)
+    cards.add_argument("stop", type=int)
+    cards.add_argument("--luhn", action="store_true", help="только номера с корректной контрольной цифрой")
+    cards.set_defaults(handler=cmd_generate_cards)
+
+    return parser
+
+
+# Подкоманды, которым достаточно списка значений. Без опций они запускаются
+# без argparse: его импорт и сборка парсера занимают около трети времени старта
+_VALUE_COMMANDS: dict[str, Callable[[list[str]], int]] = {"mask": cmd_mask, "format-date": cmd_format_date}
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        demo()
+        return 0
+
+    arg: Any
+    if argv[0] in _VALUE_COMMANDS and not any(value.startswith("-") for value in argv[1:]):
+        handler, arg = _VALUE_COMMANDS[argv[0]], argv[1:]
+    else:
+        args = build_parser().parse_args(argv)
+        handler, arg = args.handler, args
+
+    try:
+        status: int = handler(arg)
+    except BrokenPipeError:
+        # Вывод передан в head и подобные команды, которые закрыли канал раньше
+        sys.stderr.close()
+        return 0
+    except (OSError, ValueError) as e:
+        # Например, отсутствующий файл операций: одна строка вместо трассировки
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 1
+    return status
+
+
+def demo() -> None:
+    """Демонстрация работы всех модулей (запуск без аргументов)."""
+    from src.generators import card_number_generator, filter_by_currency, transaction_descriptions
+    from src.processing import filter_by_state, sort_by_date
+    from src.widget import get_date, mask_account_card
 
-def main():
     # Тестовые данные для processing
     processing_operations = [
         {"id": 414288290, "state": "EXECUTED", "date": "2019-07-03T18:35:29.051309"},
@@ -154,4 +347,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Модуль агрегации сумм банковских операций.
+
+Считает количество, сумму, минимум и максимум operationAmount.amount
+с группировкой по валюте, статусу и дню за один проход по любому
+итерируемому источнику (списку, генераторам src.generators, потоковым
+reader'ам src.readers). Суммы разбираются в целые минимальные единицы,
+поэтому результат точно совпадает с вычислениями в Decimal. Сумма,
+не выражаемая целыми копейками ("1.234"), учитывается как Decimal.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Iterable
+
+from src.amounts import AmountPrecisionError, decimal_minor_units, minor_units_to_decimal, parse_minor_units
+
+GROUP_KEYS = ("currency", "state", "day")
+
+
+@dataclass(slots=True)
+class AmountStats:
+    """
+    Накопленная статистика сумм одной группы в минимальных единицах.
+
+    Атрибуты:
+        count (int): Количество операций.
+        total (int | Decimal): Сумма в копейках/центах; Decimal, если среди
+                               сумм были суммы с дробными копейками.
+        minimum (int | Decimal | None): Наименьшая сумма (None, если операций нет).
+        maximum (int | Decimal | None): Наибольшая сумма (None, если операций нет).
+    """
+
+    count: int = 0
+    total: int | Decimal = 0
+    minimum: int | Decimal | None = None
+    maximum: int | Decimal | None = None
+
+    def as_decimal(self) -> dict[str, Any]:
+        """Статистика с суммами в Decimal: count, total, min, max."""
+        return {
+            "count": self.count,
+            "total": minor_units_to_decimal(self.total),
+            "min": None if self.minimum is None else minor_units_to_decimal(self.minimum),
+            "max": None if self.maximum is None else minor_units_to_decimal(self.maximum),
+        }
+
+
+def aggregate_amounts(
+    transactions: Iterable[dict[str, Any]], by: tuple[str, ...] = ("currency",)
+) -> dict[tuple[Any, ...], AmountStats]:
+    """
+    Считает статистику сумм операций с группировкой за один проход.
+
+    Операции без operationAmount пропускаются. Суммы разбираются
+    parse_minor_units, некорректная сумма вызывает ValueError. Сумма
+    с большим числом знаков после точки (валюты с тремя знаками)
+    учитывается точно, через decimal_minor_units.
+
+    Аргументы:
+        transactions (Iterable[dict]): Операции, список или любой итератор.
+        by (tuple[str, ...]): Ключи группировки из 'currency', 'state', 'day'
+                              (день — первые 10 символов даты, YYYY-MM-DD).
+                              Пустой кортеж — одна общая группа с ключом ().
+
+    Возвращает:
+        dict[tuple, AmountStats]: Статистика для каждого сочетания значений ключей.
+
+    Примеры:
+        >>> stats = aggregate_amounts(filter_by_state(transactions), by=("currency",))
+        >>> stats[("USD",)].as_decimal()["total"]
+        Decimal('145822.54')
+    """
+    unknown = [key for key in by if key not in GROUP_KEYS]
+    if unknown:
+        raise ValueError(f"Неизвестные ключи группировки: {', '.join(unknown)}")
+
+    use_currency = "currency" in by
+    use_state = "state" in by
+    use_day = "day" in by
+    # Ключ внутри цикла всегда (валюта, статус, день) без вызова функций на каждое поле,
+    # в запрошенный порядок ключи переставляются один раз в конце
+    order = [GROUP_KEYS.index(key) for key in by]
+
+    # Статистика хранится списком [count, total, min, max]:
+    # обращение по индексу дешевле, чем к атрибутам объекта
+    groups: dict[tuple[Any, Any, Any], list[Any]] = {}
+
+    for transaction in transactions:
+        operation_amount = transaction.get("operationAmount")
+        if operation_amount is None:
+            continue
+        try:
+            value: int | Decimal = parse_minor_units(operation_amount["amount"])
+        except AmountPrecisionError:
+            value = decimal_minor_units(operation_amount["amount"])
+
+        key = (
+            operation_amount.get("currency", {}).get("code", "") if use_currency else None,
+            transaction.get("state") if use_state else None,
+            str(transaction.get("date", ""))[:10] if use_day else None,
+        )
+        stats = groups.get(key)
+        if stats is None:
+            groups[key] = [1, value, value, value]
+            continue
+        stats[0] += 1
+        stats[1] += value
+        if value < stats[2]:
+            stats[2] = value
+        elif value > stats[3]:
+            stats[3] = value
+
+    return {tuple([key[index] for index in order]): AmountStats(*stats) for key, stats in groups.items()}
+
+
+def sum_by_currency(transactions: Iterable[dict[str, Any]]) -> dict[str, Decimal]:
+    """
+    Сумма операций по каждой валюте в Decimal.
+
+    Примеры:
+        >>> sum_by_currency(transactions)
+        {'USD': Decimal('145822.54'), 'RUB': Decimal('145065.74')}
+    """
+    return {key[0]: minor_units_to_decimal(stats.total) for key, stats in aggregate_amounts(transactions).items()}
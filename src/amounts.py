@@ -0,0 +1,130 @@
+"""
+Модуль работы с денежными суммами операций.
+
+Суммы в operationAmount.amount хранятся строками ("9824.07").
+Функции модуля переводят их в целое число минимальных единиц
+(копеек, центов) и обратно без создания Decimal и float; итоговые
+значения можно получить в виде Decimal через minor_units_to_decimal.
+Суммы с большим числом знаков (валюты с тремя знаками после точки)
+в целые копейки не переводятся: для них есть decimal_minor_units.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+MINOR_UNITS = 100
+_SCALE_DIGITS = 2
+# Предел порядка в записи "1E+2": больше не бывает у сумм, а 10 ** порядок остаётся дешёвым
+_MAX_EXPONENT = 100
+
+
+class AmountPrecisionError(ValueError):
+    """Корректная сумма, которая не выражается целым числом минимальных единиц ("1.234")."""
+
+
+def parse_minor_units(amount: str) -> int:
+    """
+    Преобразует строковую сумму в целое число минимальных единиц.
+
+    Незначащие нули после точки и запись с порядком допускаются:
+    "1.230" → 123, "1E+2" → 10000.
+
+    Аргументы:
+        amount (str): Сумма вида "9824.07", "-15.5" или "100".
+
+    Возвращает:
+        int: Сумма в копейках/центах. Пример: "9824.07" → 982407
+
+    Исключения:
+        AmountPrecisionError: Если после отбрасывания незначащих нулей
+                              остаётся больше двух знаков после точки.
+        ValueError: Если строка не является числом.
+
+    Примеры:
+        >>> parse_minor_units("67314.7")
+        6731470
+    """
+    # Быстрый путь для типичной записи "12345.67": убрать точку и выполнить один int()
+    if type(amount) is str and amount[-3:-2] == ".":
+        digits = amount.replace(".", "", 1)
+        if digits.isdigit() and digits.isascii():
+            return int(digits)
+
+    str_amount = str(amount).strip()
+    sign = 1
+    if str_amount[:1] in ("-", "+"):
+        sign = -1 if str_amount[0] == "-" else 1
+        str_amount = str_amount[1:]
+
+    mantissa, has_exponent, exponent = str_amount.lower().partition("e")
+    whole, _, fraction = mantissa.partition(".")
+    exponent_digits = exponent[1:] if exponent[:1] in ("-", "+") else exponent
+    if (
+        not (whole or fraction)
+        or (whole and not (whole.isascii() and whole.isdigit()))
+        or (fraction and not (fraction.isascii() and fraction.isdigit()))
+        or (has_exponent and not (exponent_digits.isascii() and exponent_digits.isdigit()))
+    ):
+        raise ValueError(f"Некорректная сумма: {amount}")
+    power = int(exponent) if has_exponent else 0
+    if abs(power) > _MAX_EXPONENT:
+        raise ValueError(f"Некорректная сумма: {amount}")
+
+    # Сумма равна number · 10^(-scale); лишние знаки после точки допустимы, только если это нули
+    number = int(whole + fraction or "0")
+    scale = len(fraction) - power
+    factor: int = 10 ** abs(_SCALE_DIGITS - scale)
+    if scale <= _SCALE_DIGITS:
+        return sign * number * factor
+    value, remainder = divmod(number, factor)
+    if remainder:
+        raise AmountPrecisionError(f"Сумма должна содержать не более {_SCALE_DIGITS} знаков после точки: {amount}")
+    return sign * value
+
+
+def decimal_minor_units(amount: str) -> "Decimal":
+    """
+    Сумма в минимальных единицах в виде Decimal — для сумм, на которых
+    parse_minor_units вызывает AmountPrecisionError.
+
+    Примеры:
+        >>> decimal_minor_units("1.234")
+        Decimal('123.4')
+    """
+    from decimal import Decimal
+
+    # parse_minor_units проверяет запись: Decimal принял бы и "NaN", и цифры других алфавитов
+    try:
+        return Decimal(parse_minor_units(amount))
+    except AmountPrecisionError:
+        return Decimal(str(amount).strip()).scaleb(_SCALE_DIGITS)
+
+
+def format_minor_units(value: int) -> str:
+    """
+    Преобразует сумму в минимальных единицах обратно в строку с двумя знаками.
+
+    Примеры:
+        >>> format_minor_units(982407)
+        '9824.07'
+    """
+    whole, fraction = divmod(abs(value), MINOR_UNITS)
+    sign = "-" if value < 0 else ""
+    return f"{sign}{whole}.{fraction:02d}"
+
+
+def minor_units_to_decimal(value: "int | Decimal") -> "Decimal":
+    """
+    Преобразует сумму в минимальных единицах в Decimal с двумя знаками
+    (значение из decimal_minor_units сохраняет все свои знаки).
+
+    Примеры:
+        >>> minor_units_to_decimal(982407)
+        Decimal('9824.07')
+    """
+    # decimal импортируется при первом вызове: модуль загружается вместе с src.store, а Decimal нужен редко
+    from decimal import Decimal
+
+    return Decimal(value).scaleb(-_SCALE_DIGITS)
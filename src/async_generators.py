@@ -0,0 +1,141 @@
+"""
+Модуль асинхронных аналогов генераторов и функций обработки транзакций.
+
+Функции принимают асинхронные источники (AsyncIterable), например
+курсор базы данных или поток ответа HTTP-клиента, а также обычные
+итерируемые объекты. Транзакции обрабатываются блоками по batch_size:
+блок обрабатывается синхронными функциями src.generators, src.processing
+и src.widget, после чего управление возвращается циклу событий, поэтому
+длинная история не блокирует другие запросы сервиса.
+"""
+
+import asyncio
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+
+from src.generators import filter_by_currency, transaction_descriptions
+from src.processing import filter_by_state
+from src.widget import PAYMENT_FIELDS, mask_operations
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+async def _batches(
+    transactions: AsyncIterable[dict[str, Any]] | Iterable[dict[str, Any]], batch_size: int
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Делит источник на блоки по batch_size транзакций.
+
+    Перед выдачей каждого блока управление передаётся циклу событий,
+    даже если источник отдаёт данные без ожидания (список или быстрый буфер).
+    """
+    if batch_size <= 0:
+        raise ValueError("Размер блока должен быть положительным")
+
+    batch: list[dict[str, Any]] = []
+    if isinstance(transactions, AsyncIterable):
+        async for transaction in transactions:
+            batch.append(transaction)
+            if len(batch) >= batch_size:
+                await asyncio.sleep(0)
+                yield batch
+                batch = []
+    else:
+        for transaction in transactions:
+            batch.append(transaction)
+            if len(batch) >= batch_size:
+                await asyncio.sleep(0)
+                yield batch
+                batch = []
+
+    if batch:
+        await asyncio.sleep(0)
+        yield batch
+
+
+async def afilter_by_currency(
+    transactions: AsyncIterable[dict[str, Any]] | Iterable[dict[str, Any]],
+    currency: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Асинхронный аналог filter_by_currency.
+
+    Аргументы:
+        transactions (AsyncIterable[dict] | Iterable[dict]): Источник транзакций.
+        currency (str): Код валюты для фильтрации, например 'USD' или 'RUB'.
+        batch_size (int): Количество транзакций, обрабатываемых без передачи управления.
+
+    Возвращает:
+        AsyncIterator[dict]: Транзакции с заданной валютой в исходном порядке.
+
+    Примеры:
+        >>> async for t in afilter_by_currency(cursor, "USD"):
+        ...     print(t["id"])
+    """
+    async for batch in _batches(transactions, batch_size):
+        for transaction in filter_by_currency(batch, currency):
+            yield transaction
+
+
+async def atransaction_descriptions(
+    transactions: AsyncIterable[dict[str, Any]] | Iterable[dict[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[str]:
+    """
+    Асинхронный аналог transaction_descriptions.
+
+    Примеры:
+        >>> async for description in atransaction_descriptions(cursor):
+        ...     print(description)
+    """
+    async for batch in _batches(transactions, batch_size):
+        for description in transaction_descriptions(batch):
+            yield description
+
+
+async def afilter_by_state(
+    transactions: AsyncIterable[dict[str, Any]] | Iterable[dict[str, Any]],
+    state: str = "EXECUTED",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[dict[str, Any]]:
+    """
+    Асинхронный аналог filter_by_state.
+
+    Как и синхронная версия, возвращает список операций с указанным статусом.
+
+    Примеры:
+        >>> executed = await afilter_by_state(cursor)
+        >>> canceled = await afilter_by_state(cursor, state="CANCELED")
+    """
+    filtered_data = []
+    async for batch in _batches(transactions, batch_size):
+        filtered_data.extend(filter_by_state(batch, state))
+    return filtered_data
+
+
+async def amask_operations(
+    transactions: AsyncIterable[dict[str, Any]] | Iterable[dict[str, Any]],
+    fields: tuple[str, ...] = PAYMENT_FIELDS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Асинхронная стадия маскирования: аналог mask_operations для потока.
+
+    Аргументы:
+        transactions (AsyncIterable[dict] | Iterable[dict]): Источник транзакций.
+        fields (tuple[str, ...]): Поля с платёжной информацией.
+        batch_size (int): Количество транзакций, обрабатываемых без передачи управления.
+
+    Возвращает:
+        AsyncIterator[dict]: Копии транзакций с замаскированными полями в исходном порядке.
+
+    Исключения:
+        ValueError: Если данные транзакции некорректны (как в mask_account_card).
+
+    Примеры:
+        >>> async for t in amask_operations(afilter_by_currency(cursor, "USD")):
+        ...     await response.write(t)
+    """
+    async for batch in _batches(transactions, batch_size):
+        for transaction in mask_operations(batch, fields):
+            yield transaction
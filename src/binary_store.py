@@ -0,0 +1,251 @@
+"""
+Модуль бинарного колоночного файла транзакций.
+
+Разбор JSON-выгрузки при каждом запуске обработки занимает больше времени,
+чем сама фильтрация. write_binary_store один раз сохраняет транзакции
+в компактный файл, а MappedTransactionStore открывает его через mmap:
+столбцы доступны как memoryview над отображённым файлом без копирования
+и без разбора, поэтому открытие занимает время порядка O(1).
+
+Формат файла (порядок байтов — порядок машины, записавшей файл):
+    заголовок: сигнатура, версия, длина метаданных, число транзакций;
+    метаданные JSON: справочники статусов и валют, точные суммы с дробными
+        копейками (позиция → строка), смещения столбцов;
+    столбцы фиксированной ширины, выровненные по 8 байт:
+        ids, dates (микросекунды UTC), amounts (минимальные единицы) — int64,
+        states, currencies (коды справочников) — uint16,
+        descriptions, senders, recipients (номера строк в куче) — uint32;
+    куча строк: смещения int64 и байты UTF-8. Одинаковые строки хранятся один раз.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence, overload
+
+from src.store import ColumnarTransactions, TransactionStore
+
+MAGIC = b"TXNSTORE"
+VERSION = 2
+# Версия 1 отличается только отсутствием exact_amounts в метаданных
+_READABLE_VERSIONS = (1, 2)
+
+_HEADER = struct.Struct("<8sIIQ")
+_ALIGNMENT = 8
+# Номер строки для отсутствующего значения (None)
+NULL_STRING = 0xFFFFFFFF
+
+# Столбец → тип элемента (код array/memoryview)
+_NUMERIC_COLUMNS = {"ids": "q", "dates": "q", "amounts": "q", "states": "H", "currencies": "H"}
+_STRING_COLUMNS = ("descriptions", "senders", "recipients")
+
+
+def _string_ids(values: Iterable[str | None], heap: dict[str, int]) -> "array[int]":
+    ids = array("I")
+    for value in values:
+        if value is None:
+            ids.append(NULL_STRING)
+        else:
+            string_id = heap.get(value)
+            if string_id is None:
+                string_id = heap[value] = len(heap)
+            ids.append(string_id)
+    return ids
+
+
+def write_binary_store(transactions: Iterable[dict[str, Any]] | TransactionStore, path: str | Path) -> int:
+    """
+    Сохраняет транзакции в бинарный колоночный файл.
+
+    Данные нормализуются так же, как в TransactionStore (даты — в UTC,
+    суммы — в минимальных единицах). Файл записывается во временный
+    и заменяется через os.replace, поэтому читатели не видят его частично записанным.
+
+    Аргументы:
+        transactions (Iterable[dict] | TransactionStore): Транзакции в словарной форме
+                                                          или уже построенное хранилище.
+        path (str | Path): Путь к файлу.
+
+    Возвращает:
+        int: Число записанных транзакций.
+
+    Исключения:
+        ValueError: Если дата или сумма некорректны.
+
+    Пример:
+        >>> write_binary_store(read_transactions("operations.json"), "operations.bin")
+        101
+    """
+    store = transactions if isinstance(transactions, TransactionStore) else TransactionStore.from_dicts(transactions)
+    count = len(store)
+
+    heap: dict[str, int] = {}
+    columns: dict[str, array[int]] = {name: getattr(store, name) for name in _NUMERIC_COLUMNS}
+    for name in _STRING_COLUMNS:
+        columns[name] = _string_ids(getattr(store, name), heap)
+
+    encoded = [value.encode("utf-8") for value in heap]
+    offsets = array("q", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    columns["string_offsets"] = offsets
+
+    metadata: dict[str, Any] = {
+        "byteorder": sys.byteorder,
+        "state_values": store.state_values,
+        "currency_values": store.currency_values,
+        "exact_amounts": store.exact_amounts,
+        "columns": {},
+    }
+    # Смещения столбцов зависят от длины метаданных, поэтому сначала считаем размеры,
+    # а смещения записываем относительно начала области данных
+    position = 0
+    for name, column in columns.items():
+        metadata["columns"][name] = [position, column.typecode, len(column)]
+        position += -(-len(column) * column.itemsize // _ALIGNMENT) * _ALIGNMENT
+    metadata["columns"]["string_heap"] = [position, "B", offsets[-1]]
+    metadata_bytes = json.dumps(metadata, ensure_ascii=False).encode("utf-8")
+    data_start = -(-(_HEADER.size + len(metadata_bytes)) // _ALIGNMENT) * _ALIGNMENT
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, len(metadata_bytes), count))
+        file.write(metadata_bytes)
+        file.write(b"\0" * (data_start - file.tell()))
+        for column in columns.values():
+            file.write(column.tobytes())
+            file.write(b"\0" * (-file.tell() % _ALIGNMENT))
+        for data in encoded:
+            file.write(data)
+    os.replace(tmp_path, path)
+    return count
+
+
+class StringColumn(Sequence[str | None]):
+    """
+    Строковый столбец поверх кучи строк файла.
+
+    Хранит только представления memoryview; строка декодируется
+    из UTF-8 при обращении к элементу.
+    """
+
+    def __init__(self, ids: memoryview, offsets: memoryview, heap: memoryview) -> None:
+        self.ids = ids
+        self._offsets = offsets
+        self._heap = heap
+
+    def _decode(self, string_id: int) -> str | None:
+        if string_id == NULL_STRING:
+            return None
+        return str(self._heap[self._offsets[string_id] : self._offsets[string_id + 1]], "utf-8")
+
+    @overload
+    def __getitem__(self, position: int) -> str | None:
+        """Строка с указанной позицией или None."""
+
+    @overload
+    def __getitem__(self, position: slice) -> list[str | None]:
+        """Строки из среза позиций."""
+
+    def __getitem__(self, position: int | slice) -> str | None | list[str | None]:
+        if isinstance(position, slice):
+            return [self._decode(string_id) for string_id in self.ids[position]]
+        return self._decode(self.ids[position])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[str | None]:
+        decode = self._decode
+        for string_id in self.ids:
+            yield decode(string_id)
+
+
+class MappedTransactionStore(ColumnarTransactions):
+    """
+    Транзакции из бинарного файла write_binary_store, отображённого в память.
+
+    Столбцы ids, dates, amounts, states и currencies — memoryview над файлом
+    без копирования; строковые столбцы декодируются по требованию.
+    Хранилище только для чтения и поддерживает те же операции, что
+    TransactionStore: filter_by_state, filter_by_currency, sort_by_date
+    и transaction_descriptions работают по столбцам, а словари создаются
+    только для возвращаемых транзакций. Позиции без создания словарей
+    дают positions_by_state, positions_by_currency и positions_by_date.
+
+    Аргументы:
+        path (str | Path): Путь к файлу.
+
+    Исключения:
+        ValueError: Если файл не в этом формате, другой версии
+                    или записан на машине с другим порядком байтов.
+
+    Примеры:
+        >>> with MappedTransactionStore("operations.bin") as store:
+        ...     executed = filter_by_state(store, "EXECUTED")
+        ...     newest = store.positions_by_date()[:10]
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            # Пустой файл mmap не отображает, поэтому заголовок проверяем до отображения
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"Файл {self.path} не является хранилищем транзакций")
+            magic, version, metadata_length, _ = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"Файл {self.path} не является хранилищем транзакций")
+            if version not in _READABLE_VERSIONS:
+                raise ValueError(f"Неподдерживаемая версия хранилища: {version}")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buffer = memoryview(self._mmap)
+        metadata = json.loads(bytes(buffer[_HEADER.size : _HEADER.size + metadata_length]))
+        if metadata["byteorder"] != sys.byteorder:
+            buffer.release()
+            self._mmap.close()
+            raise ValueError(f"Файл записан с порядком байтов {metadata['byteorder']}")
+
+        data_start = -(-(_HEADER.size + metadata_length) // _ALIGNMENT) * _ALIGNMENT
+        self._views = [buffer]
+        views: dict[str, memoryview] = {}
+        for name, (offset, typecode, length) in metadata["columns"].items():
+            start = data_start + offset
+            view = buffer[start : start + length * struct.calcsize(typecode)].cast(typecode)
+            self._views.append(view)
+            views[name] = view
+
+        self.ids = views["ids"]
+        self.dates = views["dates"]
+        self.amounts = views["amounts"]
+        self.states = views["states"]
+        self.currencies = views["currencies"]
+        self.descriptions, self.senders, self.recipients = (
+            StringColumn(views[name], views["string_offsets"], views["string_heap"]) for name in _STRING_COLUMNS
+        )
+
+        self.state_values = metadata["state_values"]
+        self.currency_values = [None if value is None else tuple(value) for value in metadata["currency_values"]]
+        self._state_codes = {value: code for code, value in enumerate(self.state_values)}
+        self._currency_codes = {value: code for code, value in enumerate(self.currency_values)}
+        self._descriptions = {}
+        self.exact_amounts = {int(position): amount for position, amount in metadata.get("exact_amounts", {}).items()}
+
+    def close(self) -> None:
+        """Освобождает представления и закрывает отображение файла."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedTransactionStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,138 @@
+"""
+Модуль внешней сортировки операций по дате.
+
+Для историй, которые не помещаются в память: поток операций делится
+на блоки в пределах бюджета памяти, каждый блок сортируется так же,
+как в sort_by_date, и сбрасывается во временный файл (JSON Lines
+в компактной записи). Затем файлы сливаются k-путевым слиянием
+(heapq.merge), и результат выдаётся генератором.
+"""
+
+import heapq
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from src.processing import MISSING_TIMESTAMP
+from src.timestamps import parse_timestamp
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+# Больше файлов за один проход не сливаем, чтобы не упереться в лимит открытых файлов
+MAX_MERGE_FILES = 64
+# Примерные накладные расходы на одну операцию в блоке сверх длины её JSON-строки
+_RECORD_OVERHEAD = 120
+
+_Entry = tuple[Any, str]
+
+
+def _date_key(operation: dict[str, Any], parse_dates: bool) -> Any:
+    date = operation.get("date")
+    if parse_dates:
+        return MISSING_TIMESTAMP if date is None else parse_timestamp(date)
+    return "" if date is None else date
+
+
+def _write_run(entries: list[_Entry], directory: str) -> str:
+    """Записывает отсортированный блок в файл: строка '[ключ,операция]' на каждую операцию."""
+    fd, path = tempfile.mkstemp(suffix=".jsonl", dir=directory)
+    with open(fd, "w", encoding="utf-8") as file:
+        for key, line in entries:
+            file.write(f"[{json.dumps(key, ensure_ascii=False)},{line}]\n")
+    return path
+
+
+def _read_run(path: str) -> Iterator[tuple[Any, dict[str, Any]]]:
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            key, operation = json.loads(line)
+            yield key, operation
+
+
+def _merge(paths: list[str], reverse: bool) -> Iterator[tuple[Any, dict[str, Any]]]:
+    # heapq.merge устойчив: при равных ключах раньше выдаётся запись из более раннего файла
+    return heapq.merge(*(_read_run(path) for path in paths), key=lambda entry: entry[0], reverse=reverse)
+
+
+def _merge_to_file(paths: list[str], reverse: bool, directory: str) -> str:
+    fd, merged_path = tempfile.mkstemp(suffix=".jsonl", dir=directory)
+    with open(fd, "w", encoding="utf-8") as file:
+        for key, operation in _merge(paths, reverse):
+            file.write(json.dumps([key, operation], ensure_ascii=False, separators=(",", ":")))
+            file.write("\n")
+    for path in paths:
+        os.remove(path)
+    return merged_path
+
+
+def external_sort_by_date(
+    data: Iterable[dict[str, Any]],
+    reverse: bool = True,
+    parse_dates: bool = False,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    tmp_dir: str | Path | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Сортирует поток операций по дате с ограниченным расходом памяти.
+
+    Порядок совпадает с sort_by_date(list(data), reverse, parse_dates),
+    включая порядок операций с одинаковой датой и положение операций
+    без ключа 'date'. Операции должны сериализоваться в JSON; после
+    прохода через временные файлы кортежи в них становятся списками.
+
+    Аргументы:
+        data (Iterable[dict]): Операции, список или любой итератор (например, read_ndjson).
+        reverse (bool): True — сначала новые (по умолчанию), False — сначала старые.
+        parse_dates (bool): Сравнивать даты как моменты времени (см. sort_by_date).
+        memory_budget (int): Примерный объём памяти на сортируемый блок в байтах.
+        tmp_dir (str | Path | None): Каталог для временных файлов (по умолчанию системный).
+
+    Возвращает:
+        Iterator[dict]: Операции в порядке сортировки. Временные файлы удаляются
+                        после исчерпания или закрытия генератора.
+
+    Исключения:
+        ValueError: Если memory_budget не положителен или дата некорректна при parse_dates=True.
+
+    Примеры:
+        >>> for operation in external_sort_by_date(read_ndjson("history.ndjson"), memory_budget=256 * 2**20):
+        ...     print(operation["date"])
+    """
+    if memory_budget <= 0:
+        raise ValueError("Бюджет памяти должен быть положительным")
+
+    with tempfile.TemporaryDirectory(prefix="sort_by_date_", dir=tmp_dir) as directory:
+        paths: list[str] = []
+        entries: list[_Entry] = []
+        used = 0
+
+        for operation in data:
+            line = json.dumps(operation, ensure_ascii=False, separators=(",", ":"))
+            entries.append((_date_key(operation, parse_dates), line))
+            used += len(line) + _RECORD_OVERHEAD
+            if used >= memory_budget:
+                # sort устойчив и при reverse=True, как sorted в sort_by_date
+                entries.sort(key=lambda entry: entry[0], reverse=reverse)
+                paths.append(_write_run(entries, directory))
+                entries, used = [], 0
+
+        entries.sort(key=lambda entry: entry[0], reverse=reverse)
+        if not paths:
+            # Всё поместилось в бюджет: временные файлы не нужны
+            for _, line in entries:
+                yield json.loads(line)
+            return
+        if entries:
+            paths.append(_write_run(entries, directory))
+            entries = []
+
+        # Слишком много файлов сливаем поэтапно соседними группами, сохраняя устойчивость
+        while len(paths) > MAX_MERGE_FILES:
+            paths = [
+                _merge_to_file(paths[start : start + MAX_MERGE_FILES], reverse, directory)
+                for start in range(0, len(paths), MAX_MERGE_FILES)
+            ]
+
+        for _, operation in _merge(paths, reverse):
+            yield operation
@@ -5,21 +5,49 @@
 с использованием генераторов и итераторов Python.
 """
 
-from typing import Any, Iterator
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Protocol, cast
 
+from src.masks import LUHN_DOUBLED
 
-def filter_by_currency(transactions: list[dict[str, Any]], currency: str) -> Iterator[dict[str, Any]]:
+# Размер записи в бинарном выводе card_number_records: "XXXX XXXX XXXX XXXX\n"
+CARD_RECORD_SIZE = 20
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class SupportsByCurrency(Protocol):
+    """Источник, который сам отвечает на запрос по валюте (TransactionIndex, TransactionStore)."""
+
+    def by_currency(self, currency: str) -> Iterable[dict[str, Any]]:
+        """Транзакции в указанной валюте в исходном порядке."""
+
+
+class SupportsDescriptions(Protocol):
+    """Источник, который сам выдаёт описания транзакций (TransactionStore, MappedTransactionStore)."""
+
+    def iter_descriptions(self) -> Iterator[str]:
+        """Описания в исходном порядке; отсутствующее — пустая строка."""
+
+
+def filter_by_currency(
+    transactions: Iterable[dict[str, Any]] | SupportsByCurrency, currency: str
+) -> Iterator[dict[str, Any]]:
     """
     Фильтрует транзакции по коду валюты операции.
 
-    Принимает список транзакций и код валюты, возвращает итератор,
+    Принимает транзакции и код валюты, возвращает итератор,
     который поочерёдно выдаёт только те транзакции, где валюта операции
     соответствует заданной.
 
     Аргументы:
-        transactions (list[dict]): Список словарей с данными о транзакциях.
-                                   Каждый словарь должен содержать ключ
-                                   'operationAmount' с вложенным 'currency'.
+        transactions (Iterable[dict]): Список или любой итерируемый источник
+                                       словарей с данными о транзакциях,
+                                       например потоковый reader из src.readers.
+                                       Для TransactionIndex ответ берётся из индекса,
+                                       для TransactionStore и MappedTransactionStore — из столбца кодов валют.
+                                       Каждый словарь должен содержать ключ
+                                       'operationAmount' с вложенным 'currency'.
         currency (str): Код валюты для фильтрации, например 'USD' или 'RUB'.
 
     Возвращает:
@@ -30,23 +58,29 @@ def filter_by_currency(transactions: list[dict[str, Any]], currency: str) -> Ite
         >>> for t in usd_transactions:
         ...     print(t['id'])
     """
-    for transaction in transactions:
+    if hasattr(transactions, "by_currency"):
+        # Индекс и хранилище уже знают позиции транзакций по валюте — повторный просмотр не нужен
+        yield from cast(SupportsByCurrency, transactions).by_currency(currency)
+        return
+
+    for transaction in cast(Iterable[dict[str, Any]], transactions):
         transaction_currency = transaction.get("operationAmount", {}).get("currency", {}).get("code", "")
         if transaction_currency == currency:
             yield transaction
 
 
-def transaction_descriptions(transactions: list[dict[str, Any]]) -> Iterator[str]:
+def transaction_descriptions(transactions: Iterable[dict[str, Any]] | SupportsDescriptions) -> Iterator[str]:
     """
     Генератор описаний банковских транзакций.
 
-    Принимает список транзакций и поочерёдно возвращает описание
+    Принимает транзакции и поочерёдно возвращает описание
     каждой операции из поля 'description'.
 
     Аргументы:
-        transactions (list[dict]): Список словарей с данными о транзакциях.
-                                   Каждый словарь должен содержать ключ
-                                   'description'.
+        transactions (Iterable[dict]): Список или любой итерируемый источник
+                                       словарей с данными о транзакциях.
+                                       Каждый словарь должен содержать ключ
+                                       'description'.
 
     Возвращает:
         Iterator[str]: Итератор строк с описаниями операций.
@@ -56,7 +90,11 @@ def transaction_descriptions(transactions: list[dict[str, Any]]) -> Iterator[str
         >>> print(next(descriptions))
         Перевод организации
     """
-    for transaction in transactions:
+    if hasattr(transactions, "iter_descriptions"):
+        yield from cast(SupportsDescriptions, transactions).iter_descriptions()
+        return
+
+    for transaction in cast(Iterable[dict[str, Any]], transactions):
         yield transaction.get("description", "")
 
 
@@ -85,3 +123,138 @@ def card_number_generator(start: int, stop: int) -> Iterator[str]:
         # Дополняем нулями до 16 цифр и разбиваем на блоки по 4
         raw = str(number).zfill(16)
         yield f"{raw[0:4]} {raw[4:8]} {raw[8:12]} {raw[12:16]}"
+
+
+@lru_cache(maxsize=None)
+def _low_blocks() -> list[str]:
+    """Все значения последних четырёх цифр номера: '0000' … '9999'."""
+    return [f"{low:04d}" for low in range(10000)]
+
+
+@lru_cache(maxsize=None)
+def _luhn_low_blocks() -> list[tuple[list[int], list[str]]]:
+    """
+    Последние четыре цифры Luhn-валидных номеров для каждого остатка суммы первых 12 цифр.
+
+    Элемент с индексом r содержит (значения, строки) тех окончаний, при которых
+    номер с суммой Луна первых 12 цифр, равной r по модулю 10, проходит проверку.
+    """
+    table: list[tuple[list[int], list[str]]] = [([], []) for _ in range(10)]
+    for low in range(10000):
+        d13, d14, d15, d16 = low // 1000, low // 100 % 10, low // 10 % 10, low % 10
+        contribution = LUHN_DOUBLED[d13] + d14 + LUHN_DOUBLED[d15] + d16
+        residue = -contribution % 10
+        table[residue][0].append(low)
+        table[residue][1].append(f"{low:04d}")
+    return table
+
+
+def _card_blocks(start: int, stop: int, luhn: bool) -> Iterator[tuple[str, list[str]]]:
+    """
+    Перебирает диапазон блоками номеров с общими первыми 12 цифрами.
+
+    Префикс "XXXX XXXX XXXX " форматируется один раз на блок из 10 000 номеров,
+    а последние четыре цифры берутся из заранее построенной таблицы, поэтому
+    отдельные целые числа не форматируются.
+    """
+    lows = _low_blocks()
+    number = max(start, 0)
+
+    while number <= stop:
+        high, low = divmod(number, 10000)
+        last = min(stop - high * 10000, 9999)
+        raw = f"{high:012d}"
+        prefix = f"{raw[0:4]} {raw[4:8]} {raw[8:12]} "
+
+        if luhn:
+            digits = [int(char) for char in raw]
+            residue = (sum(LUHN_DOUBLED[d] for d in digits[0::2]) + sum(digits[1::2])) % 10
+            values, strings = _luhn_low_blocks()[residue]
+            yield prefix, strings[bisect_left(values, low) : bisect_right(values, last)]
+        else:
+            yield prefix, lows[low : last + 1]
+
+        number = (high + 1) * 10000
+
+
+def card_number_chunks(
+    start: int, stop: int, chunk_size: int = DEFAULT_CHUNK_SIZE, luhn: bool = False
+) -> Iterator[list[str]]:
+    """
+    Генератор номеров банковских карт, выдающий их списками.
+
+    Номера совпадают с card_number_generator(start, stop), но строятся
+    блоками: общий префикс из первых 12 цифр форматируется один раз на
+    10 000 номеров, последние 4 цифры берутся из готовой таблицы.
+
+    Аргументы:
+        start (int): Начальное значение диапазона (включительно).
+        stop (int): Конечное значение диапазона (включительно).
+        chunk_size (int): Количество номеров в одном списке (последний может быть короче).
+        luhn (bool): Выдавать только номера, проходящие проверку по алгоритму Луна.
+
+    Возвращает:
+        Iterator[list[str]]: Итератор списков номеров в формате XXXX XXXX XXXX XXXX.
+
+    Примеры:
+        >>> next(card_number_chunks(1, 5, chunk_size=2))
+        ['0000 0000 0000 0001', '0000 0000 0000 0002']
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер блока должен быть положительным")
+
+    chunk: list[str] = []
+    for prefix, lows in _card_blocks(start, stop, luhn):
+        numbers = [prefix + low for low in lows]
+        offset = 0
+        while offset < len(numbers):
+            need = chunk_size - len(chunk)
+            chunk.extend(numbers[offset : offset + need])
+            offset += need
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def card_number_records(
+    start: int, stop: int, chunk_size: int = DEFAULT_CHUNK_SIZE, luhn: bool = False
+) -> Iterator[bytes]:
+    """
+    Генератор номеров банковских карт в виде байтового буфера.
+
+    Каждый номер занимает запись фиксированной длины CARD_RECORD_SIZE (20 байт):
+    "XXXX XXXX XXXX XXXX\n". Буфер блока собирается одним str.join без
+    создания отдельных строк Python для каждого номера.
+
+    Аргументы:
+        start (int): Начальное значение диапазона (включительно).
+        stop (int): Конечное значение диапазона (включительно).
+        chunk_size (int): Количество записей в одном буфере (последний может быть короче).
+        luhn (bool): Выдавать только номера, проходящие проверку по алгоритму Луна.
+
+    Возвращает:
+        Iterator[bytes]: Итератор буферов длиной chunk_size * 20 байт.
+
+    Примеры:
+        >>> next(card_number_records(1, 2))
+        b'0000 0000 0000 0001\n0000 0000 0000 0002\n'
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер блока должен быть положительным")
+
+    chunk_bytes = chunk_size * CARD_RECORD_SIZE
+    buffer = bytearray()
+    for prefix, lows in _card_blocks(start, stop, luhn):
+        if not lows:
+            continue
+        # prefix + low0 + "\n" + prefix + low1 + ... + "\n" одним join, без строки на каждый номер
+        buffer += (prefix + ("\n" + prefix).join(lows) + "\n").encode("ascii")
+        while len(buffer) >= chunk_bytes:
+            yield bytes(buffer[:chunk_bytes])
+            del buffer[:chunk_bytes]
+
+    if buffer:
+        yield bytes(buffer)
@@ -0,0 +1,239 @@
+"""
+Модуль инкрементальной истории операций, упорядоченной по дате.
+
+Виджет получает новые операции по одной. Вместо sort_by_date по всему
+списку после каждого поступления (O(N log N) на событие) SortedHistory
+хранит операции отсортированными в списке блоков (sorted-chunk list):
+новая операция вставляется в свой блок через bisect за O(log N + размер блока),
+а выборки «последние N» и «за период» начинаются сразу с нужной позиции.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Iterable, Iterator
+
+from src.index import currency_code
+from src.processing import MISSING_TIMESTAMP, date_to_bound
+from src.timestamps import parse_timestamp
+
+# Блок делится пополам, когда в нём становится больше 2 * chunk_size операций
+DEFAULT_CHUNK_SIZE = 1000
+
+_MISSING = object()
+
+
+class SortedHistory:
+    """
+    История операций, упорядоченная по дате, с дешёвой вставкой.
+
+    Порядок совпадает с sort_by_date(список в порядке добавления, reverse, parse_dates):
+    операции с одинаковой датой идут в порядке добавления в обоих направлениях,
+    операции без ключа 'date' считаются самыми старыми.
+
+    Аргументы:
+        operations (Iterable[dict]): Начальный набор операций (сортируется один раз).
+        parse_dates (bool): Сравнивать даты как моменты времени (см. sort_by_date).
+        chunk_size (int): Размер блока; влияет на баланс между вставкой и обходом.
+
+    Примеры:
+        >>> history = SortedHistory(operations)
+        >>> history.add(new_operation)
+        >>> history.latest(10)
+        >>> history.between("2019-01-01", "2019-12-31", state="EXECUTED")
+    """
+
+    def __init__(
+        self,
+        operations: Iterable[dict[str, Any]] = (),
+        parse_dates: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("Размер блока должен быть положительным")
+        self.parse_dates = parse_dates
+        self.chunk_size = chunk_size
+        # Параллельные списки блоков: ключи дат, операции и максимальный ключ каждого блока
+        self._keys: list[list[Any]] = []
+        self._operations: list[list[dict[str, Any]]] = []
+        self._maxes: list[Any] = []
+        self._len = 0
+        self.extend(operations)
+
+    def _key(self, operation: dict[str, Any]) -> Any:
+        if self.parse_dates:
+            date = operation.get("date")
+            return MISSING_TIMESTAMP if date is None else parse_timestamp(date)
+        return operation.get("date", "")
+
+    def _bound(self, date: str | None) -> Any:
+        if date is None or not self.parse_dates:
+            return date
+        return parse_timestamp(date)
+
+    def add(self, operation: dict[str, Any]) -> None:
+        """
+        Добавляет операцию, сохраняя порядок по дате.
+
+        Исключения:
+            ValueError: Если дата некорректна при parse_dates=True.
+        """
+        key = self._key(operation)
+        maxes = self._maxes
+        self._len += 1
+        if not maxes:
+            self._keys.append([key])
+            self._operations.append([operation])
+            maxes.append(key)
+            return
+
+        # Первый блок, максимум которого больше ключа; равные ключи остаются перед новой операцией
+        index = bisect_right(maxes, key)
+        if index == len(maxes):
+            index -= 1
+            keys = self._keys[index]
+            keys.append(key)
+            self._operations[index].append(operation)
+            maxes[index] = key
+        else:
+            keys = self._keys[index]
+            position = bisect_right(keys, key)
+            keys.insert(position, key)
+            self._operations[index].insert(position, operation)
+
+        if len(keys) > 2 * self.chunk_size:
+            self._split(index)
+
+    def _split(self, index: int) -> None:
+        keys, operations = self._keys[index], self._operations[index]
+        half = len(keys) // 2
+        self._keys[index : index + 1] = [keys[:half], keys[half:]]
+        self._operations[index : index + 1] = [operations[:half], operations[half:]]
+        self._maxes[index : index + 1] = [keys[half - 1], keys[-1]]
+
+    def extend(self, operations: Iterable[dict[str, Any]]) -> None:
+        """
+        Добавляет операции в порядке итерации.
+
+        Небольшие пачки вставляются по одной; если новых операций больше, чем уже
+        хранится, блоки перестраиваются одной устойчивой сортировкой.
+        """
+        operations = list(operations)
+        if len(operations) <= self._len:
+            for operation in operations:
+                self.add(operation)
+            return
+
+        # Устойчивая сортировка сохраняет порядок добавления для равных дат
+        key = self._key
+        entries = [(key(operation), operation) for operation in operations]
+        if self._len:
+            entries = [entry for chunk in zip(self._keys, self._operations) for entry in zip(*chunk)] + entries
+        entries.sort(key=itemgetter(0))
+
+        size = self.chunk_size
+        self._keys = [[entry[0] for entry in entries[i : i + size]] for i in range(0, len(entries), size)]
+        self._operations = [[entry[1] for entry in entries[i : i + size]] for i in range(0, len(entries), size)]
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._len = len(entries)
+
+    def _ascending(self, low: Any, high: Any) -> Iterator[dict[str, Any]]:
+        maxes = self._maxes
+        index = 0 if low is None else bisect_left(maxes, low)
+        start = 0 if low is None or index == len(maxes) else bisect_left(self._keys[index], low)
+        for index in range(index, len(maxes)):
+            operations = self._operations[index]
+            if high is not None and maxes[index] > high:
+                yield from operations[start : bisect_right(self._keys[index], high)]
+                return
+            yield from operations[start:] if start else operations
+            start = 0
+
+    def _descending(self, low: Any, high: Any) -> Iterator[dict[str, Any]]:
+        maxes = self._maxes
+        if high is None:
+            index, stop = len(maxes) - 1, None
+        else:
+            index = bisect_right(maxes, high)
+            if index == len(maxes):
+                index, stop = index - 1, None
+            else:
+                stop = bisect_right(self._keys[index], high)
+
+        # Обход с конца; серии равных дат выдаются в порядке добавления, как у устойчивой sort_by_date
+        run: list[dict[str, Any]] = []
+        run_key: Any = _MISSING
+        while index >= 0:
+            keys, operations = self._keys[index], self._operations[index]
+            position = len(keys) if stop is None else stop
+            stop = None
+            while position:
+                position -= 1
+                key = keys[position]
+                if low is not None and key < low:
+                    yield from reversed(run)
+                    return
+                if key != run_key:
+                    yield from reversed(run)
+                    run = []
+                    run_key = key
+                run.append(operations[position])
+            index -= 1
+        yield from reversed(run)
+
+    def iter(
+        self,
+        reverse: bool = True,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        state: str | None = None,
+        currency: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Лениво обходит операции в порядке sort_by_date.
+
+        Аргументы:
+            reverse (bool): True — сначала новые (по умолчанию), False — сначала старые.
+            date_from (str | None): Нижняя граница даты включительно.
+            date_to (str | None): Верхняя граница даты включительно; дата без времени включает весь
+                                  день (см. date_to_bound). Границы сравниваются с датой так же,
+                                  как при сортировке (см. latest_operations).
+            state (str | None): Только операции с этим статусом.
+            currency (str | None): Только операции в этой валюте.
+
+        Обход начинается сразу с границы периода; фильтры по статусу и валюте
+        проверяются по ходу обхода, поэтому latest с фильтром останавливается,
+        как только набрано n операций.
+        """
+        low = self._bound(date_from)
+        high = None if date_to is None else date_to_bound(date_to, self.parse_dates)
+        operations = self._descending(low, high) if reverse else self._ascending(low, high)
+        if state is not None:
+            operations = (operation for operation in operations if operation.get("state") == state)
+        if currency is not None:
+            operations = (operation for operation in operations if currency_code(operation) == currency)
+        return operations
+
+    def latest(self, n: int, reverse: bool = True, **filters: Any) -> list[dict[str, Any]]:
+        """
+        Первые n операций в порядке sort_by_date; по умолчанию — n самых новых.
+
+        Принимает те же фильтры, что и iter (date_from, date_to, state, currency).
+        Без фильтров совпадает с latest_operations(history, n, reverse).
+        """
+        if n <= 0:
+            return []
+        return list(islice(self.iter(reverse, **filters), n))
+
+    def between(
+        self, date_from: str | None, date_to: str | None, reverse: bool = True, **filters: Any
+    ) -> list[dict[str, Any]]:
+        """Операции за период [date_from, date_to] в порядке sort_by_date (фильтры — как у iter)."""
+        return list(self.iter(reverse, date_from, date_to, **filters))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Операции от новых к старым, как sort_by_date(..., reverse=True)."""
+        return self.iter()
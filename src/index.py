@@ -0,0 +1,100 @@
+"""
+Модуль индексов для повторных запросов к набору транзакций.
+
+Содержит класс TransactionIndex, который за один проход строит
+отображения «валюта → позиции», «статус → позиции» и «день → позиции».
+filter_by_currency и filter_by_state, получив индекс вместо списка,
+отвечают за O(k) без повторного просмотра всех транзакций.
+"""
+
+from typing import Any, Iterable, Iterator
+
+
+def currency_code(transaction: dict[str, Any]) -> Any:
+    """Код валюты операции или пустая строка, если он не указан."""
+    return transaction.get("operationAmount", {}).get("currency", {}).get("code", "")
+
+
+class TransactionIndex:
+    """
+    Индекс транзакций по валюте, статусу и (необязательно) дню операции.
+
+    Хранит ссылки на исходные словари и списки их позиций для каждого
+    значения ключа. Поддерживает дозапись новых транзакций через append
+    и extend; итерация возвращает транзакции в порядке добавления.
+
+    Аргументы:
+        transactions (Iterable[dict]): Начальный набор транзакций.
+        by_state (bool): Строить индекс по статусу (по умолчанию True).
+        by_date (bool): Строить индекс по дню операции YYYY-MM-DD.
+
+    Примеры:
+        >>> index = TransactionIndex(transactions)
+        >>> usd = list(filter_by_currency(index, "USD"))
+        >>> executed = filter_by_state(index, "EXECUTED")
+    """
+
+    def __init__(
+        self, transactions: Iterable[dict[str, Any]] = (), by_state: bool = True, by_date: bool = False
+    ) -> None:
+        self._transactions: list[dict[str, Any]] = []
+        self._currencies: dict[Any, list[int]] = {}
+        self._states: dict[Any, list[int]] | None = {} if by_state else None
+        self._dates: dict[str, list[int]] | None = {} if by_date else None
+        self.extend(transactions)
+
+    def append(self, transaction: dict[str, Any]) -> None:
+        """Добавляет транзакцию в конец набора и во все индексы."""
+        position = len(self._transactions)
+        self._transactions.append(transaction)
+
+        self._currencies.setdefault(currency_code(transaction), []).append(position)
+        if self._states is not None:
+            self._states.setdefault(transaction.get("state"), []).append(position)
+        if self._dates is not None:
+            self._dates.setdefault(str(transaction.get("date", ""))[:10], []).append(position)
+
+    def extend(self, transactions: Iterable[dict[str, Any]]) -> None:
+        """Добавляет транзакции в конец набора за один проход."""
+        for transaction in transactions:
+            self.append(transaction)
+
+    def _select(self, positions: list[int] | None) -> list[dict[str, Any]]:
+        if not positions:
+            return []
+        transactions = self._transactions
+        return [transactions[position] for position in positions]
+
+    def by_currency(self, currency: str) -> list[dict[str, Any]]:
+        """Транзакции в указанной валюте в порядке добавления."""
+        return self._select(self._currencies.get(currency))
+
+    def by_state(self, state: str) -> list[dict[str, Any]]:
+        """
+        Транзакции с указанным статусом в порядке добавления.
+
+        Если индекс построен с by_state=False, транзакции просматриваются целиком.
+        """
+        if self._states is None:
+            return [transaction for transaction in self._transactions if transaction.get("state") == state]
+        return self._select(self._states.get(state))
+
+    def by_date(self, day: str) -> list[dict[str, Any]]:
+        """
+        Транзакции за указанный день (YYYY-MM-DD) в порядке добавления.
+
+        Если индекс построен с by_date=False, транзакции просматриваются целиком.
+        """
+        if self._dates is None:
+            return [t for t in self._transactions if str(t.get("date", ""))[:10] == day]
+        return self._select(self._dates.get(day))
+
+    def currencies(self) -> dict[Any, int]:
+        """Количество транзакций по каждому коду валюты."""
+        return {currency: len(positions) for currency, positions in self._currencies.items()}
+
+    def __len__(self) -> int:
+        return len(self._transactions)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self._transactions)
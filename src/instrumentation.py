@@ -0,0 +1,320 @@
+"""
+Модуль необязательного сбора метрик публичных функций.
+
+enable_instrumentation заменяет публичные функции модулей src.masks,
+src.widget, src.processing и src.generators обёртками, которые считают
+вызовы, суммарное время и перцентили задержки, а также ошибки по причинам.
+Обёртки подставляются и в другие модули src, импортировавшие эти функции.
+disable_instrumentation возвращает исходные функции, поэтому в выключенном
+состоянии накладных расходов нет.
+
+Метрики хранятся в памяти процесса и передаются в подключаемый приёмник
+(InMemorySink, LoggingSink, PrometheusFileSink) вызовом flush_metrics.
+"""
+
+import functools
+import importlib
+import inspect
+import logging
+import os
+import sys
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Protocol
+
+INSTRUMENTED_MODULES = ("src.masks", "src.widget", "src.processing", "src.generators")
+
+# Число последних замеров, по которым считаются перцентили
+LATENCY_WINDOW = 10000
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Сообщения с постоянным текстом, которые инструментируемые функции выбрасывают
+# помимо src.masks.MASK_ERRORS и src.widget.WIDGET_ERRORS
+_FIXED_REASONS = (
+    "Размер кэша должен быть положительным",
+    "Размер блока должен быть положительным",
+    "Неизвестная политика обработки ошибок",
+    "Некорректная сумма",
+)
+
+
+@dataclass
+class FunctionMetrics:
+    """
+    Метрики одной функции.
+
+    Для генераторов вызовом считается полный проход (или досрочное закрытие),
+    а временем — суммарное время внутри генератора без учёта потребителя.
+    """
+
+    calls: int = 0
+    total_seconds: float = 0.0
+    errors: Counter[str] = field(default_factory=Counter)
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def record(self, seconds: float, error: BaseException | None = None) -> None:
+        """Учитывает один вызов."""
+        self.calls += 1
+        self.total_seconds += seconds
+        self.latencies.append(seconds)
+        if error is not None:
+            self.errors[error_reason(error)] += 1
+
+    def quantiles(self) -> dict[float, float]:
+        """Перцентили задержки (в секундах) по последним LATENCY_WINDOW вызовам."""
+        if not self.latencies:
+            return {}
+        ordered = sorted(self.latencies)
+        return {q: ordered[min(int(q * len(ordered)), len(ordered) - 1)] for q in QUANTILES}
+
+
+@functools.lru_cache(maxsize=None)
+def _known_reasons() -> tuple[str, ...]:
+    """Закрытый набор причин ошибок для меток метрик."""
+    from src.masks import MASK_ERRORS
+    from src.widget import WIDGET_ERRORS
+
+    return tuple(reason for _, reason in MASK_ERRORS + WIDGET_ERRORS) + _FIXED_REASONS
+
+
+def error_reason(error: BaseException) -> str:
+    """
+    Причина ошибки для метрик: тип исключения и известная причина из закрытого набора.
+
+    Причина добавляется, только если сообщение начинается с одной из известных
+    (MASK_ERRORS, WIDGET_ERRORS и сообщения с постоянным текстом), а входное значение
+    после неё отбрасывается. Для остальных сообщений метка — только тип исключения,
+    поэтому данные пользователя в метки не попадают, а число меток ограничено.
+
+    Пример:
+        >>> error_reason(ValueError("Некорректный формат даты: 2024-13-01"))
+        'ValueError: Некорректный формат даты'
+    """
+    message = str(error)
+    for reason in _known_reasons():
+        if message.startswith(reason) and message[len(reason) : len(reason) + 1] in ("", " ", ":"):
+            return f"{type(error).__name__}: {reason}"
+    return type(error).__name__
+
+
+class MetricsSink(Protocol):
+    """Приёмник метрик: получает снимок {имя функции: FunctionMetrics}."""
+
+    def write(self, metrics: dict[str, FunctionMetrics]) -> None:
+        """Сохраняет или отправляет снимок метрик."""
+
+
+class InMemorySink:
+    """Сохраняет снимки метрик в списке snapshots (для тестов и отладки)."""
+
+    def __init__(self) -> None:
+        self.snapshots: list[dict[str, dict[str, Any]]] = []
+
+    def write(self, metrics: dict[str, FunctionMetrics]) -> None:
+        self.snapshots.append(
+            {
+                name: {
+                    "calls": m.calls,
+                    "total_seconds": m.total_seconds,
+                    "errors": dict(m.errors),
+                    "quantiles": m.quantiles(),
+                }
+                for name, m in metrics.items()
+            }
+        )
+
+
+class LoggingSink:
+    """Пишет по одной строке на функцию в указанный логгер."""
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO) -> None:
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def write(self, metrics: dict[str, FunctionMetrics]) -> None:
+        for name, m in metrics.items():
+            quantiles = " ".join(f"p{int(q * 100)}={seconds * 1e6:.1f}мкс" for q, seconds in m.quantiles().items())
+            self.logger.log(
+                self.level,
+                "%s calls=%d total=%.6fs errors=%d %s",
+                name,
+                m.calls,
+                m.total_seconds,
+                sum(m.errors.values()),
+                quantiles,
+            )
+
+
+class PrometheusFileSink:
+    """
+    Записывает метрики в файл в текстовом формате Prometheus.
+
+    Файл перезаписывается целиком через временный файл и os.replace,
+    поэтому node_exporter (textfile collector) не видит его частично записанным.
+    """
+
+    def __init__(self, path: str | Path, prefix: str = "bank_widget") -> None:
+        self.path = Path(path)
+        self.prefix = prefix
+
+    def write(self, metrics: dict[str, FunctionMetrics]) -> None:
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(format_prometheus(metrics, self.prefix))
+        os.replace(tmp_path, self.path)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_prometheus(metrics: dict[str, FunctionMetrics], prefix: str = "bank_widget") -> str:
+    """Снимок метрик в текстовом формате Prometheus (calls, errors, summary задержки)."""
+    calls = [f"# HELP {prefix}_calls_total Количество вызовов функции.", f"# TYPE {prefix}_calls_total counter"]
+    errors = [f"# HELP {prefix}_errors_total Ошибки функции по причинам.", f"# TYPE {prefix}_errors_total counter"]
+    latency = [
+        f"# HELP {prefix}_latency_seconds Задержка вызова функции.",
+        f"# TYPE {prefix}_latency_seconds summary",
+    ]
+
+    for name, m in sorted(metrics.items()):
+        function = f'function="{_label(name)}"'
+        calls.append(f"{prefix}_calls_total{{{function}}} {m.calls}")
+        for reason, count in sorted(m.errors.items()):
+            errors.append(f'{prefix}_errors_total{{{function},reason="{_label(reason)}"}} {count}')
+        for q, seconds in m.quantiles().items():
+            latency.append(f'{prefix}_latency_seconds{{{function},quantile="{q}"}} {seconds:.9f}')
+        latency.append(f"{prefix}_latency_seconds_sum{{{function}}} {m.total_seconds:.9f}")
+        latency.append(f"{prefix}_latency_seconds_count{{{function}}} {m.calls}")
+
+    return "\n".join(calls + errors + latency) + "\n"
+
+
+_metrics: dict[str, FunctionMetrics] = {}
+_sink: MetricsSink | None = None
+# Обёртка → исходная функция для всех установленных обёрток
+_originals: dict[Callable[..., Any], Callable[..., Any]] = {}
+
+
+def _wrap_function(func: Callable[..., Any], metrics: FunctionMetrics) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            metrics.record(time.perf_counter() - start, e)
+            raise
+        metrics.record(time.perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+def _wrap_generator(func: Callable[..., Iterator[Any]], metrics: FunctionMetrics) -> Callable[..., Iterator[Any]]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+        elapsed = 0.0
+        error: Exception | None = None
+        iterator = func(*args, **kwargs)
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    elapsed += time.perf_counter() - start
+                    return
+                except Exception as e:
+                    elapsed += time.perf_counter() - start
+                    error = e
+                    raise
+                elapsed += time.perf_counter() - start
+                yield item
+        finally:
+            metrics.record(elapsed, error)
+
+    return wrapper
+
+
+def _src_modules() -> list[Any]:
+    return [module for name, module in list(sys.modules.items()) if name == "src" or name.startswith("src.")]
+
+
+def enable_instrumentation(sink: MetricsSink | None = None, modules: Iterable[str] = INSTRUMENTED_MODULES) -> None:
+    """
+    Включает сбор метрик для публичных функций указанных модулей.
+
+    Повторный вызов сначала снимает ранее установленные обёртки.
+    Накопленные метрики сохраняются до reset_metrics.
+
+    Аргументы:
+        sink (MetricsSink | None): Приёмник для flush_metrics.
+        modules (Iterable[str]): Имена модулей, функции которых оборачиваются.
+
+    Пример:
+        >>> enable_instrumentation(PrometheusFileSink("/var/lib/node_exporter/widget.prom"))
+        >>> mask_operations(operations)
+        >>> flush_metrics()
+    """
+    global _sink
+    disable_instrumentation()
+    _sink = sink
+
+    wrappers: dict[Callable[..., Any], Callable[..., Any]] = {}
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            if name.startswith("_") or func.__module__ != module_name:
+                continue
+            metrics = _metrics.setdefault(f"{module_name}.{name}", FunctionMetrics())
+            wrap = _wrap_generator if inspect.isgeneratorfunction(func) else _wrap_function
+            wrappers[func] = wrap(func, metrics)
+
+    # Подменяем функцию везде, куда она импортирована по имени (src.query, src.pipeline и т. д.)
+    for module in _src_modules():
+        for name, value in list(vars(module).items()):
+            if inspect.isfunction(value) and value in wrappers:
+                setattr(module, name, wrappers[value])
+
+    _originals.update({wrapper: func for func, wrapper in wrappers.items()})
+
+
+def disable_instrumentation() -> None:
+    """Возвращает исходные функции во всех модулях src. Метрики сохраняются."""
+    if not _originals:
+        return
+    for module in _src_modules():
+        for name, value in list(vars(module).items()):
+            if inspect.isfunction(value) and value in _originals:
+                setattr(module, name, _originals[value])
+    _originals.clear()
+
+
+def is_instrumentation_enabled() -> bool:
+    """Установлены ли обёртки сбора метрик."""
+    return bool(_originals)
+
+
+def get_metrics() -> dict[str, FunctionMetrics]:
+    """Метрики функций, у которых был хотя бы один вызов."""
+    return {name: m for name, m in _metrics.items() if m.calls}
+
+
+def reset_metrics() -> None:
+    """Обнуляет накопленные метрики, не снимая обёрток."""
+    for m in _metrics.values():
+        m.calls = 0
+        m.total_seconds = 0.0
+        m.errors.clear()
+        m.latencies.clear()
+
+
+def flush_metrics() -> dict[str, FunctionMetrics]:
+    """Передаёт текущие метрики в приёмник (если он задан) и возвращает их."""
+    metrics = get_metrics()
+    if _sink is not None:
+        _sink.write(metrics)
+    return metrics
@@ -5,24 +5,152 @@
 и счетов, скрывая часть цифр для защиты конфиденциальной информации.
 """
 
+from collections import OrderedDict
+from enum import IntEnum
+from time import monotonic
+from typing import Any, Callable, Iterable, Literal, NamedTuple
 
-def get_mask_card_number(card_number: str) -> str:
+ErrorPolicy = Literal["raise", "skip", "placeholder"]
+
+
+class MaskStatus(IntEnum):
+    """Код результата функций try_*: 0 — успех, остальные — вид ошибки."""
+
+    OK = 0
+    EMPTY = 1
+    INVALID_LENGTH = 2
+    INVALID_CHARS = 3
+    INVALID_FORMAT = 4
+    INVALID_DATE = 5
+    INVALID = 6
+
+
+# Результат функций try_*: (MaskStatus.OK, результат) или (код ошибки, причина —
+# текст ValueError соответствующей функции без входного значения).
+# Обычный кортеж, а не NamedTuple: его создание заметно дешевле на горячем пути
+MaskResult = tuple[MaskStatus, str]
+
+_OK = MaskStatus.OK
+_CARD_EMPTY: MaskResult = (MaskStatus.EMPTY, "Номер карты отсутствует или пуст")
+_CARD_LENGTH: MaskResult = (MaskStatus.INVALID_LENGTH, "Номер карты должен содержать 16 цифр")
+_CARD_CHARS: MaskResult = (MaskStatus.INVALID_CHARS, "Номер карты должен содержать только цифры")
+_ACCOUNT_EMPTY: MaskResult = (MaskStatus.EMPTY, "Номер счета отсутствует или пуст")
+_ACCOUNT_LENGTH: MaskResult = (MaskStatus.INVALID_LENGTH, "Номер счета должен содержать минимум 4 цифры")
+_ACCOUNT_CHARS: MaskResult = (MaskStatus.INVALID_CHARS, "Номер счета должен содержать только цифры")
+
+# Все ошибки маскирования номеров; их причины входят в закрытый набор меток src.instrumentation
+MASK_ERRORS: tuple[MaskResult, ...] = (
+    _CARD_EMPTY,
+    _CARD_LENGTH,
+    _CARD_CHARS,
+    _ACCOUNT_EMPTY,
+    _ACCOUNT_LENGTH,
+    _ACCOUNT_CHARS,
+)
+
+
+# Время жизни записей MaskCache по умолчанию, секунды
+MASK_CACHE_MAX_AGE = 60.0
+
+# Сумма цифр удвоенной цифры по алгоритму Луна: 0→0, 1→2, …, 5→1 (10 → 1 + 0), …, 9→9
+LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+class MaskCacheInfo(NamedTuple):
+    """Статистика кэша маскирования."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class MaskCache:
     """
-    Маскирует номер банковской карты, оставляя видимыми первые 6 и последние 4 цифры.
+    Ограниченный кратковременный LRU-кэш результатов маскирования.
 
-    Функция принимает номер карты в виде строки цифр и возвращает замаскированный номер
-    в формате: XXXX XX** **** XXXX, где X - видимые цифры, * - скрытые цифры.
+    Ключ — исходная строка, значение — уже замаскированная строка. Чтобы
+    исходные номера не хранились дольше нужного, число записей ограничено
+    maxsize, а записи старше max_age секунд удаляются целиком при первом
+    промахе после этого срока (проверка времени только на промахе
+    не замедляет попадания). Ошибки маскирования не кэшируются.
 
     Аргументы:
-        card_number (str): Номер банковской карты (16 цифр без пробелов).
-                           Пример: "7000792289606361"
+        maxsize (int): Максимальное число записей; при переполнении
+                       вытесняется давно не использованная запись.
+        max_age (float): Время жизни записей в секундах.
 
-    Возвращает:
-        str: Замаскированный номер карты в формате "XXXX XX** **** XXXX".
-             Пример: "7000 79** **** 6361"
+    Пример:
+        >>> cache = MaskCache(maxsize=10000)
+        >>> cache.get("7000792289606361", get_mask_card_number)
+        '7000 79** **** 6361'
+    """
+
+    def __init__(self, maxsize: int, max_age: float = MASK_CACHE_MAX_AGE) -> None:
+        if maxsize <= 0:
+            raise ValueError("Размер кэша должен быть положительным")
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._expires = monotonic() + max_age
+
+    def get(self, value: str, mask: Callable[[str], str]) -> str:
+        """Возвращает замаскированное значение из кэша или вычисляет его через mask."""
+        entries = self._entries
+        masked = entries.get(value)
+        if masked is not None:
+            self.hits += 1
+            entries.move_to_end(value)
+            return masked
+
+        self.misses += 1
+        now = monotonic()
+        if now >= self._expires:
+            self.evictions += len(entries)
+            entries.clear()
+            self._expires = now + self.max_age
+
+        masked = entries[value] = mask(value)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return masked
+
+    def clear(self) -> None:
+        """Удаляет все записи и обнуляет счётчики."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+        self._expires = monotonic() + self.max_age
+
+    def info(self) -> MaskCacheInfo:
+        """Возвращает счётчики попаданий, промахов и вытеснений и текущий размер."""
+        return MaskCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+
+def is_luhn_valid(number: str) -> bool:
+    """
+    Проверяет контрольную цифру номера по алгоритму Луна.
 
     Пример:
-        >>> get_mask_card_number("7000792289606361")
+        >>> is_luhn_valid("4000000000000002")
+        True
+    """
+    total = sum(LUHN_DOUBLED[int(digit)] for digit in number[-2::-2])
+    total += sum(int(digit) for digit in number[::-2])
+    return total % 10 == 0
+
+
+def _clean_card_number(card_number: Any) -> str:
+    """
+    Приводит номер карты к строке без пробелов и проверяет его корректность.
+
+    Общая проверка для get_mask_card_number и mask_card_numbers.
+    Выбрасывает ValueError, если номер пуст, не состоит из 16 цифр
+    или содержит посторонние символы.
     """
     str_cart_number = str(card_number)
     clean_number = str_cart_number.replace(" ", "")
@@ -36,6 +164,29 @@ def get_mask_card_number(card_number: str) -> str:
     if not clean_number.isdigit():
         raise ValueError("Номер карты должен содержать только цифры")
 
+    return clean_number
+
+
+def get_mask_card_number(card_number: str) -> str:
+    """
+    Маскирует номер банковской карты, оставляя видимыми первые 6 и последние 4 цифры.
+
+    Функция принимает номер карты в виде строки цифр и возвращает замаскированный номер
+    в формате: XXXX XX** **** XXXX, где X - видимые цифры, * - скрытые цифры.
+
+    Аргументы:
+        card_number (str): Номер банковской карты (16 цифр без пробелов).
+                           Пример: "7000792289606361"
+
+    Возвращает:
+        str: Замаскированный номер карты в формате "XXXX XX** **** XXXX".
+             Пример: "7000 79** **** 6361"
+
+    Пример:
+        >>> get_mask_card_number("7000792289606361")
+    """
+    clean_number = _clean_card_number(card_number)
+
     first_block = clean_number[:4]  # Первые 4 цифры: "7000"
     second_partial = clean_number[4:6]  # Следующие 2 цифры: "79"
     last_block = clean_number[-4:]  # Последние 4 цифры: "6361"
@@ -82,3 +233,103 @@ def get_mask_account(account_number: str) -> str:
     last_four = clean_number[-4:]
 
     return f"**{last_four}"
+
+
+def try_get_mask_card_number(card_number: Any) -> MaskResult:
+    """
+    Вариант get_mask_card_number без исключений для потоков с некорректными строками.
+
+    Проверки и результат совпадают с get_mask_card_number, но вместо ValueError
+    возвращается код ошибки и причина, поэтому вызывающему коду не нужен
+    try/except вокруг каждой строки.
+
+    Возвращает:
+        tuple[MaskStatus, str]: (MaskStatus.OK, замаскированный номер) или (код ошибки, причина).
+
+    Примеры:
+        >>> try_get_mask_card_number("7000792289606361")
+        (<MaskStatus.OK: 0>, '7000 79** **** 6361')
+        >>> try_get_mask_card_number("123")
+        (<MaskStatus.INVALID_LENGTH: 2>, 'Номер карты должен содержать 16 цифр')
+    """
+    # Быстрый путь, как в mask_card_numbers: строка уже содержит ровно 16 цифр без пробелов
+    if type(card_number) is not str or len(card_number) != 16 or not card_number.isdigit():
+        card_number = str(card_number).replace(" ", "")
+        if not card_number:
+            return _CARD_EMPTY
+        if len(card_number) != 16:
+            return _CARD_LENGTH
+        if not card_number.isdigit():
+            return _CARD_CHARS
+    return _OK, f"{card_number[:4]} {card_number[4:6]}** **** {card_number[12:]}"
+
+
+def try_get_mask_account(account_number: Any) -> MaskResult:
+    """
+    Вариант get_mask_account без исключений (см. try_get_mask_card_number).
+
+    Пример:
+        >>> try_get_mask_account("73654108430135874305")
+        (<MaskStatus.OK: 0>, '**4305')
+    """
+    clean_number = str(account_number).replace(" ", "")
+    if not clean_number:
+        return _ACCOUNT_EMPTY
+    if len(clean_number) < 4:
+        return _ACCOUNT_LENGTH
+    if not clean_number.isdigit():
+        return _ACCOUNT_CHARS
+    return _OK, f"**{clean_number[-4:]}"
+
+
+def mask_card_numbers(
+    card_numbers: Iterable[Any],
+    errors: ErrorPolicy = "raise",
+    placeholder: str = "",
+) -> list[str]:
+    """
+    Маскирует набор номеров банковских карт за один вызов.
+
+    Результат для каждого номера совпадает с get_mask_card_number.
+    Уже очищенные номера (строка из 16 цифр) маскируются по быстрому пути
+    без повторного приведения к строке и удаления пробелов, остальные
+    проходят полную проверку _clean_card_number.
+
+    Аргументы:
+        card_numbers (Iterable): Номера карт в любом итерируемом контейнере.
+        errors (str): Политика обработки некорректных номеров:
+                      - 'raise': выбросить ValueError (по умолчанию)
+                      - 'skip': пропустить номер
+                      - 'placeholder': подставить значение placeholder
+        placeholder (str): Значение для некорректных номеров при errors='placeholder'.
+
+    Возвращает:
+        list[str]: Список замаскированных номеров в порядке входных данных.
+
+    Пример:
+        >>> mask_card_numbers(["7000792289606361", "bad"], errors="placeholder", placeholder="-")
+        ['7000 79** **** 6361', '-']
+    """
+    if errors not in ("raise", "skip", "placeholder"):
+        raise ValueError(f"Неизвестная политика обработки ошибок: {errors}")
+
+    result: list[str] = []
+    append = result.append
+
+    for card_number in card_numbers:
+        # Быстрый путь: строка уже содержит ровно 16 цифр без пробелов
+        if type(card_number) is str and len(card_number) == 16 and card_number.isdigit():
+            clean_number = card_number
+        else:
+            try:
+                clean_number = _clean_card_number(card_number)
+            except ValueError:
+                if errors == "raise":
+                    raise
+                if errors == "placeholder":
+                    append(placeholder)
+                continue
+
+        append(clean_number[:4] + " " + clean_number[4:6] + "** **** " + clean_number[12:])
+
+    return result
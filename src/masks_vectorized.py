@@ -0,0 +1,187 @@
+"""
+Модуль векторизованного маскирования номеров карт и счетов.
+
+Работает с колоночными данными фиксированной ширины: массивами NumPy
+типа S16/S20 или байтовыми буферами, где номера записаны подряд.
+Проверка цифр и подстановка '*' выполняются над всем массивом сразу,
+без цикла Python. Если NumPy 2.x не установлен (extra "fast":
+pip install ".[fast]"), используются обычные функции из src.masks.
+
+Результат побайтно совпадает с get_mask_card_number и get_mask_account.
+"""
+
+from typing import Any, Callable, Iterable
+
+from src.masks import get_mask_account, get_mask_card_number, mask_card_numbers
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None  # type: ignore[assignment]
+else:
+    # Быстрый путь рассчитан на NumPy 2.x (extra "fast" в pyproject.toml), со старыми версиями он выключен
+    if int(np.__version__.split(".")[0]) < 2:  # pragma: no cover - зависит от окружения
+        np = None  # type: ignore[assignment]
+
+CARD_WIDTH = 16
+ACCOUNT_WIDTH = 20
+
+
+def _split_buffer(buffer: bytes | bytearray | memoryview, width: int) -> list[str]:
+    """
+    Разбивает байтовый буфер на записи фиксированной ширины.
+
+    Хвостовые нулевые байты отбрасываются так же, как это делает NumPy
+    для типа S<width>. Неполная последняя запись считается ошибкой.
+    """
+    data = bytes(buffer)
+    if len(data) % width:
+        raise ValueError(f"Размер буфера должен быть кратен {width} байтам")
+
+    return [
+        data[offset : offset + width].rstrip(b"\x00").decode("ascii", errors="replace")
+        for offset in range(0, len(data), width)
+    ]
+
+
+def _iter_values(numbers: Iterable[Any]) -> Iterable[Any]:
+    """Декодирует байтовые строки в str, остальные значения возвращает как есть."""
+    for number in numbers:
+        if isinstance(number, bytes):
+            yield number.decode("ascii", errors="replace")
+        else:
+            yield number
+
+
+def _as_rows(numbers: Any, width: int) -> tuple[Any, Any]:
+    """
+    Приводит входные данные к массиву NumPy с байтовыми строками.
+
+    Буферы интерпретируются как записи шириной width байт,
+    остальные данные передаются в np.asarray как есть.
+
+    Возвращает байтовый массив для быстрого пути и массив исходных значений
+    для _fallback. Не-ASCII символы при кодировании заменяются на '?', поэтому
+    такие строки не проходят проверку цифр, а get_mask_* получает их без
+    замены (например, арабско-индийские цифры маскируются, как в src.masks).
+    """
+    if isinstance(numbers, (bytes, bytearray, memoryview)):
+        if len(numbers) % width:
+            raise ValueError(f"Размер буфера должен быть кратен {width} байтам")
+        array = np.frombuffer(numbers, dtype=f"S{width}")
+        return array, array
+
+    array = np.asarray(numbers).ravel()
+    if array.dtype.kind == "U":
+        return np.char.encode(array, "ascii", errors="replace"), array
+    return array, array
+
+
+def _digit_rows(array: Any, width: int) -> tuple[Any, Any]:
+    """
+    Возвращает матрицу байтов (N, width) и маску строк, состоящих только из цифр.
+
+    Для массивов другой ширины все строки помечаются как требующие
+    обычной проверки.
+    """
+    if array.dtype.kind != "S" or array.dtype.itemsize != width:
+        return None, np.zeros(len(array), dtype=bool)
+
+    digits = np.ascontiguousarray(array).view(np.uint8).reshape(-1, width)
+    valid = ((digits >= ord("0")) & (digits <= ord("9"))).all(axis=1)
+    return digits, valid
+
+
+def _merge(masked: list[str], valid: Any, values: list[str]) -> list[str]:
+    """Размещает результаты быстрого пути на позициях валидных строк."""
+    if len(values) == len(masked):
+        return values
+
+    for index, value in zip(np.flatnonzero(valid).tolist(), values):
+        masked[index] = value
+    return masked
+
+
+def _fallback(masked: list[str], source: Any, valid: Any, mask_one: Callable[[str], str]) -> list[str]:
+    """
+    Обрабатывает строки, не прошедшие быстрый путь, обычной функцией маскирования.
+
+    Такие строки могут содержать пробелы, не-ASCII символы или иметь другую
+    длину, поэтому итоговое решение (результат или ValueError) принимает
+    mask_one. Значения берутся из исходного массива source (см. _as_rows).
+    """
+    for index in np.flatnonzero(~valid).tolist():
+        value = source[index]
+        if isinstance(value, bytes):
+            value = value.decode("ascii", errors="replace")
+        masked[index] = mask_one(value)
+    return masked
+
+
+def mask_card_numbers_array(numbers: Any) -> list[str]:
+    """
+    Маскирует массив номеров банковских карт.
+
+    Аргументы:
+        numbers: Массив NumPy типа S16, байтовый буфер из записей
+                 по 16 байт или любой итерируемый набор строк.
+
+    Возвращает:
+        list[str]: Замаскированные номера в формате "XXXX XX** **** XXXX".
+
+    Пример:
+        >>> mask_card_numbers_array(b"70007922896063611234567812345678")
+        ['7000 79** **** 6361', '1234 56** **** 5678']
+    """
+    if np is None:
+        if isinstance(numbers, (bytes, bytearray, memoryview)):
+            numbers = _split_buffer(numbers, CARD_WIDTH)
+        return mask_card_numbers(_iter_values(numbers))
+
+    array, source = _as_rows(numbers, CARD_WIDTH)
+    digits, valid = _digit_rows(array, CARD_WIDTH)
+    masked = [""] * len(array)
+
+    if digits is not None and valid.any():
+        rows = digits[valid]
+        out = np.full((len(rows), 19), ord("*"), dtype=np.uint8)
+        out[:, 0:4] = rows[:, 0:4]
+        out[:, 5:7] = rows[:, 4:6]
+        out[:, 15:19] = rows[:, 12:16]
+        out[:, [4, 9, 14]] = ord(" ")
+        masked = _merge(masked, valid, out.view("S19").ravel().astype("U19").tolist())
+
+    return _fallback(masked, source, valid, get_mask_card_number)
+
+
+def mask_accounts_array(numbers: Any) -> list[str]:
+    """
+    Маскирует массив номеров банковских счетов.
+
+    Аргументы:
+        numbers: Массив NumPy типа S20, байтовый буфер из записей
+                 по 20 байт или любой итерируемый набор строк.
+
+    Возвращает:
+        list[str]: Замаскированные номера в формате "**XXXX".
+
+    Пример:
+        >>> mask_accounts_array(b"73654108430135874305")
+        ['**4305']
+    """
+    if np is None:
+        if isinstance(numbers, (bytes, bytearray, memoryview)):
+            numbers = _split_buffer(numbers, ACCOUNT_WIDTH)
+        return [get_mask_account(number) for number in _iter_values(numbers)]
+
+    array, source = _as_rows(numbers, ACCOUNT_WIDTH)
+    digits, valid = _digit_rows(array, ACCOUNT_WIDTH)
+    masked = [""] * len(array)
+
+    if digits is not None and valid.any():
+        rows = digits[valid]
+        out = np.full((len(rows), 6), ord("*"), dtype=np.uint8)
+        out[:, 2:6] = rows[:, -4:]
+        masked = _merge(masked, valid, out.view("S6").ravel().astype("U6").tolist())
+
+    return _fallback(masked, source, valid, get_mask_account)
@@ -0,0 +1,119 @@
+"""
+Модуль параллельного маскирования больших выгрузок транзакций.
+
+Входной поток транзакций делится на блоки, которые обрабатываются
+в пуле процессов (ProcessPoolExecutor). В каждой транзакции поля
+'from' и 'to' маскируются через mask_account_card, а 'date'
+форматируется через get_date. Результаты выдаются в исходном порядке.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from src.widget import get_date, mask_operation
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def _mask_chunk(chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Маскирует блок транзакций. Выполняется в процессе-обработчике."""
+    result = []
+    for transaction in chunk:
+        masked = mask_operation(transaction)
+        if "date" in masked:
+            masked["date"] = get_date(masked["date"])
+        result.append(masked)
+    return result
+
+
+def _chunks(transactions: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(transactions)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def mask_transactions_parallel(
+    transactions: Iterable[dict[str, Any]],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """
+    Маскирует поток транзакций в нескольких процессах.
+
+    Источник читается лениво: в обработке одновременно находится не более
+    2 * workers блоков, поэтому поток может быть больше доступной памяти.
+
+    Аргументы:
+        transactions (Iterable[dict]): Транзакции, список или любой итератор.
+        workers (int | None): Число процессов. None — по числу ядер,
+                              1 — обработка в текущем процессе без пула.
+        chunk_size (int): Количество транзакций в одном блоке.
+
+    Возвращает:
+        Iterator[dict]: Копии транзакций с замаскированными 'from'/'to'
+                        и датой в формате ДД.ММ.ГГГГ, в исходном порядке.
+
+    Исключения:
+        ValueError: Если данные транзакции некорректны (как в mask_account_card и get_date).
+
+    Примеры:
+        >>> for transaction in mask_transactions_parallel(read_ndjson("operations.ndjson"), workers=4):
+        ...     print(transaction["from"])
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер блока должен быть положительным")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in _chunks(transactions, chunk_size):
+            yield from _mask_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        max_pending = 2 * workers
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+
+        try:
+            for chunk in _chunks(transactions, chunk_size):
+                pending.append(executor.submit(_mask_chunk, chunk))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # При ошибке или досрочной остановке не обрабатываем оставшиеся блоки
+            for future in pending:
+                future.cancel()
+
+
+def export_masked(
+    transactions: Iterable[dict[str, Any]],
+    path: str | Path,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Записывает замаскированные транзакции в NDJSON-файл в исходном порядке.
+
+    Аргументы:
+        transactions (Iterable[dict]): Транзакции, список или любой итератор.
+        path (str | Path): Путь к выходному файлу.
+        workers (int | None): Число процессов (см. mask_transactions_parallel).
+        chunk_size (int): Количество транзакций в одном блоке.
+
+    Возвращает:
+        int: Количество записанных транзакций.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as file:
+        for transaction in mask_transactions_parallel(transactions, workers, chunk_size):
+            file.write(json.dumps(transaction, ensure_ascii=False))
+            file.write("\n")
+            count += 1
+    return count
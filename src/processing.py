@@ -3,18 +3,56 @@
 Содержит функции для фильтрации операций по статусу и сортировки по дате.
 """
 
-from typing import Any
+import heapq
+from collections import Counter
+from typing import Any, Iterable, Iterator, Protocol, cast
 
+# Ключ для операций без даты: меньше любой допустимой временной метки
+MISSING_TIMESTAMP = -(1 << 63)
 
-def filter_by_state(data: list[dict[str, Any]], state: str = "EXECUTED") -> list[dict[str, Any]]:
+_DAY_MICROSECONDS = 86400 * 1_000_000
+
+
+class SupportsByState(Protocol):
+    """Источник, который сам отвечает на запрос по статусу (TransactionIndex, TransactionStore)."""
+
+    def by_state(self, state: str) -> list[dict[str, Any]]:
+        """Операции с указанным статусом в исходном порядке."""
+
+
+class SupportsSortedByDate(Protocol):
+    """Источник, который сам упорядочивает операции по дате (TransactionStore, MappedTransactionStore)."""
+
+    def sorted_by_date(self, reverse: bool = True) -> list[dict[str, Any]]:
+        """Операции в порядке sort_by_date."""
+
+
+class StatePartition(dict[Any, list[dict[str, Any]]]):
+    """
+    Результат partition_by_state: статус → операции в исходном порядке.
+
+    Обычный словарь с методом by_state, поэтому filter_by_state берёт ответ
+    из готовой группы. Произвольный словарь (например, одна операция)
+    за результат разбиения не принимается.
+    """
+
+    def by_state(self, state: str) -> list[dict[str, Any]]:
+        """Копия группы операций с указанным статусом (пустой список, если статуса нет)."""
+        return list(self.get(state, ()))
+
+
+def filter_by_state(data: list[dict[str, Any]] | SupportsByState, state: str = "EXECUTED") -> list[dict[str, Any]]:
     """
     Фильтрует список операций по статусу.
 
     Аргументы:
         data (list[dict[str, Any]]): Список словарей с данными о банковских операциях.
                                      Каждый словарь должен содержать ключи: 'id', 'state', 'date'.
+                                     Для TransactionIndex ответ берётся из индекса статусов,
+                                     для TransactionStore и MappedTransactionStore — из столбца кодов статусов,
+                                     для результата partition_by_state — из готовой группы.
         state (str): Значение статуса для фильтрации. По умолчанию 'EXECUTED'.
-                     Возможные значения: 'EXECUTED', 'CANCELED'.
+                     Допустим любой статус: 'EXECUTED', 'CANCELED', 'PENDING' и т. д.
 
     Возвращает:
         list[dict[str, Any]]: Новый список словарей, содержащий только операции
@@ -34,6 +72,10 @@ def filter_by_state(data: list[dict[str, Any]], state: str = "EXECUTED") -> list
         >>> filter_by_state(operations, state='CANCELED')
         [{'id': 594226727, 'state': 'CANCELED', 'date': '2018-09-12T21:27:25'}]
     """
+    # Индекс, колоночное хранилище и результат partition_by_state отвечают сами, без просмотра словарей
+    if hasattr(data, "by_state"):
+        return cast(SupportsByState, data).by_state(state)
+
     # Создаем новый список, содержащий только операции с нужным статусом
     filtered_data = []
 
@@ -45,16 +87,101 @@ def filter_by_state(data: list[dict[str, Any]], state: str = "EXECUTED") -> list
     return filtered_data
 
 
-def sort_by_date(data: list[dict[str, Any]], reverse: bool = True) -> list[dict[str, Any]]:
+def partition_by_state(data: Iterable[dict[str, Any]]) -> StatePartition:
+    """
+    Раскладывает операции по статусам за один проход.
+
+    Вместо вызова filter_by_state для каждого статуса: все группы строятся
+    одним просмотром данных. Операции не копируются, в группах лежат ссылки
+    на исходные словари. Операции без ключа 'state' попадают в группу None.
+
+    Аргументы:
+        data (Iterable[dict[str, Any]]): Операции, список или любой итератор.
+
+    Возвращает:
+        StatePartition: Словарь «статус → операции в исходном порядке».
+                        Статусы перечислены в порядке первого появления.
+
+    Примеры:
+        >>> groups = partition_by_state(operations)
+        >>> executed, canceled = groups.get("EXECUTED", []), groups.get("CANCELED", [])
+        >>> filter_by_state(groups, "PENDING")
+        []
+    """
+    groups = StatePartition()
+    for operation in data:
+        state = operation.get("state")
+        group = groups.get(state)
+        if group is None:
+            group = groups[state] = []
+        group.append(operation)
+    return groups
+
+
+def count_by_state(data: Iterable[dict[str, Any]]) -> dict[Any, int]:
+    """
+    Считает операции каждого статуса за один проход, не собирая списков.
+
+    Примеры:
+        >>> count_by_state(operations)
+        {'EXECUTED': 2, 'CANCELED': 1}
+    """
+    return dict(Counter(operation.get("state") for operation in data))
+
+
+def iter_by_state(
+    data: Iterable[dict[str, Any]], states: Iterable[Any] | None = None
+) -> Iterator[tuple[Any, dict[str, Any]]]:
+    """
+    Генератор пар (статус, операция) для потоковой обработки без копирования.
+
+    Аргументы:
+        data (Iterable[dict[str, Any]]): Операции, список или любой итератор.
+        states (Iterable | None): Выдавать только операции с этими статусами.
+                                  None — все операции.
+
+    Возвращает:
+        Iterator[tuple[Any, dict]]: Пары в исходном порядке операций.
+
+    Примеры:
+        >>> for state, operation in iter_by_state(read_ndjson("operations.ndjson"), {"EXECUTED", "PENDING"}):
+        ...     writers[state].write(operation)
+    """
+    if states is None:
+        for operation in data:
+            yield operation.get("state"), operation
+        return
+
+    wanted = set(states)
+    for operation in data:
+        state = operation.get("state")
+        if state in wanted:
+            yield state, operation
+
+
+def sort_by_date(
+    data: list[dict[str, Any]] | SupportsSortedByDate, reverse: bool = True, parse_dates: bool = False
+) -> list[dict[str, Any]]:
     """
     Сортирует список операций по дате.
 
+    По умолчанию даты сравниваются как строки. Это быстро, но неверно, если
+    записи содержат разные часовые пояса ('Z', '+03:00') или дробную часть
+    секунд разной длины. В режиме parse_dates=True каждая дата один раз
+    преобразуется в целое число микросекунд UTC (parse_timestamp),
+    и сортировка идёт по этим ключам.
+
     Аргументы:
         data (list[dict[str, Any]]): Список словарей с данными о банковских операциях.
                                      Каждый словарь должен содержать ключ 'date' в формате ISO 8601.
         reverse (bool): Порядок сортировки. По умолчанию True (убывание - сначала новые).
                         - True: сортировка по убыванию (от новых к старым)
                         - False: сортировка по возрастанию (от старых к новым)
+        parse_dates (bool): Сравнивать даты как моменты времени, а не как строки.
+                            Операции без ключа 'date' считаются самыми старыми.
+                            Некорректная дата вызывает ValueError.
+                            Для TransactionStore и MappedTransactionStore даты всегда сравниваются как моменты
+                            времени: сортируется столбец целых меток.
 
     Возвращает:
         list[dict[str, Any]]: Новый список словарей, отсортированный по дате.
@@ -78,13 +205,106 @@ def sort_by_date(data: list[dict[str, Any]], reverse: bool = True) -> list[dict[
          {'id': 615064591, 'state': 'CANCELED', 'date': '2018-10-14T08:21:33'},
          {'id': 414288290, 'state': 'EXECUTED', 'date': '2019-07-03T18:35:29'}]
     """
+    if hasattr(data, "sorted_by_date"):
+        return cast(SupportsSortedByDate, data).sorted_by_date(reverse)
 
-    # Если ключ 'date' отсутствует, возвращаем пустую строку (она будет в конце при сортировке)
-    def get_date(operation: dict[str, Any]) -> Any:
-        return operation.get("date", "")
+    if parse_dates:
+        # Разбор дат нужен только в этом режиме, поэтому src.timestamps загружается здесь
+        from src.timestamps import parse_timestamp
 
-    # key=get_date - указываем, по какому полю сортировать
+        def get_key(operation: dict[str, Any]) -> Any:
+            date = operation.get("date")
+            return MISSING_TIMESTAMP if date is None else parse_timestamp(date)
+
+    else:
+        # Если ключ 'date' отсутствует, возвращаем пустую строку (она будет в конце при сортировке)
+        def get_key(operation: dict[str, Any]) -> Any:
+            return operation.get("date", "")
+
+    # key=get_key - указываем, по какому полю сортировать
     # reverse=reverse - задаем порядок сортировки
-    sorted_data = sorted(data, key=get_date, reverse=reverse)
+    sorted_data = sorted(data, key=get_key, reverse=reverse)
 
     return sorted_data
+
+
+def date_to_bound(date_to: str, parse_dates: bool = False) -> Any:
+    """
+    Ключ верхней границы периода date_to включительно.
+
+    Дата без времени (YYYY-MM-DD) включает весь день: к строке дописывается
+    '~', который больше любого символа даты ISO 8601, а при parse_dates
+    берётся последняя микросекунда дня по UTC. Остальные границы
+    сравниваются как есть.
+
+    Пример:
+        >>> "2019-07-03T18:35:29" <= date_to_bound("2019-07-03")
+        True
+    """
+    is_day = len(date_to) == 10 and date_to[4] == "-" and date_to[7] == "-"
+    if not parse_dates:
+        return date_to + "~" if is_day else date_to
+
+    from src.timestamps import parse_timestamp
+
+    timestamp = parse_timestamp(date_to)
+    return timestamp + _DAY_MICROSECONDS - 1 if is_day else timestamp
+
+
+def latest_operations(
+    data: Iterable[dict[str, Any]],
+    n: int,
+    reverse: bool = True,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Возвращает первые n операций в порядке sort_by_date без полной сортировки.
+
+    Использует ограниченную кучу (heapq.nlargest / heapq.nsmallest): время
+    O(N log n) и память O(n) вместо копии всего списка. Порядок операций
+    с одинаковой датой и положение операций без ключа 'date' совпадают
+    с sort_by_date(data, reverse)[:n].
+
+    Аргументы:
+        data (Iterable[dict[str, Any]]): Операции, список или любой итератор.
+        n (int): Количество возвращаемых операций.
+        reverse (bool): True — самые новые операции (по умолчанию),
+                        False — самые старые.
+        date_from (str | None): Нижняя граница даты включительно. Операции
+                                с более ранней датой пропускаются.
+        date_to (str | None): Верхняя граница даты включительно. Операции
+                              с более поздней датой пропускаются; дата
+                              без времени включает весь день (см. date_to_bound).
+                              Границы сравниваются со строкой 'date'
+                              так же, как при сортировке.
+
+    Возвращает:
+        list[dict[str, Any]]: Не более n операций, отсортированных по дате.
+
+    Примеры:
+        >>> latest_operations(operations, 2)
+        [{'id': 414288290, 'state': 'EXECUTED', 'date': '2019-07-03T18:35:29'},
+         {'id': 615064591, 'state': 'CANCELED', 'date': '2018-10-14T08:21:33'}]
+
+        >>> latest_operations(operations, 10, date_from="2019-01-01")
+        [{'id': 414288290, 'state': 'EXECUTED', 'date': '2019-07-03T18:35:29'}]
+    """
+    if n <= 0:
+        return []
+
+    def get_date(operation: dict[str, Any]) -> Any:
+        return operation.get("date", "")
+
+    if date_from is not None or date_to is not None:
+        high = None if date_to is None else date_to_bound(date_to)
+        data = (
+            operation
+            for operation in data
+            if (date_from is None or get_date(operation) >= date_from)
+            and (high is None or get_date(operation) <= high)
+        )
+
+    if reverse:
+        return heapq.nlargest(n, data, key=get_date)
+    return heapq.nsmallest(n, data, key=get_date)
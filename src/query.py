@@ -0,0 +1,109 @@
+"""
+Модуль ленивых запросов к банковским транзакциям.
+
+Содержит класс Transactions, который собирает цепочку фильтров,
+сортировки и маскирования и выполняет её за один проход по источнику.
+Промежуточные списки не создаются: данные материализуются только
+при сортировке, и только для записей, прошедших фильтры.
+"""
+
+from typing import Any, Iterable, Iterator
+
+from src.widget import mask_operation
+
+
+class Transactions:
+    """
+    Ленивый запрос к набору транзакций.
+
+    Каждый метод возвращает новый объект запроса, исходный не изменяется.
+    Фильтры по статусу и валюте объединяются в одну проверку, поэтому
+    порядок вызовов в цепочке не влияет на результат и число проходов.
+    Результат совпадает с последовательным применением filter_by_state,
+    filter_by_currency, sort_by_date и mask_account_card.
+
+    Примеры:
+        >>> query = Transactions(operations).state("EXECUTED").currency("USD").sort_by_date().mask()
+        >>> for operation in query:
+        ...     print(operation["from"])
+    """
+
+    def __init__(self, source: Iterable[dict[str, Any]]) -> None:
+        self._source = source
+        self._states: tuple[str, ...] = ()
+        self._currencies: tuple[str, ...] = ()
+        self._reverse: bool | None = None
+        self._mask = False
+
+    def _copy(self) -> "Transactions":
+        query = Transactions(self._source)
+        query._states = self._states
+        query._currencies = self._currencies
+        query._reverse = self._reverse
+        query._mask = self._mask
+        return query
+
+    def state(self, state: str = "EXECUTED") -> "Transactions":
+        """Оставляет операции с указанным статусом (аналог filter_by_state)."""
+        query = self._copy()
+        query._states = self._states + (state,)
+        return query
+
+    def currency(self, currency: str) -> "Transactions":
+        """Оставляет операции в указанной валюте (аналог filter_by_currency)."""
+        query = self._copy()
+        query._currencies = self._currencies + (currency,)
+        return query
+
+    def sort_by_date(self, reverse: bool = True) -> "Transactions":
+        """Сортирует операции по дате (аналог sort_by_date)."""
+        query = self._copy()
+        query._reverse = reverse
+        return query
+
+    def mask(self) -> "Transactions":
+        """Маскирует поля 'from' и 'to' через mask_account_card в копиях записей."""
+        query = self._copy()
+        query._mask = True
+        return query
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        operations: Iterable[dict[str, Any]] = self._source
+        states = set(self._states)
+        currencies = set(self._currencies)
+
+        # Несколько разных значений одного фильтра не могут совпасть одновременно
+        if len(states) > 1 or len(currencies) > 1:
+            operations = ()
+        elif states or currencies:
+            operations = _select(operations, next(iter(states), None), next(iter(currencies), None))
+
+        if self._reverse is not None:
+            operations = sorted(operations, key=_date_key, reverse=self._reverse)
+
+        if not self._mask:
+            return iter(operations)
+        return map(mask_operation, operations)
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Выполняет запрос и возвращает результат списком."""
+        return list(self)
+
+
+def _date_key(operation: dict[str, Any]) -> Any:
+    return operation.get("date", "")
+
+
+def _select(operations: Iterable[dict[str, Any]], state: str | None, currency: str | None) -> Iterator[dict[str, Any]]:
+    """Один проход по источнику с объединённой проверкой статуса и валюты."""
+    if currency is None:
+        for operation in operations:
+            if operation.get("state") == state:
+                yield operation
+        return
+
+    for operation in operations:
+        if state is not None and operation.get("state") != state:
+            continue
+        if operation.get("operationAmount", {}).get("currency", {}).get("code", "") == currency:
+            yield operation
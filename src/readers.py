@@ -0,0 +1,162 @@
+"""
+Модуль потокового чтения банковских транзакций из файлов.
+
+Содержит генераторы, которые читают транзакции из NDJSON-файлов
+и больших JSON-массивов по одной записи, не загружая файл целиком
+в память. Результат можно сразу передавать в функции src.generators.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+# Ошибка разбора ближе этого числа символов к концу буфера может означать,
+# что элемент просто обрезан границей блока (например, "tru" или "\u12")
+_TRUNCATION_MARGIN = 16
+
+# Символы, которыми может продолжаться число: "1" из "1.5" или "1e5" на границе блока ещё не разобрано целиком
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+def read_ndjson(path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Читает транзакции из NDJSON-файла (один JSON-объект на строку).
+
+    Пустые строки пропускаются.
+
+    Аргументы:
+        path (str | Path): Путь к файлу.
+
+    Возвращает:
+        Iterator[dict]: Итератор словарей с данными о транзакциях.
+
+    Исключения:
+        ValueError: Если строка файла не является корректным JSON.
+
+    Примеры:
+        >>> for transaction in read_ndjson("operations.ndjson"):
+        ...     print(transaction["id"])
+    """
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Некорректный JSON в строке {line_number}: {e.msg}") from e
+
+
+def read_json_array(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict[str, Any]]:
+    """
+    Читает транзакции из JSON-файла с массивом верхнего уровня.
+
+    Файл читается блоками по chunk_size символов, элементы массива
+    разбираются по одному через json.JSONDecoder.raw_decode, поэтому
+    в памяти одновременно находится только текущий блок и текущий элемент.
+
+    Аргументы:
+        path (str | Path): Путь к файлу.
+        chunk_size (int): Размер блока чтения в символах.
+
+    Возвращает:
+        Iterator[dict]: Итератор элементов массива.
+
+    Исключения:
+        ValueError: Если файл не содержит JSON-массив или массив повреждён.
+
+    Примеры:
+        >>> usd = filter_by_currency(read_json_array("operations.json"), "USD")
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, encoding="utf-8") as file:
+        buffer = ""
+        position = 0
+        eof = False
+
+        def fill() -> bool:
+            # Дочитываем следующий блок, отбрасывая уже разобранную часть буфера
+            nonlocal buffer, position, eof
+            chunk = file.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[position:] + chunk
+            position = 0
+            return True
+
+        def skip(chars: str) -> str:
+            # Пропускает символы из chars и возвращает следующий символ ('' — конец файла)
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position] in chars:
+                    position += 1
+                if position < len(buffer):
+                    return buffer[position]
+                if not fill():
+                    return ""
+
+        if skip(_WHITESPACE) != "[":
+            raise ValueError("Ожидался JSON-массив")
+        position += 1
+
+        expect_item = True
+        empty = True
+        while True:
+            char = skip(_WHITESPACE)
+            if char == "]":
+                if expect_item and not empty:
+                    raise ValueError("Лишняя ',' перед концом массива")
+                return
+            if char == "":
+                raise ValueError("Неожиданный конец файла: массив не закрыт")
+            if not expect_item:
+                if char != ",":
+                    raise ValueError(f"Ожидалась ',' между элементами массива, получено {char!r}")
+                position += 1
+                expect_item = True
+                continue
+
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    # Дочитываем, только если элемент может быть обрезан границей блока:
+                    # иначе повреждённый элемент заставил бы прочитать весь файл до конца
+                    truncated = e.pos >= len(buffer) - _TRUNCATION_MARGIN or e.msg.startswith("Unterminated string")
+                    if truncated and fill():
+                        continue
+                    raise ValueError(f"Некорректный элемент JSON-массива: {e.msg}") from e
+                # Значение, упёршееся в конец буфера, или число перед символом числа
+                # может продолжаться в следующем блоке
+                if end == len(buffer) or (type(item) in (int, float) and buffer[end] in _NUMBER_CHARS):
+                    if not eof and fill():
+                        continue
+                break
+
+            position = end
+            expect_item = empty = False
+            yield item
+
+
+def read_transactions(path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Читает транзакции из файла, выбирая формат по расширению.
+
+    Файлы с расширениями .ndjson и .jsonl читаются построчно,
+    остальные — как JSON-массив.
+
+    Аргументы:
+        path (str | Path): Путь к файлу.
+
+    Возвращает:
+        Iterator[dict]: Итератор словарей с данными о транзакциях.
+    """
+    if Path(path).suffix.lower() in (".ndjson", ".jsonl"):
+        return read_ndjson(path)
+    return read_json_array(path)
@@ -0,0 +1,76 @@
+"""
+Модуль маскирования номеров карт и счетов в произвольном тексте.
+
+Описания операций, комментарии и заметки иногда содержат полные номера,
+которые не проходят через mask_account_card. Функции модуля находят
+в тексте номера карт (16 цифр подряд или четыре группы по 4 цифры через
+пробел или дефис) и номера счетов (20 цифр подряд) одним проходом
+заранее скомпилированного регулярного выражения и маскируют их в формате
+get_mask_card_number и get_mask_account.
+"""
+
+import re
+from typing import Any, Iterable, Iterator
+
+from src import masks
+from src.generators import transaction_descriptions
+
+# Номер не должен быть частью более длинной последовательности цифр.
+# Группы: 1 — счёт; 2, 4, 5, 6 — блоки карты; 3 — разделитель блоков (одинаковый внутри номера).
+# Опережающая проверка (?=\d) в начале позволяет движку быстро пропускать позиции без цифр,
+# иначе ретроспективная проверка (?<!\d) выполнялась бы на каждом символе (~2.5x медленнее)
+_NUMBER_PATTERN = re.compile(
+    r"(?=\d)(?<!\d)(?:(\d{20})|(\d{4})([ -]?)(\d{4})\3(\d{4})\3(\d{4}))(?!\d)",
+    re.ASCII,
+)
+
+
+def _mask_match(match: re.Match[str]) -> str:
+    account = match.group(1)
+    if account is not None:
+        return f"**{account[-4:]}"
+    first, _, second, _, last = match.group(2, 3, 4, 5, 6)
+    return f"{first} {second[:2]}** **** {last}"
+
+
+def _mask_luhn_match(match: re.Match[str]) -> str:
+    if match.group(1) is None and not masks.is_luhn_valid("".join(match.group(2, 4, 5, 6))):
+        return match.group(0)
+    return _mask_match(match)
+
+
+def scrub_text(text: str, luhn: bool = False) -> str:
+    """
+    Маскирует номера карт и счетов в произвольном тексте.
+
+    Аргументы:
+        text (str): Текст описания, комментария или заметки.
+        luhn (bool): Маскировать только номера карт, проходящие проверку
+                     по алгоритму Луна (меньше ложных срабатываний на идентификаторах).
+                     Номера счетов маскируются всегда.
+
+    Возвращает:
+        str: Текст, где номер карты заменён на "XXXX XX** **** XXXX", а счёта — на "**XXXX".
+
+    Примеры:
+        >>> scrub_text("Перевод с карты 7000-7922-8960-6361 на счет 73654108430135874305")
+        'Перевод с карты 7000 79** **** 6361 на счет **4305'
+    """
+    return _NUMBER_PATTERN.sub(_mask_luhn_match if luhn else _mask_match, text)
+
+
+def scrub_descriptions(transactions: Iterable[dict[str, Any]], luhn: bool = False) -> Iterator[str]:
+    """
+    Генератор описаний транзакций с замаскированными номерами карт и счетов.
+
+    Аналог transaction_descriptions, который обрабатывает описания по одному,
+    поэтому подходит для потоковых источников (например, read_ndjson).
+
+    Примеры:
+        >>> for description in scrub_descriptions(read_ndjson("operations.ndjson")):
+        ...     print(description)
+    """
+    pattern_sub = _NUMBER_PATTERN.sub
+    replace = _mask_luhn_match if luhn else _mask_match
+    for description in transaction_descriptions(transactions):
+        yield pattern_sub(replace, description)
@@ -0,0 +1,268 @@
+"""
+Модуль компактного колоночного хранения транзакций.
+
+Содержит класс TransactionStore, который хранит транзакции не словарями,
+а столбцами: идентификаторы, суммы в минимальных единицах и даты
+(микросекунды UTC) — в array('q'), статусы и валюты — кодами в array('H')
+со справочником уникальных значений. Повторяющиеся описания хранятся
+одним экземпляром строки.
+
+Хранилище поддерживает протокол последовательности: len, индексация
+и итерация возвращают транзакции в словарной форме, поэтому его можно
+передавать в функции src.processing и src.generators. Эти функции
+не проверяют тип аргумента, а вызывают методы by_state, by_currency,
+sorted_by_date и iter_descriptions, если они есть.
+
+Чтение столбцов вынесено в базовый класс ColumnarTransactions: его же
+использует MappedTransactionStore из src.binary_store, у которого столбцы —
+представления memoryview над файлом, отображённым в память.
+"""
+
+from array import array
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from src.amounts import (
+    AmountPrecisionError,
+    decimal_minor_units,
+    format_minor_units,
+    minor_units_to_decimal,
+    parse_minor_units,
+)
+from src.timestamps import parse_timestamp
+
+# Значение отсутствующего числового поля (id, даты или суммы)
+MISSING = -(1 << 63)
+
+
+@lru_cache(maxsize=None)
+def _timestamp_formatter() -> Callable[[int], str]:
+    """Метка в микросекундах UTC → YYYY-MM-DDTHH:MM:SS.ffffff; datetime загружается при первом вызове."""
+    from datetime import datetime, timedelta
+
+    epoch = datetime(1970, 1, 1)
+
+    def format_timestamp(timestamp: int) -> str:
+        return (epoch + timedelta(microseconds=timestamp)).isoformat(timespec="microseconds")
+
+    return format_timestamp
+
+
+class ColumnarTransactions:
+    """
+    Чтение транзакций из столбцов: словарная форма, позиции по статусу,
+    валюте и дате.
+
+    Наследники заполняют столбцы (любые последовательности: array, memoryview)
+    и справочники state_values, currency_values, _state_codes, _currency_codes.
+    """
+
+    ids: Sequence[int]
+    dates: Sequence[int]
+    amounts: Sequence[int]
+    states: Sequence[int]
+    currencies: Sequence[int]
+    descriptions: Sequence[str | None]
+    senders: Sequence[str | None]
+    recipients: Sequence[str | None]
+    # Позиция → точная сумма, не выражаемая целыми копейками ("1.234"); в amounts на её месте MISSING
+    exact_amounts: dict[int, str]
+
+    state_values: list[str | None]
+    currency_values: list[tuple[str, str] | None]
+    _state_codes: dict[str | None, int]
+    _currency_codes: dict[tuple[str, str] | None, int]
+    _descriptions: dict[str, str]
+
+    def to_dict(self, position: int) -> dict[str, Any]:
+        """Возвращает транзакцию с указанной позицией в словарной форме."""
+        transaction: dict[str, Any] = {}
+        if self.ids[position] != MISSING:
+            transaction["id"] = self.ids[position]
+        state = self.state_values[self.states[position]]
+        if state is not None:
+            transaction["state"] = state
+        if self.dates[position] != MISSING:
+            transaction["date"] = _timestamp_formatter()(self.dates[position])
+
+        currency = self.currency_values[self.currencies[position]]
+        if currency is not None:
+            amount = self.amounts[position]
+            transaction["operationAmount"] = {
+                "amount": format_minor_units(amount) if amount != MISSING else self.exact_amounts[position],
+                "currency": {"name": currency[1], "code": currency[0]},
+            }
+
+        for key, column in (("description", self.descriptions), ("from", self.senders), ("to", self.recipients)):
+            if column[position] is not None:
+                transaction[key] = column[position]
+        return transaction
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Возвращает все транзакции в словарной форме."""
+        return [self.to_dict(position) for position in range(len(self))]
+
+    def take(self, positions: Iterable[int]) -> "TransactionStore":
+        """Новое хранилище из строк с указанными позициями (справочники общие с исходным)."""
+        store = TransactionStore()
+        store.state_values, store._state_codes = self.state_values, self._state_codes
+        store.currency_values, store._currency_codes = self.currency_values, self._currency_codes
+        store._descriptions = self._descriptions
+
+        for position in positions:
+            if position in self.exact_amounts:
+                store.exact_amounts[len(store.ids)] = self.exact_amounts[position]
+            store.ids.append(self.ids[position])
+            store.dates.append(self.dates[position])
+            store.amounts.append(self.amounts[position])
+            store.states.append(self.states[position])
+            store.currencies.append(self.currencies[position])
+            store.descriptions.append(self.descriptions[position])
+            store.senders.append(self.senders[position])
+            store.recipients.append(self.recipients[position])
+        return store
+
+    def positions_by_state(self, state: str) -> list[int]:
+        """Позиции транзакций с указанным статусом (сравнение кодов, без словарей)."""
+        code = self._state_codes.get(state)
+        if code is None:
+            return []
+        return [position for position, value in enumerate(self.states) if value == code]
+
+    def positions_by_currency(self, currency: str) -> list[int]:
+        """Позиции транзакций в указанной валюте (сравнение кодов, без словарей)."""
+        codes = {code for value, code in self._currency_codes.items() if (value[0] if value else "") == currency}
+        if not codes:
+            return []
+        return [position for position, value in enumerate(self.currencies) if value in codes]
+
+    def positions_by_date(self, reverse: bool = True) -> list[int]:
+        """Позиции транзакций, упорядоченные по дате (устойчивая сортировка целых ключей)."""
+        return sorted(range(len(self)), key=self.dates.__getitem__, reverse=reverse)
+
+    def by_state(self, state: str) -> list[dict[str, Any]]:
+        """Транзакции с указанным статусом; на этот метод опирается filter_by_state."""
+        return [self.to_dict(position) for position in self.positions_by_state(state)]
+
+    def by_currency(self, currency: str) -> Iterator[dict[str, Any]]:
+        """Транзакции в указанной валюте; словари создаются по мере обхода (filter_by_currency)."""
+        return map(self.to_dict, self.positions_by_currency(currency))
+
+    def sorted_by_date(self, reverse: bool = True) -> list[dict[str, Any]]:
+        """Транзакции, упорядоченные по дате как моменты времени (sort_by_date)."""
+        return [self.to_dict(position) for position in self.positions_by_date(reverse)]
+
+    def iter_descriptions(self) -> Iterator[str]:
+        """Описания транзакций; отсутствующее описание — пустая строка (transaction_descriptions)."""
+        for description in self.descriptions:
+            yield "" if description is None else description
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, position: int) -> dict[str, Any]:
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("Индекс транзакции вне диапазона")
+        return self.to_dict(position)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for position in range(len(self)):
+            yield self.to_dict(position)
+
+
+class TransactionStore(ColumnarTransactions):
+    """
+    Колоночное хранилище транзакций.
+
+    Преобразование в словарь нормализует данные: дата выводится в UTC
+    в формате YYYY-MM-DDTHH:MM:SS.ffffff, сумма — с двумя знаками после точки
+    (сумма с дробными копейками, например "1.234", хранится и выводится точно).
+    Отсутствующие в исходной транзакции поля в словарь не попадают.
+
+    Примеры:
+        >>> store = TransactionStore.from_dicts(transactions)
+        >>> executed = filter_by_state(store, "EXECUTED")
+        >>> store[0]["operationAmount"]["amount"]
+        '9824.07'
+    """
+
+    ids: "array[int]"
+    dates: "array[int]"
+    amounts: "array[int]"
+    states: "array[int]"
+    currencies: "array[int]"
+    descriptions: list[str | None]
+    senders: list[str | None]
+    recipients: list[str | None]
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.dates = array("q")
+        self.amounts = array("q")
+        self.states = array("H")
+        self.currencies = array("H")
+        self.descriptions = []
+        self.senders = []
+        self.recipients = []
+        self.exact_amounts = {}
+
+        # Справочники интернированных значений: код столбца → значение
+        self.state_values = []
+        self.currency_values = []
+        self._state_codes = {}
+        self._currency_codes = {}
+        self._descriptions = {}
+
+    @classmethod
+    def from_dicts(cls, transactions: Iterable[dict[str, Any]]) -> "TransactionStore":
+        """Строит хранилище из транзакций в словарной форме за один проход."""
+        store = cls()
+        store.extend(transactions)
+        return store
+
+    @staticmethod
+    def _intern(value: Any, codes: dict[Any, int], values: list[Any]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def append(self, transaction: dict[str, Any]) -> None:
+        """Добавляет транзакцию в словарной форме."""
+        self.ids.append(transaction.get("id", MISSING))
+        date = transaction.get("date")
+        self.dates.append(MISSING if date is None else parse_timestamp(date))
+
+        operation_amount = transaction.get("operationAmount")
+        if operation_amount is None:
+            self.amounts.append(MISSING)
+            currency = None
+        else:
+            try:
+                amount = parse_minor_units(operation_amount["amount"])
+            except AmountPrecisionError:
+                # Дробные копейки в целый столбец не помещаются: сумма хранится точной строкой
+                exact = minor_units_to_decimal(decimal_minor_units(operation_amount["amount"]))
+                self.exact_amounts[len(self.amounts)] = str(exact)
+                amount = MISSING
+            self.amounts.append(amount)
+            currency_info = operation_amount.get("currency", {})
+            currency = (currency_info.get("code", ""), currency_info.get("name", ""))
+
+        self.states.append(self._intern(transaction.get("state"), self._state_codes, self.state_values))
+        self.currencies.append(self._intern(currency, self._currency_codes, self.currency_values))
+
+        description = transaction.get("description")
+        if description is not None:
+            description = self._descriptions.setdefault(description, description)
+        self.descriptions.append(description)
+        self.senders.append(transaction.get("from"))
+        self.recipients.append(transaction.get("to"))
+
+    def extend(self, transactions: Iterable[dict[str, Any]]) -> None:
+        """Добавляет транзакции в словарной форме."""
+        for transaction in transactions:
+            self.append(transaction)
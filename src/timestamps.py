@@ -0,0 +1,144 @@
+"""
+Модуль разбора временных меток банковских операций.
+
+Преобразует даты ISO 8601 в целое число микросекунд от начала эпохи
+Unix (UTC). Такие ключи корректно сравниваются даже для записей
+с суффиксом 'Z', смещением часового пояса и разной длиной дробной
+части секунд, в отличие от сравнения исходных строк.
+"""
+
+import re
+from functools import lru_cache
+
+MICROSECONDS_PER_SECOND = 1_000_000
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Типичная форма даты в выгрузках: YYYY-MM-DDTHH:MM:SS[.ffffff][Z|±HH:MM]
+_ISO_PATTERN = re.compile(
+    r"(\d{4}-\d\d-\d\d)[T ]([01]\d|2[0-3]):([0-5]\d):([0-5]\d)(?:\.(\d{1,6})\d*)?(Z|[+-]\d\d:?\d\d)?",
+    re.ASCII,
+)
+# Множитель дробной части по числу её разрядов: ".5" → 500000 мкс
+_FRACTION_SCALE = (0, 100000, 10000, 1000, 100, 10, 1)
+
+
+def is_valid_date(year: int, month: int, day: int) -> bool:
+    """Проверяет, что дата существует в григорианском календаре (годы 1–9999)."""
+    if not 1 <= year <= 9999 or not 1 <= month <= 12 or day < 1:
+        return False
+    leap = month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return day <= _DAYS_IN_MONTH[month] + leap
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """Количество дней от 1970-01-01 до указанной даты (пролептический григорианский календарь)."""
+    if month <= 2:
+        year -= 1
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+@lru_cache(maxsize=4096)
+def _days_for_date(date: str) -> int | None:
+    """
+    Дни от начала эпохи для даты YYYY-MM-DD или None для несуществующей даты.
+
+    В выгрузках много операций за одни и те же дни, поэтому результат кэшируется.
+    """
+    year, month, day = int(date[0:4]), int(date[5:7]), int(date[8:10])
+    if not is_valid_date(year, month, day):
+        return None
+    return _days_from_civil(year, month, day)
+
+
+@lru_cache(maxsize=256)
+def _offset_seconds(offset: str) -> int | None:
+    """Смещение часового пояса ('Z', '+HH:MM', '-HHMM') в секундах или None, если оно некорректно."""
+    if offset == "Z":
+        return 0
+
+    digits = offset[1:].replace(":", "")
+    hours, minutes = int(digits[:2]), int(digits[2:])
+    if hours > 23 or minutes > 59:
+        return None
+
+    seconds = hours * 3600 + minutes * 60
+    return -seconds if offset[0] == "-" else seconds
+
+
+def _parse_fast(date_str: str) -> int | None:
+    """
+    Быстрый разбор формата YYYY-MM-DDTHH:MM:SS[.ffffff][Z|±HH:MM].
+
+    Возвращает None, если строка не соответствует формату, чтобы
+    вызывающий код мог перейти к медленному универсальному разбору.
+    """
+    match = _ISO_PATTERN.fullmatch(date_str)
+    if match is None:
+        return None
+
+    date, hour, minute, second, fraction, offset = match.groups()
+    days = _days_for_date(date)
+    if days is None:
+        return None
+
+    seconds = days * 86400 + int(hour) * 3600 + int(minute) * 60 + int(second)
+    if offset:
+        offset_seconds = _offset_seconds(offset)
+        if offset_seconds is None:
+            return None
+        seconds -= offset_seconds
+
+    microseconds = seconds * MICROSECONDS_PER_SECOND
+    if fraction:
+        # Разряды сверх микросекунд отброшены регулярным выражением
+        microseconds += int(fraction) * _FRACTION_SCALE[len(fraction)]
+    return microseconds
+
+
+def parse_timestamp(date_str: str) -> int:
+    """
+    Преобразует дату ISO 8601 в микросекунды от 1970-01-01T00:00:00 UTC.
+
+    Типичный формат YYYY-MM-DDTHH:MM:SS[.ffffff][Z] разбирается одним
+    регулярным выражением, без datetime.fromisoformat. Остальные допустимые
+    ISO-формы (например, дата без времени) разбираются через datetime.
+    Даты без часового пояса считаются указанными в UTC.
+
+    Аргументы:
+        date_str (str): Дата в формате ISO 8601.
+                        Пример: "2019-07-03T18:35:29.051309Z"
+
+    Возвращает:
+        int: Количество микросекунд от начала эпохи Unix.
+
+    Исключения:
+        ValueError: Если строка не является корректной датой.
+
+    Примеры:
+        >>> parse_timestamp("1970-01-01T00:00:01Z")
+        1000000
+        >>> parse_timestamp("2019-07-03T21:35:29+03:00") == parse_timestamp("2019-07-03T18:35:29")
+        True
+    """
+    str_date = str(date_str)
+    result = _parse_fast(str_date)
+    if result is not None:
+        return result
+
+    # datetime нужен только для редких форм дат, поэтому не импортируется при загрузке модуля
+    from datetime import datetime, timezone
+
+    try:
+        dt = datetime.fromisoformat(str_date)
+    except ValueError as e:
+        raise ValueError(f"Некорректный формат даты: {date_str}") from e
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = dt - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * MICROSECONDS_PER_SECOND + delta.microseconds
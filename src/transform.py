@@ -0,0 +1,272 @@
+"""
+Модуль преобразования операций по схеме полей.
+
+Схема один раз описывает, что делать с каждым полем операции: маскировать
+карту или счёт, определять тип номера автоматически, форматировать дату,
+маскировать номера в свободном тексте или оставлять как есть.
+RecordTransformer компилирует схему в отдельную функцию для одной операции:
+обработка каждого поля записана в ней явно, без выбора действия во время
+выполнения. Пустые и отсутствующие поля (например, 'from' у пополнения)
+пропускаются без исключений.
+
+Для грязных потоков apply_report использует варианты действий без исключений
+(try_*) и собирает ошибки в сводку ErrorSummary вместо прерывания обработки.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+from src import masks, scrubber, widget
+from src.masks import MaskResult, MaskStatus
+
+# Действия над значением поля: (модуль, имя функции); "pass" копирует значение без изменений.
+# Функция берётся из модуля при каждом вызове, поэтому обёртки enable_instrumentation
+# учитывают и вызовы из скомпилированных преобразователей
+FIELD_ACTIONS: dict[str, tuple[ModuleType, str] | None] = {
+    "card": (masks, "get_mask_card_number"),
+    "account": (masks, "get_mask_account"),
+    "auto": (widget, "mask_account_card"),
+    "date": (widget, "get_date"),
+    "scrub": (scrubber, "scrub_text"),
+    "pass": None,
+}
+
+# Поля, которые обычно обрабатываются для вывода операции в виджете
+DEFAULT_SCHEMA: dict[str, str | Callable[[Any], Any]] = {"from": "auto", "to": "auto", "date": "date"}
+
+MAX_REPORTED_ERRORS = 1000
+
+
+def _as_result(func: Callable[[Any], Any]) -> Callable[[Any], MaskResult]:
+    """
+    Оборачивает действие без варианта try_* так, чтобы ошибка возвращалась кодом.
+
+    Причина — текст сообщения до двоеточия: после него обычно идёт входное значение.
+    """
+
+    def checked(value: Any) -> MaskResult:
+        try:
+            return MaskStatus.OK, func(value)
+        except (TypeError, ValueError) as e:
+            return MaskStatus.INVALID, str(e).split(":", 1)[0] or type(e).__name__
+
+    return checked
+
+
+# Варианты действий без исключений для RecordTransformer.apply_report;
+# остальные действия оборачиваются _as_result
+FIELD_RESULT_ACTIONS: dict[str, tuple[ModuleType, str]] = {
+    "card": (masks, "try_get_mask_card_number"),
+    "account": (masks, "try_get_mask_account"),
+    "auto": (widget, "try_mask_account_card"),
+    "date": (widget, "try_get_date"),
+}
+
+
+def resolve_action(action: str, checked: bool = False) -> Callable[[Any], Any] | None:
+    """
+    Текущая функция действия схемы (с учётом обёрток enable_instrumentation).
+
+    При checked=True возвращается вариант без исключений, возвращающий MaskResult.
+    Для "pass" возвращается None.
+
+    Исключения:
+        KeyError: Если действие неизвестно.
+    """
+    target = FIELD_ACTIONS[action]
+    if target is None:
+        return None
+    if not checked:
+        return getattr(*target)  # type: ignore[no-any-return]
+    if action in FIELD_RESULT_ACTIONS:
+        return getattr(*FIELD_RESULT_ACTIONS[action])  # type: ignore[no-any-return]
+    module, name = target
+    return _as_result(lambda value: getattr(module, name)(value))
+
+
+class RowError(NamedTuple):
+    """Ошибка в одном поле операции."""
+
+    row: int
+    field: str
+    reason: str
+
+
+@dataclass
+class ErrorSummary:
+    """
+    Сводка ошибок RecordTransformer.apply_report.
+
+    counts считает все ошибки по паре (поле, причина), а errors хранит
+    первые max_errors ошибок с номерами строк.
+    """
+
+    rows: int = 0
+    failed_rows: int = 0
+    counts: Counter[tuple[str, str]] = field(default_factory=Counter)
+    errors: list[RowError] = field(default_factory=list)
+    max_errors: int = MAX_REPORTED_ERRORS
+    _last_failed: int = field(default=-1, init=False, repr=False)
+
+    def add(self, row: int, field_name: str, reason: str) -> None:
+        """Учитывает ошибку в поле field_name строки row (строки поступают по порядку)."""
+        if row != self._last_failed:
+            self.failed_rows += 1
+            self._last_failed = row
+        self.counts[field_name, reason] += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(RowError(row, field_name, reason))
+
+    @property
+    def error_count(self) -> int:
+        """Общее число ошибок во всех полях."""
+        return sum(self.counts.values())
+
+    def format(self, examples: int = 5) -> str:
+        """
+        Текстовая сводка: по строке на пару (поле, причина) с номерами первых строк.
+
+        Пример:
+            >>> print(summary.format())
+            Строк: 1000, с ошибками: 2, ошибок: 2
+            from: Номер карты должен содержать 16 цифр — 1 (строки 17)
+            date: Некорректный формат даты — 1 (строки 503)
+        """
+        lines = [f"Строк: {self.rows}, с ошибками: {self.failed_rows}, ошибок: {self.error_count}"]
+        for (field_name, reason), count in self.counts.most_common():
+            rows = [str(e.row) for e in self.errors if e.field == field_name and e.reason == reason][:examples]
+            more = ", …" if count > len(rows) else ""
+            lines.append(f"{field_name}: {reason} — {count} (строки {', '.join(rows)}{more})")
+        return "\n".join(lines)
+
+
+class RecordTransformer:
+    """
+    Преобразователь операций, скомпилированный из схемы полей.
+
+    Аргументы:
+        schema (dict): Поле → действие: 'card', 'account', 'auto' (mask_account_card),
+                       'date' (get_date), 'scrub' (scrub_text), 'pass' или любая функция
+                       от значения поля.
+        keep_unlisted (bool): Копировать поля, которых нет в схеме (по умолчанию True).
+                              При False результат содержит только поля схемы.
+
+    Исключения:
+        ValueError: Если в схеме указано неизвестное действие.
+
+    Примеры:
+        >>> transformer = RecordTransformer({"from": "auto", "to": "auto", "date": "date"})
+        >>> transformer({"date": "2019-08-26T10:50:58.294041", "to": "Счет 64686473678894779589"})
+        {'date': '26.08.2019', 'to': 'Счет **9589'}
+        >>> masked = transformer.apply_batch(operations)
+    """
+
+    def __init__(self, schema: dict[str, str | Callable[[Any], Any]], keep_unlisted: bool = True) -> None:
+        self.schema = dict(schema)
+        self.keep_unlisted = keep_unlisted
+        self.transform: Callable[[dict[str, Any]], dict[str, Any]]
+        self.source, self.transform = self._compile()
+        # Вариант для apply_report компилируется при первом вызове и переиспользуется
+        self._checked_transform: Callable[..., dict[str, Any]] | None = None
+
+    def _compile(self, checked: bool = False) -> tuple[str, Callable[..., Any]]:
+        """
+        Генерирует исходный код функции для схемы и компилирует его.
+
+        При checked=True функция имеет вид transform(record, index, report, placeholder):
+        действия вызываются в вариантах try_*, а ошибки передаются в
+        report(index, field, reason) и заменяются на placeholder.
+        """
+        namespace: dict[str, Any] = {}
+        lines = [
+            "def transform(record, index, report, placeholder):" if checked else "def transform(record):",
+            "    get = record.get",
+        ]
+        lines.append("    result = dict(record)" if self.keep_unlisted else "    result = {}")
+
+        for position, (key, action) in enumerate(self.schema.items()):
+            name = f"field_{position}"
+            if not isinstance(action, str):
+                namespace[name] = _as_result(action) if checked else action
+            elif action not in FIELD_ACTIONS:
+                raise ValueError(f"Неизвестное действие для поля {key!r}: {action!r}")
+            elif FIELD_ACTIONS[action] is None:
+                # Копирование имеет смысл, только если неописанные поля не копируются целиком
+                if not self.keep_unlisted:
+                    lines += [f"    if {key!r} in record:", f"        result[{key!r}] = record[{key!r}]"]
+                continue
+            else:
+                target = FIELD_RESULT_ACTIONS.get(action) if checked else FIELD_ACTIONS[action]
+                if target is None:
+                    # Действия без варианта try_* вызываются через модуль внутри обёртки _as_result
+                    namespace[name] = resolve_action(action, checked=True)
+                else:
+                    # Функция берётся из модуля при каждом вызове (см. FIELD_ACTIONS)
+                    namespace[name] = target[0]
+                    name = f"{name}.{target[1]}"
+
+            lines += [f"    value = get({key!r})", "    if value:"]
+            if checked:
+                lines += [
+                    f"        status, value = {name}(value)",
+                    "        if status:",
+                    f"            report(index, {key!r}, value)",
+                    "            value = placeholder",
+                    f"        result[{key!r}] = value",
+                ]
+            else:
+                lines.append(f"        result[{key!r}] = {name}(value)")
+            if not self.keep_unlisted:
+                lines += [f"    elif {key!r} in record:", f"        result[{key!r}] = value"]
+
+        lines.append("    return result")
+        source = "\n".join(lines) + "\n"
+        exec(compile(source, "<RecordTransformer>", "exec"), namespace)
+        return source, namespace["transform"]
+
+    def __call__(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Преобразует одну операцию; исходный словарь не изменяется."""
+        return self.transform(record)
+
+    def apply(self, records: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Лениво преобразует операции из любого итерируемого источника."""
+        return map(self.transform, records)
+
+    def apply_batch(self, records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Преобразует блок операций и возвращает список."""
+        return list(map(self.transform, records))
+
+    def apply_report(
+        self, records: Iterable[dict[str, Any]], placeholder: Any = None, max_errors: int = MAX_REPORTED_ERRORS
+    ) -> tuple[list[dict[str, Any]], ErrorSummary]:
+        """
+        Преобразует блок операций, не прерываясь на некорректных значениях.
+
+        Действия выполняются в вариантах без исключений (try_get_mask_card_number,
+        try_mask_account_card, try_get_date и т. д.). Поле с некорректным значением
+        получает placeholder (исходный номер в результат не попадает), а ошибка
+        записывается в сводку с номером строки, полем и причиной.
+
+        Аргументы:
+            records (Iterable[dict]): Операции, список или любой итератор.
+            placeholder (Any): Значение для полей с ошибкой (по умолчанию None).
+            max_errors (int): Сколько ошибок сохранять подробно; считаются все.
+
+        Возвращает:
+            tuple[list[dict], ErrorSummary]: Все операции в исходном порядке и сводка ошибок.
+
+        Пример:
+            >>> masked, summary = RecordTransformer(DEFAULT_SCHEMA).apply_report(operations)
+            >>> print(summary.format())
+        """
+        summary = ErrorSummary(max_errors=max_errors)
+        transform = self._checked_transform
+        if transform is None:
+            _, transform = self._compile(checked=True)
+            self._checked_transform = transform
+        report = summary.add
+        result = [transform(record, index, report, placeholder) for index, record in enumerate(records)]
+        summary.rows = len(result)
+        return result, summary
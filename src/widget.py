@@ -1,6 +1,132 @@
-from datetime import datetime
+import re
+from functools import lru_cache
+from typing import Any, Iterable
 
-from src.masks import get_mask_account, get_mask_card_number
+from src.masks import (
+    MASK_CACHE_MAX_AGE,
+    MaskCache,
+    MaskCacheInfo,
+    MaskResult,
+    MaskStatus,
+    try_get_mask_account,
+    try_get_mask_card_number,
+)
+from src.timestamps import is_valid_date
+
+DATE_CACHE_SIZE = 1024
+MASK_CACHE_SIZE = 10000
+
+PAYMENT_FIELDS = ("from", "to")
+
+# Готовые результаты функций try_* (см. src.masks.MaskResult)
+_OK = MaskStatus.OK
+_PAYMENT_EMPTY: MaskResult = (MaskStatus.EMPTY, "Платежная информация отсутствует или пуста")
+_PAYMENT_FORMAT: MaskResult = (MaskStatus.INVALID_FORMAT, "Некорректный формат строки")
+_INVALID_DATE: MaskResult = (MaskStatus.INVALID_DATE, "Некорректный формат даты")
+
+# Ошибки разбора платёжной информации и дат (см. src.masks.MASK_ERRORS)
+WIDGET_ERRORS: tuple[MaskResult, ...] = (_PAYMENT_EMPTY, _PAYMENT_FORMAT, _INVALID_DATE)
+
+# Известные описания платёжных средств: True — счёт, False — карта
+PAYMENT_KINDS: dict[str, bool] = {
+    "Счет": True,
+    "счет": True,
+    "СЧЕТ": True,
+    "Visa": False,
+    "Visa Classic": False,
+    "Visa Gold": False,
+    "Visa Platinum": False,
+    "Maestro": False,
+    "MasterCard": False,
+    "Mastercard": False,
+    "МИР": False,
+    "Мир": False,
+}
+
+# Формы ISO 8601, которые datetime.fromisoformat гарантированно принимает при существующей дате
+_FAST_DATE_PATTERN = re.compile(
+    r"\d{4}-\d\d-\d\d(?:T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{1,6})?(?:Z|[+-](?:[01]\d|2[0-3]):?[0-5]\d)?)?",
+    re.ASCII,
+)
+
+
+def parse_payment_info(payment_info: str) -> tuple[str, bool, str]:
+    """
+    Разбирает строку платёжной информации на описание, тип и номер за один проход.
+
+    Номер — последнее слово строки, описание — всё, что перед ним. Тип
+    определяется по таблице PAYMENT_KINDS; неизвестные описания считаются
+    картами, если это не «счет» в любом регистре.
+
+    Аргументы:
+        payment_info (str): Строка вида "Visa Platinum 7000792289606361".
+
+    Возвращает:
+        tuple[str, bool, str]: Описание, признак счёта (True — счёт, False — карта) и номер.
+
+    Пример:
+        >>> parse_payment_info("Счет 73654108430135874305")
+        ('Счет', True, '73654108430135874305')
+    """
+    if not payment_info or not str(payment_info):
+        raise ValueError("Платежная информация отсутствует или пуста")
+
+    parsed = _split_payment_info(payment_info)
+    if parsed is None:
+        raise ValueError(f"Некорректный формат строки {payment_info}")
+    return parsed
+
+
+def _split_payment_info(payment_info: str) -> tuple[str, bool, str] | None:
+    """Общий разбор для parse_payment_info и _mask_payment; None — в строке нет номера."""
+    # Последняя часть — это номер (карты или счёта), всё до него — описание
+    description, separator, number = payment_info.strip().rpartition(" ")
+    if not separator:
+        return None
+
+    is_account = PAYMENT_KINDS.get(description)
+    if is_account is None:
+        is_account = description.lower() == "счет"
+
+    return description, is_account, number
+
+
+# Кэш результатов mask_account_card; None — кэширование выключено (по умолчанию)
+_mask_cache: MaskCache | None = None
+
+
+def configure_mask_cache(maxsize: int = MASK_CACHE_SIZE, max_age: float = MASK_CACHE_MAX_AGE) -> None:
+    """
+    Включает LRU-кэш результатов mask_account_card или выключает его.
+
+    Кэш хранит исходные строки не дольше max_age секунд (см. MaskCache).
+    Повторный вызов создаёт новый пустой кэш.
+
+    Аргументы:
+        maxsize (int): Максимальное число записей. 0 выключает кэширование.
+        max_age (float): Время жизни записей в секундах.
+    """
+    global _mask_cache
+    _mask_cache = MaskCache(maxsize, max_age) if maxsize else None
+
+
+def clear_mask_cache() -> None:
+    """Очищает кэш маскирования и его счётчики, не выключая его."""
+    if _mask_cache is not None:
+        _mask_cache.clear()
+
+
+def mask_cache_info() -> MaskCacheInfo:
+    """
+    Возвращает статистику кэша маскирования.
+
+    Возвращает:
+        MaskCacheInfo: Именованный кортеж (hits, misses, evictions, maxsize, currsize).
+                       Для выключенного кэша все значения равны 0.
+    """
+    if _mask_cache is None:
+        return MaskCacheInfo(0, 0, 0, 0, 0)
+    return _mask_cache.info()
 
 
 def mask_account_card(payment_info: str) -> str:
@@ -11,26 +137,142 @@ def mask_account_card(payment_info: str) -> str:
     "Visa Platinum 7000792289606361"     → "Visa Platinum 7000 79** **** 6361"
     "Maestro 7000792289606361"           → "Maestro 7000 79** **** 6361"
     "Счет 73654108430135874305"          → "Счет **4305"
+
+    Если включён кэш (configure_mask_cache), повторные строки берутся из него.
     """
-    if not payment_info or not str(payment_info):
-        raise ValueError("Платежная информация отсутствует или пуста")
+    if _mask_cache is not None and type(payment_info) is str:
+        return _mask_cache.get(payment_info, _mask_account_card)
+    return _mask_account_card(payment_info)
 
-    parts = payment_info.strip().split(" ")
-    if len(parts) < 2:
-        raise ValueError(f"Некорректный формат строки {payment_info}")
 
-    # Последняя часть — это номер (карты или счёта)
-    number = parts[-1]
+def _mask_account_card(payment_info: str) -> str:
+    """Маскирование без кэша: разбор строки и форматирование номера."""
+    status, result = _mask_payment(payment_info)
+    if status:
+        if status == MaskStatus.INVALID_FORMAT:
+            raise ValueError(f"{result} {payment_info}")
+        raise ValueError(result)
+    return result
+
 
-    # Всё до номера — описание (может быть несколько слов)
-    description = " ".join(parts[:-1])
+def try_mask_account_card(payment_info: Any) -> MaskResult:
+    """
+    Вариант mask_account_card без исключений (см. try_get_mask_card_number).
+
+    Кэш маскирования не используется. Значения, которые не являются строкой,
+    считаются строкой некорректного формата.
+
+    Примеры:
+        >>> try_mask_account_card("Счет 73654108430135874305")
+        (<MaskStatus.OK: 0>, 'Счет **4305')
+        >>> try_mask_account_card("bad")
+        (<MaskStatus.INVALID_FORMAT: 4>, 'Некорректный формат строки')
+    """
+    return _mask_payment(payment_info)
 
-    if description.lower() == "счет":
-        masked_number = get_mask_account(number)
-    else:
-        masked_number = get_mask_card_number(number)
 
-    return f"{description} {masked_number}"
+def _mask_payment(payment_info: Any) -> MaskResult:
+    """
+    Общая часть _mask_account_card и try_mask_account_card.
+
+    Возвращает (MaskStatus.OK, замаскированная строка) или код ошибки и причину;
+    _mask_account_card превращает ошибку в ValueError.
+    """
+    if not payment_info:
+        return _PAYMENT_EMPTY
+    if type(payment_info) is not str:
+        return _PAYMENT_FORMAT
+
+    parsed = _split_payment_info(payment_info)
+    if parsed is None:
+        return _PAYMENT_FORMAT
+    description, is_account, number = parsed
+
+    # Для уже очищенных номеров формат собирается сразу, без повторных проверок try_get_mask_*
+    if number.isdigit() and number.isascii():
+        if is_account:
+            if len(number) >= 4:
+                return _OK, f"{description} **{number[-4:]}"
+        elif len(number) == 16:
+            return _OK, f"{description} {number[:4]} {number[4:6]}** **** {number[12:]}"
+
+    status, masked_number = try_get_mask_account(number) if is_account else try_get_mask_card_number(number)
+    if status:
+        return status, masked_number
+    return _OK, f"{description} {masked_number}"
+
+
+def mask_operation(operation: dict[str, Any], fields: tuple[str, ...] = PAYMENT_FIELDS) -> dict[str, Any]:
+    """
+    Возвращает копию операции с замаскированными полями платёжной информации.
+
+    Пустые и отсутствующие поля (например, 'from' у пополнения) остаются как есть.
+    """
+    masked = dict(operation)
+    for field in fields:
+        payment_info = operation.get(field)
+        if payment_info:
+            masked[field] = mask_account_card(payment_info)
+    return masked
+
+
+def mask_operations(
+    operations: Iterable[dict[str, Any]], fields: tuple[str, ...] = PAYMENT_FIELDS
+) -> list[dict[str, Any]]:
+    """
+    Маскирует поля 'from' и 'to' во всех операциях списка.
+
+    Аргументы:
+        operations (Iterable[dict]): Операции, список или любой итератор.
+        fields (tuple[str, ...]): Поля с платёжной информацией.
+
+    Возвращает:
+        list[dict]: Копии операций с замаскированными полями, исходные не изменяются.
+
+    Пример:
+        >>> mask_operations([{"id": 1, "from": "Maestro 7000792289606361"}])
+        [{'id': 1, 'from': 'Maestro 7000 79** **** 6361'}]
+    """
+    return [mask_operation(operation, fields) for operation in operations]
+
+
+def _format_date_prefix(date_prefix: str) -> str | None:
+    """
+    Преобразует дату YYYY-MM-DD в ДД.ММ.ГГГГ без разбора через datetime.
+
+    Возвращает None для несуществующей даты (например, 2023-02-30),
+    чтобы get_date обработал её медленным путём и выбросил ту же ошибку.
+    Годы до 1000 тоже уходят на медленный путь: strftime не дополняет их нулями.
+    """
+    year, month, day = int(date_prefix[0:4]), int(date_prefix[5:7]), int(date_prefix[8:10])
+    if year < 1000 or not is_valid_date(year, month, day):
+        return None
+    return f"{date_prefix[8:10]}.{date_prefix[5:7]}.{date_prefix[0:4]}"
+
+
+_cached_format_date_prefix = lru_cache(maxsize=DATE_CACHE_SIZE)(_format_date_prefix)
+
+
+def configure_date_cache(maxsize: int | None = DATE_CACHE_SIZE) -> None:
+    """
+    Задаёт размер LRU-кэша дат для get_date и очищает его.
+
+    Аргументы:
+        maxsize (int | None): Максимальное число дат в кэше.
+                              0 отключает кэширование, None снимает ограничение.
+    """
+    global _cached_format_date_prefix
+    _cached_format_date_prefix = lru_cache(maxsize=maxsize)(_format_date_prefix)
+
+
+def date_cache_info() -> Any:
+    """
+    Возвращает статистику кэша дат get_date.
+
+    Возвращает:
+        CacheInfo: Именованный кортеж (hits, misses, maxsize, currsize).
+    """
+    return _cached_format_date_prefix.cache_info()
 
 
 def get_date(date_str: str) -> str:
@@ -41,12 +283,49 @@ def get_date(date_str: str) -> str:
         "2024-03-11T02:26:18.671407" → "11.03.2024"
 
     Поддерживает как полные ISO-строки (с временем), так и просто дату "2024-03-11".
+
+    Строки типичного вида YYYY-MM-DD[THH:MM:SS[.ffffff][Z|±HH:MM]] проверяются
+    регулярным выражением, а ДД.ММ.ГГГГ вырезается из первых 10 символов
+    с кэшированием по дате (см. configure_date_cache и date_cache_info).
+    Остальные строки разбираются через datetime.fromisoformat.
     """
-    try:
-        str_date = str(date_str)
-        clean_date = str_date.replace(" ", "")
-        dt = datetime.fromisoformat(clean_date)
+    status, result = _format_date(date_str)
+    if status:
+        raise ValueError(f"{result}: {date_str}")
+    return result
 
-        return dt.strftime("%d.%m.%Y")
-    except ValueError as e:
-        raise ValueError(f"Некорректный формат даты: {date_str}") from e
+
+def try_get_date(date_str: Any) -> MaskResult:
+    """
+    Вариант get_date без исключений (см. try_get_mask_card_number).
+
+    Строки, которые не начинаются с четырёх цифр года, отклоняются без вызова
+    datetime.fromisoformat, поэтому типичный мусор в поле даты не порождает
+    исключений и внутри функции.
+
+    Пример:
+        >>> try_get_date("2024-03-11T02:26:18.671407")
+        (<MaskStatus.OK: 0>, '11.03.2024')
+    """
+    return _format_date(date_str)
+
+
+def _format_date(date_str: Any) -> MaskResult:
+    """Общая часть get_date и try_get_date: (MaskStatus.OK, ДД.ММ.ГГГГ) или _INVALID_DATE."""
+    str_date = str(date_str)
+    if " " in str_date:
+        str_date = str_date.replace(" ", "")
+
+    if _FAST_DATE_PATTERN.fullmatch(str_date):
+        formatted = _cached_format_date_prefix(str_date[:10])
+        if formatted is not None:
+            return _OK, formatted
+    elif not (str_date[:4].isdigit() and str_date[:4].isascii()):
+        return _INVALID_DATE
+
+    from datetime import datetime
+
+    try:
+        return _OK, datetime.fromisoformat(str_date).strftime("%d.%m.%Y")
+    except ValueError:
+        return _INVALID_DATE
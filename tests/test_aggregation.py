@@ -0,0 +1,87 @@
+"""
+Тесты для модуля aggregation.
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from src.aggregation import AmountStats, aggregate_amounts, sum_by_currency
+from src.generators import filter_by_currency
+
+
+def decimal_reference(transactions, key):
+    groups = {}
+    for transaction in transactions:
+        amount = Decimal(transaction["operationAmount"]["amount"])
+        groups.setdefault(key(transaction), []).append(amount)
+    return {k: (len(v), sum(v), min(v), max(v)) for k, v in groups.items()}
+
+
+def test_sum_by_currency(transactions):
+    assert sum_by_currency(transactions) == {"USD": Decimal("145822.54"), "RUB": Decimal("145065.74")}
+
+
+@pytest.mark.parametrize(
+    "by, key",
+    [
+        (("currency",), lambda t: (t["operationAmount"]["currency"]["code"],)),
+        (("state",), lambda t: (t["state"],)),
+        (("day",), lambda t: (t["date"][:10],)),
+        (("currency", "state"), lambda t: (t["operationAmount"]["currency"]["code"], t["state"])),
+        ((), lambda t: ()),
+    ],
+)
+def test_aggregate_amounts_matches_decimal(transactions, by, key):
+    result = {k: tuple(v.as_decimal().values()) for k, v in aggregate_amounts(transactions, by).items()}
+    assert result == decimal_reference(transactions, key)
+
+
+def test_aggregate_amounts_random_matches_decimal():
+    rng = random.Random(0)
+    transactions = [
+        {
+            "state": rng.choice(["EXECUTED", "CANCELED"]),
+            "operationAmount": {
+                "amount": rng.choice(["{}.{:02d}", "{}.{}", "{}", "-{}.{:02d}"]).format(
+                    rng.randrange(10**7), rng.randrange(100)
+                ),
+                "currency": {"code": rng.choice(["USD", "RUB"])},
+            },
+        }
+        for _ in range(2000)
+    ]
+    result = {k: tuple(v.as_decimal().values()) for k, v in aggregate_amounts(transactions, ("state",)).items()}
+    assert result == decimal_reference(transactions, lambda t: (t["state"],))
+
+
+def test_aggregate_amounts_over_generator(transactions):
+    result = aggregate_amounts(filter_by_currency(transactions, "RUB"), by=())
+    assert result == {(): AmountStats(count=2, total=14506574, minimum=6731470, maximum=7775104)}
+
+
+def test_aggregate_amounts_other_scales():
+    """Незначащие нули, порядок и суммы с тремя знаками после точки считаются как в Decimal."""
+    transactions = [
+        {"operationAmount": {"amount": amount, "currency": {"code": code}}}
+        for amount, code in [("1.230", "USD"), ("1E+2", "USD"), ("0.5", "USD"), ("1.234", "KWD"), ("2.001", "KWD")]
+    ]
+    assert sum_by_currency(transactions) == {"USD": Decimal("101.73"), "KWD": Decimal("3.235")}
+    result = {k: tuple(v.as_decimal().values()) for k, v in aggregate_amounts(transactions).items()}
+    assert result == decimal_reference(transactions, lambda t: (t["operationAmount"]["currency"]["code"],))
+
+
+def test_aggregate_amounts_skips_missing_amount():
+    assert aggregate_amounts([{"id": 1}]) == {}
+
+
+def test_aggregate_amounts_invalid(transactions):
+    with pytest.raises(ValueError):
+        aggregate_amounts(transactions, by=("month",))
+    with pytest.raises(ValueError):
+        aggregate_amounts([{"operationAmount": {"amount": "1,5"}}])
+
+
+def test_amount_stats_empty():
+    assert AmountStats().as_decimal() == {"count": 0, "total": Decimal("0.00"), "min": None, "max": None}
@@ -0,0 +1,58 @@
+"""
+Тесты для модуля amounts.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from src.amounts import AmountPrecisionError, decimal_minor_units, format_minor_units, parse_minor_units
+
+
+@pytest.mark.parametrize(
+    "amount, expected",
+    [
+        ("9824.07", 982407),
+        ("67314.7", 6731470),
+        ("100", 10000),
+        ("0.01", 1),
+        (".5", 50),
+        ("5.", 500),
+        ("-15.50", -1550),
+        ("+3", 300),
+        (" 42.00 ", 4200),
+        ("1.230", 123),
+        ("1E+2", 10000),
+        ("1e3", 100000),
+        ("-2.5e-1", -25),
+        ("1.2345e2", 12345),
+    ],
+)
+def test_parse_minor_units(amount, expected):
+    assert parse_minor_units(amount) == expected
+    assert parse_minor_units(amount) == int(Decimal(amount.strip()) * 100)
+
+
+@pytest.mark.parametrize("amount", ["", ".", "abc", "1,5", "e3", "1e", "1e+-2", "--1", "١٢", "NaN", "1e999"])
+def test_parse_minor_units_invalid(amount):
+    with pytest.raises(ValueError):
+        parse_minor_units(amount)
+
+
+@pytest.mark.parametrize("amount", ["1.234", "0.005", "-1.2341", "1e-3"])
+def test_parse_minor_units_precision(amount):
+    """Больше двух значащих знаков после точки: parse_minor_units отказывает, decimal_minor_units считает точно."""
+    with pytest.raises(AmountPrecisionError):
+        parse_minor_units(amount)
+    assert decimal_minor_units(amount) == Decimal(amount) * 100
+
+
+def test_decimal_minor_units_validates():
+    assert decimal_minor_units("1.230") == Decimal(123)
+    with pytest.raises(ValueError):
+        decimal_minor_units("NaN")
+
+
+@pytest.mark.parametrize("value, expected", [(982407, "9824.07"), (5, "0.05"), (-1550, "-15.50"), (0, "0.00")])
+def test_format_minor_units(value, expected):
+    assert format_minor_units(value) == expected
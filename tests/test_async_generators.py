@@ -0,0 +1,113 @@
+"""
+Тесты для модуля async_generators.
+"""
+
+import asyncio
+
+import pytest
+
+from src.async_generators import afilter_by_currency, afilter_by_state, amask_operations, atransaction_descriptions
+from src.generators import filter_by_currency, transaction_descriptions
+from src.processing import filter_by_state
+from src.widget import mask_operations
+
+
+class FakeAsyncSource:
+    """Асинхронный источник транзакций: имитирует курсор, отдающий записи с задержкой или без неё."""
+
+    def __init__(self, transactions, delay=None):
+        self.transactions = transactions
+        self.delay = delay
+        self.consumed = 0
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for transaction in self.transactions:
+            if self.delay is not None:
+                await asyncio.sleep(self.delay)
+            self.consumed += 1
+            yield transaction
+
+
+async def collect(async_iterator):
+    return [item async for item in async_iterator]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+@pytest.mark.parametrize("currency", ["USD", "RUB", "EUR"])
+def test_afilter_by_currency(transactions, currency, batch_size):
+    result = asyncio.run(collect(afilter_by_currency(FakeAsyncSource(transactions), currency, batch_size)))
+    assert result == list(filter_by_currency(transactions, currency))
+
+
+@pytest.mark.parametrize("state", ["EXECUTED", "CANCELED", "PENDING"])
+def test_afilter_by_state(transactions, state):
+    result = asyncio.run(afilter_by_state(FakeAsyncSource(transactions, delay=0), state, batch_size=2))
+    assert result == filter_by_state(transactions, state)
+
+
+def test_atransaction_descriptions(transactions):
+    result = asyncio.run(collect(atransaction_descriptions(FakeAsyncSource(transactions), batch_size=3)))
+    assert result == list(transaction_descriptions(transactions))
+
+
+def test_amask_operations(transactions):
+    result = asyncio.run(collect(amask_operations(FakeAsyncSource(transactions), batch_size=2)))
+    assert result == mask_operations(transactions)
+    assert transactions[0]["to"] == "Счет 11776614605963066702"
+
+
+def test_sync_iterable_source(transactions):
+    assert asyncio.run(collect(afilter_by_currency(iter(transactions), "USD"))) == list(
+        filter_by_currency(transactions, "USD")
+    )
+
+
+def test_pipeline_is_lazy(transactions):
+    async def first():
+        source = FakeAsyncSource(transactions * 10)
+        stream = amask_operations(afilter_by_currency(source, "USD", batch_size=2), batch_size=1)
+        item = await stream.__anext__()
+        await stream.aclose()
+        return item, source.consumed
+
+    item, consumed = asyncio.run(first())
+    assert item["id"] == 939719570
+    assert consumed == 2
+
+
+def test_yields_control_between_batches(transactions):
+    # Источник не ждёт ввода-вывода, но другие задачи всё равно должны выполняться
+    async def run():
+        ticks = 0
+        done = False
+
+        async def ticker():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        result = await afilter_by_state(FakeAsyncSource(transactions * 200), batch_size=10)
+        done = True
+        await task
+        return result, ticks
+
+    result, ticks = asyncio.run(run())
+    assert len(result) == 600
+    assert ticks >= 100
+
+
+def test_invalid_batch_size(transactions):
+    with pytest.raises(ValueError):
+        asyncio.run(afilter_by_state(FakeAsyncSource(transactions), batch_size=0))
+
+
+def test_mask_error_propagates():
+    source = FakeAsyncSource([{"from": "Visa 123"}])
+    with pytest.raises(ValueError):
+        asyncio.run(collect(amask_operations(source)))
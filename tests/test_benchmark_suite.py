@@ -0,0 +1,41 @@
+"""
+Тесты для набора бенчмарков benchmarks.suite.
+"""
+
+import json
+
+from benchmarks.suite import CASES, compare, main, run_suite
+
+
+def results(**seconds):
+    return {"results": [{"function": name, "size": 1000, "seconds": value} for name, value in seconds.items()]}
+
+
+def test_run_suite_covers_all_cases():
+    report = run_suite(list(CASES), [10], repeat=1)
+    assert [(r["function"], r["size"]) for r in report["results"]] == [(name, 10) for name in CASES]
+    assert all(r["seconds"] > 0 for r in report["results"])
+    assert report["meta"]["seed"] == 42
+
+
+def test_compare_detects_regression():
+    baseline = results(get_date=1.0, sort_by_date=1.0)
+    assert compare(baseline, results(get_date=1.1, sort_by_date=0.5), threshold=0.2) == []
+    regressions = compare(baseline, results(get_date=1.5, filter_by_state=9.0), threshold=0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("get_date (n=1000)")
+
+
+def test_main_compare_exit_code(tmp_path):
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    baseline.write_text(json.dumps(results(get_date=1.0)))
+    current.write_text(json.dumps(results(get_date=2.0)))
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert main(["compare", str(baseline), str(current), "--threshold", "1.5"]) == 0
+
+
+def test_main_run_writes_json(tmp_path):
+    output = tmp_path / "results.json"
+    args = ["run", "--functions", "get_mask_card_number", "--sizes", "100", "--repeat", "1", "--output", str(output)]
+    assert main(args) == 0
+    assert json.loads(output.read_text())["results"][0]["size"] == 100
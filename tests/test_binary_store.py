@@ -0,0 +1,91 @@
+"""
+Тесты для модуля binary_store.
+"""
+
+import pytest
+
+from src.binary_store import MappedTransactionStore, write_binary_store
+from src.generators import filter_by_currency, transaction_descriptions
+from src.processing import filter_by_state, sort_by_date
+from src.store import TransactionStore
+
+
+@pytest.fixture
+def store(transactions, tmp_path):
+    path = tmp_path / "operations.bin"
+    assert write_binary_store(transactions, path) == len(transactions)
+    with MappedTransactionStore(path) as mapped:
+        yield mapped
+
+
+def test_round_trip(transactions, store):
+    assert store.to_dicts() == transactions
+    assert list(store) == transactions
+    assert len(store) == len(transactions)
+    assert store[-1] == transactions[-1]
+
+
+def test_zero_copy_columns(transactions, store):
+    assert isinstance(store.ids, memoryview) and store.ids.readonly
+    assert list(store.ids) == [t["id"] for t in transactions]
+    assert store.states.format == "H"
+    assert list(store.descriptions) == [t["description"] for t in transactions]
+
+
+def test_same_as_transaction_store(tmp_path):
+    data = [
+        {"id": 1, "date": "2019-07-03T21:35:29+03:00", "operationAmount": {"amount": "5.5"}, "to": "Счёт ✓"},
+        {"id": 2},
+        {"id": 3, "operationAmount": {"amount": "1.234", "currency": {"name": "dinar", "code": "KWD"}}},
+    ]
+    source = TransactionStore.from_dicts(data)
+    write_binary_store(source, tmp_path / "small.bin")
+    with MappedTransactionStore(tmp_path / "small.bin") as mapped:
+        assert mapped.to_dicts() == source.to_dicts()
+        assert mapped.descriptions[:] == [None, None, None]
+        assert mapped[2]["operationAmount"]["amount"] == "1.234"
+        assert mapped.take([1]).to_dicts() == [{"id": 2}]
+
+
+def test_empty(tmp_path):
+    write_binary_store([], tmp_path / "empty.bin")
+    with MappedTransactionStore(tmp_path / "empty.bin") as mapped:
+        assert len(mapped) == 0
+        assert sort_by_date(mapped) == []
+
+
+@pytest.mark.parametrize("state", ["EXECUTED", "CANCELED", "PENDING"])
+def test_filter_by_state(transactions, store, state):
+    assert filter_by_state(store, state) == filter_by_state(transactions, state)
+
+
+@pytest.mark.parametrize("currency", ["USD", "RUB", "EUR"])
+def test_filter_by_currency(transactions, store, currency):
+    assert list(filter_by_currency(store, currency)) == list(filter_by_currency(transactions, currency))
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+def test_sort_by_date(transactions, store, reverse):
+    assert sort_by_date(store, reverse) == sort_by_date(transactions, reverse)
+    assert [store.ids[p] for p in store.positions_by_date(reverse)] == [
+        t["id"] for t in sort_by_date(transactions, reverse)
+    ]
+
+
+def test_transaction_descriptions(transactions, store):
+    assert list(transaction_descriptions(store)) == list(transaction_descriptions(transactions))
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "operations.json"
+    path.write_text("[]", encoding="utf-8")
+    with pytest.raises(ValueError, match="не является хранилищем"):
+        MappedTransactionStore(path)
+
+
+def test_closed_store(transactions, tmp_path):
+    write_binary_store(transactions, tmp_path / "operations.bin")
+    mapped = MappedTransactionStore(tmp_path / "operations.bin")
+    mapped.close()
+    with pytest.raises(ValueError):
+        mapped.ids[0]
@@ -0,0 +1,61 @@
+"""
+Тесты для модуля external_sort.
+"""
+
+import random
+
+import pytest
+
+import src.external_sort as external_sort
+from src.external_sort import external_sort_by_date
+from src.processing import sort_by_date
+
+
+@pytest.fixture
+def history():
+    """Операции с повторяющимися датами, смешанными форматами и записями без даты."""
+    rng = random.Random(7)
+    suffixes = ["", "Z", "+03:00", ".5"]
+    operations = []
+    for index in range(600):
+        operation = {"id": index, "state": rng.choice(["EXECUTED", "CANCELED"]), "description": "Перевод"}
+        if rng.random() > 0.05:
+            operation["date"] = f"2019-0{rng.randrange(1, 4)}-0{rng.randrange(1, 4)}T10:00:00{rng.choice(suffixes)}"
+        operations.append(operation)
+    return operations
+
+
+@pytest.mark.parametrize("parse_dates", [False, True])
+@pytest.mark.parametrize("reverse", [True, False])
+def test_matches_sort_by_date(history, reverse, parse_dates):
+    # Бюджет 4 КБ при ~90 КБ данных: около 20 временных файлов
+    result = list(external_sort_by_date(iter(history), reverse, parse_dates, memory_budget=4096))
+    assert result == sort_by_date(history, reverse, parse_dates)
+
+
+def test_spills_to_temporary_files(history, tmp_path):
+    sorted_operations = external_sort_by_date(history, memory_budget=4096, tmp_dir=tmp_path)
+    first = next(sorted_operations)
+    (directory,) = tmp_path.iterdir()
+    assert len(list(directory.iterdir())) > 10
+    assert first == sort_by_date(history)[0]
+
+    sorted_operations.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_multi_pass_merge(history, monkeypatch):
+    monkeypatch.setattr(external_sort, "MAX_MERGE_FILES", 3)
+    assert list(external_sort_by_date(history, memory_budget=4096)) == sort_by_date(history)
+
+
+def test_fits_in_budget(transactions, tmp_path):
+    assert list(external_sort_by_date(transactions, tmp_dir=tmp_path)) == sort_by_date(transactions)
+
+
+def test_empty_and_invalid():
+    assert list(external_sort_by_date([])) == []
+    with pytest.raises(ValueError):
+        list(external_sort_by_date([], memory_budget=0))
+    with pytest.raises(ValueError):
+        list(external_sort_by_date([{"date": "bad"}], parse_dates=True))
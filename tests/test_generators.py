@@ -4,75 +4,13 @@
 
 import pytest
 
-from src.generators import card_number_generator, filter_by_currency, transaction_descriptions
-
-
-@pytest.fixture
-def transactions():
-    """Тестовый набор транзакций."""
-    return [
-        {
-            "id": 939719570,
-            "state": "EXECUTED",
-            "date": "2018-06-30T02:08:58.425572",
-            "operationAmount": {
-                "amount": "9824.07",
-                "currency": {"name": "USD", "code": "USD"},
-            },
-            "description": "Перевод организации",
-            "from": "Счет 75106830613657916952",
-            "to": "Счет 11776614605963066702",
-        },
-        {
-            "id": 895315941,
-            "state": "EXECUTED",
-            "date": "2018-08-19T04:27:37.904916",
-            "operationAmount": {
-                "amount": "56883.54",
-                "currency": {"name": "USD", "code": "USD"},
-            },
-            "description": "Перевод с карты на карту",
-            "from": "Visa Classic 6831982476737658",
-            "to": "Visa Platinum 8990922113665229",
-        },
-        {
-            "id": 594226727,
-            "state": "CANCELED",
-            "date": "2018-09-12T21:27:25.241689",
-            "operationAmount": {
-                "amount": "67314.70",
-                "currency": {"name": "руб.", "code": "RUB"},
-            },
-            "description": "Перевод организации",
-            "from": "Visa Platinum 1246377376343588",
-            "to": "Счет 14211924144426031657",
-        },
-        {
-            "id": 142264268,
-            "state": "EXECUTED",
-            "date": "2019-04-04T23:20:05.206878",
-            "operationAmount": {
-                "amount": "79114.93",
-                "currency": {"name": "USD", "code": "USD"},
-            },
-            "description": "Перевод со счета на счет",
-            "from": "Счет 19708645243227258542",
-            "to": "Счет 75651667383060284188",
-        },
-        {
-            "id": 615064591,
-            "state": "CANCELED",
-            "date": "2018-10-14T08:21:33.419441",
-            "operationAmount": {
-                "amount": "77751.04",
-                "currency": {"name": "руб.", "code": "RUB"},
-            },
-            "description": "Перевод организации",
-            "from": "Maestro 3928549031574026",
-            "to": "Счет 84163357546688983493",
-        },
-    ]
-
+from src.generators import (
+    card_number_chunks,
+    card_number_generator,
+    card_number_records,
+    filter_by_currency,
+    transaction_descriptions,
+)
 
 # filter_by_currency
 
@@ -248,3 +186,59 @@ def test_card_number_generator_parametrized(number, expected):
     """Параметризованная проверка форматирования номеров."""
     result = next(card_number_generator(number, number))
     assert result == expected
+
+
+# card_number_chunks / card_number_records
+
+
+def is_luhn_valid(card):
+    total = 0
+    for index, char in enumerate(reversed(card.replace(" ", ""))):
+        digit = int(char)
+        if index % 2:
+            digit = digit * 2 - 9 if digit > 4 else digit * 2
+        total += digit
+    return total % 10 == 0
+
+
+@pytest.mark.parametrize(
+    "start, stop, chunk_size",
+    [
+        (1, 5, 2),
+        (9995, 30010, 333),
+        (1, 1, 10),
+        (9999999999999990, 9999999999999999, 4),
+    ],
+)
+def test_card_number_chunks_matches_generator(start, stop, chunk_size):
+    chunks = list(card_number_chunks(start, stop, chunk_size))
+    assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+    assert [card for chunk in chunks for card in chunk] == list(card_number_generator(start, stop))
+
+
+def test_card_number_chunks_empty_range():
+    assert list(card_number_chunks(10, 5)) == []
+
+
+def test_card_number_chunks_invalid_size():
+    with pytest.raises(ValueError):
+        next(card_number_chunks(1, 5, chunk_size=0))
+
+
+def test_card_number_chunks_luhn():
+    start, stop = 4000000000009990, 4000000000030010
+    result = [card for chunk in card_number_chunks(start, stop, 100, luhn=True) for card in chunk]
+    assert result == [card for card in card_number_generator(start, stop) if is_luhn_valid(card)]
+
+
+def test_card_number_records():
+    records = list(card_number_records(9995, 10004, chunk_size=4))
+    assert [len(record) for record in records] == [80, 80, 40]
+    assert b"".join(records).decode().splitlines() == list(card_number_generator(9995, 10004))
+
+
+def test_card_number_records_luhn():
+    data = b"".join(card_number_records(1, 1000, luhn=True))
+    cards = data.decode().splitlines()
+    assert len(data) == len(cards) * 20
+    assert cards == [card for card in card_number_generator(1, 1000) if is_luhn_valid(card)]
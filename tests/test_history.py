@@ -0,0 +1,106 @@
+"""
+Тесты для модуля history.
+"""
+
+import random
+
+import pytest
+
+from src.generators import filter_by_currency
+from src.history import SortedHistory
+from src.processing import filter_by_state, latest_operations, sort_by_date
+
+
+def make_operations(size, seed=1):
+    """Операции с повторяющимися датами, пропусками даты и датами в разных часовых поясах."""
+    rng = random.Random(seed)
+    operations = []
+    for index in range(size):
+        operation = {
+            "id": index,
+            "state": rng.choice(["EXECUTED", "CANCELED"]),
+            "operationAmount": {"amount": "1.00", "currency": {"code": rng.choice(["USD", "RUB"])}},
+        }
+        if rng.random() > 0.05:
+            operation["date"] = f"2019-0{rng.randrange(1, 4)}-1{rng.randrange(10)}T10:00:00{rng.choice(['', 'Z'])}"
+        operations.append(operation)
+    return operations
+
+
+def ids(operations):
+    return [operation["id"] for operation in operations]
+
+
+@pytest.mark.parametrize("parse_dates", [False, True])
+@pytest.mark.parametrize("reverse", [True, False])
+def test_add_matches_sort_by_date(reverse, parse_dates):
+    operations = make_operations(500)
+    history = SortedHistory(parse_dates=parse_dates, chunk_size=8)
+    for operation in operations:
+        history.add(operation)
+    assert len(history) == 500
+    assert ids(history.iter(reverse)) == ids(sort_by_date(operations, reverse, parse_dates))
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+def test_extend_matches_sort_by_date(reverse):
+    operations = make_operations(300)
+    history = SortedHistory(operations[:100], chunk_size=4)
+    history.extend(operations[100:120])  # по одной
+    history.extend(iter(operations[120:]))  # перестроение блоков
+    assert ids(history.iter(reverse)) == ids(sort_by_date(operations, reverse))
+    assert ids(history) == ids(sort_by_date(operations))
+
+
+@pytest.mark.parametrize("n", [0, 1, 7, 1000])
+@pytest.mark.parametrize("reverse", [True, False])
+def test_latest(n, reverse):
+    operations = make_operations(200)
+    history = SortedHistory(operations, chunk_size=5)
+    assert ids(history.latest(n, reverse)) == ids(latest_operations(operations, n, reverse))
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+@pytest.mark.parametrize(
+    "date_from, date_to",
+    [("2019-02-10", "2019-02-15"), ("2019-02-13T10:00:00", None), (None, "2019-01-12T10:00:00Z"), ("2020", None)],
+)
+def test_between(reverse, date_from, date_to):
+    operations = make_operations(300)
+    history = SortedHistory(operations, chunk_size=6)
+    expected = latest_operations(operations, len(operations), reverse, date_from, date_to)
+    assert ids(history.between(date_from, date_to, reverse)) == ids(expected)
+
+
+def test_filtered_iteration():
+    operations = make_operations(300)
+    history = SortedHistory(operations, chunk_size=6)
+    expected = sort_by_date(filter_by_state(list(filter_by_currency(operations, "USD")), "CANCELED"))
+    assert ids(history.iter(state="CANCELED", currency="USD")) == ids(expected)
+    assert ids(history.latest(3, state="CANCELED", currency="USD")) == ids(expected[:3])
+    assert history.between("2019-03-10", None, state="PENDING") == []
+
+
+def test_parse_dates_bounds():
+    history = SortedHistory(
+        [{"id": 1, "date": "2019-01-01T00:30:00+03:00"}, {"id": 2, "date": "2018-12-31T22:00:00Z"}], parse_dates=True
+    )
+    assert ids(history) == [2, 1]
+    assert ids(history.between("2018-12-31T21:00:00Z", "2018-12-31T22:00:00Z")) == [2, 1]
+
+
+@pytest.mark.parametrize("parse_dates", [False, True])
+def test_between_date_to_includes_day(parse_dates):
+    operations = [{"id": 1, "date": "2019-07-03T18:35:29.512364"}, {"id": 2, "date": "2019-07-04T00:00:00"}]
+    history = SortedHistory(operations, parse_dates=parse_dates)
+    assert ids(history.between(None, "2019-07-03")) == [1]
+    assert ids(history.between("2019-07-03", "2019-07-03", reverse=False)) == [1]
+
+
+def test_empty_and_invalid():
+    assert list(SortedHistory()) == []
+    assert SortedHistory().latest(5) == []
+    with pytest.raises(ValueError):
+        SortedHistory(chunk_size=0)
+    with pytest.raises(ValueError):
+        SortedHistory(parse_dates=True).add({"date": "bad"})
@@ -0,0 +1,51 @@
+"""
+Тесты для модуля index.
+"""
+
+import pytest
+
+from src.generators import filter_by_currency
+from src.index import TransactionIndex
+from src.processing import filter_by_state
+
+
+@pytest.mark.parametrize("currency", ["USD", "RUB", "EUR"])
+def test_filter_by_currency_from_index(transactions, currency):
+    index = TransactionIndex(transactions)
+    assert list(filter_by_currency(index, currency)) == list(filter_by_currency(transactions, currency))
+
+
+@pytest.mark.parametrize("state", ["EXECUTED", "CANCELED", "PENDING"])
+@pytest.mark.parametrize("by_state", [True, False])
+def test_filter_by_state_from_index(transactions, state, by_state):
+    index = TransactionIndex(transactions, by_state=by_state)
+    assert filter_by_state(index, state) == filter_by_state(transactions, state)
+
+
+@pytest.mark.parametrize("by_date", [True, False])
+def test_by_date(transactions, by_date):
+    index = TransactionIndex(transactions, by_date=by_date)
+    assert [t["id"] for t in index.by_date("2018-06-30")] == [939719570]
+    assert index.by_date("2000-01-01") == []
+
+
+def test_index_append(transactions):
+    index = TransactionIndex(transactions[:2], by_date=True)
+    index.append(transactions[2])
+    index.extend(iter(transactions[3:]))
+    assert len(index) == len(transactions)
+    assert list(index) == transactions
+    assert index.by_currency("RUB") == list(filter_by_currency(transactions, "RUB"))
+    assert index.currencies() == {"USD": 3, "RUB": 2}
+
+
+def test_index_missing_fields():
+    index = TransactionIndex([{"id": 1}])
+    assert index.by_currency("") == [{"id": 1}]
+    assert filter_by_state(index, "EXECUTED") == []
+
+
+def test_index_returns_new_lists(transactions):
+    index = TransactionIndex(transactions)
+    index.by_currency("USD").clear()
+    assert len(index.by_currency("USD")) == 3
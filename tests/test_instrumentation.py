@@ -0,0 +1,168 @@
+"""
+Тесты для модуля instrumentation.
+"""
+
+import logging
+
+import pytest
+
+import src.generators as generators
+import src.query as query
+import src.widget as widget
+from src.instrumentation import (
+    InMemorySink,
+    LoggingSink,
+    PrometheusFileSink,
+    disable_instrumentation,
+    enable_instrumentation,
+    error_reason,
+    flush_metrics,
+    get_metrics,
+    is_instrumentation_enabled,
+    reset_metrics,
+)
+from src.transform import DEFAULT_SCHEMA, RecordTransformer
+
+ORIGINAL_MASK_ACCOUNT_CARD = widget.mask_account_card
+
+
+@pytest.fixture
+def instrumented():
+    sink = InMemorySink()
+    enable_instrumentation(sink)
+    reset_metrics()
+    yield sink
+    disable_instrumentation()
+    reset_metrics()
+
+
+def test_disabled_has_no_wrappers():
+    assert not is_instrumentation_enabled()
+    assert widget.mask_account_card is ORIGINAL_MASK_ACCOUNT_CARD
+    assert not hasattr(widget.mask_account_card, "__wrapped__")
+
+
+def test_enable_and_disable_restore_functions(instrumented):
+    assert is_instrumentation_enabled()
+    assert widget.mask_account_card.__wrapped__ is ORIGINAL_MASK_ACCOUNT_CARD
+    # Обёртка подставлена и в модули, импортировавшие функцию по имени
+    assert query.mask_operation is widget.mask_operation
+
+    disable_instrumentation()
+    assert widget.mask_account_card is ORIGINAL_MASK_ACCOUNT_CARD
+    assert query.mask_operation.__name__ == "mask_operation"
+    assert not hasattr(query.mask_operation, "__wrapped__")
+
+
+def test_calls_and_errors(instrumented, payment_info):
+    for payment, expected in payment_info:
+        assert widget.mask_account_card(payment) == expected
+    with pytest.raises(ValueError):
+        widget.get_date("2024-13-01")
+
+    metrics = get_metrics()
+    assert metrics["src.widget.mask_account_card"].calls == len(payment_info)
+    assert metrics["src.widget.mask_account_card"].total_seconds > 0
+    assert set(metrics["src.widget.mask_account_card"].quantiles()) == {0.5, 0.9, 0.99}
+    assert metrics["src.widget.get_date"].errors == {"ValueError: Некорректный формат даты": 1}
+
+
+def test_nested_calls_are_counted(instrumented, transactions):
+    widget.mask_operations(transactions)
+    metrics = get_metrics()
+    assert metrics["src.widget.mask_operations"].calls == 1
+    assert metrics["src.widget.mask_operation"].calls == len(transactions)
+    assert metrics["src.widget.mask_account_card"].calls == 2 * len(transactions)
+
+
+def test_generator_metrics(instrumented, transactions):
+    assert [t["id"] for t in generators.filter_by_currency(transactions, "RUB")] == [594226727, 615064591]
+    cards = generators.card_number_generator(1, 100)
+    next(cards)
+    cards.close()
+
+    metrics = get_metrics()
+    assert metrics["src.generators.filter_by_currency"].calls == 1
+    assert metrics["src.generators.card_number_generator"].calls == 1
+
+
+def test_transformer_calls_are_counted(instrumented, transactions):
+    """Преобразователь, созданный до включения метрик, вызывает уже обёрнутые функции."""
+    disable_instrumentation()
+    transformer = RecordTransformer(DEFAULT_SCHEMA)
+    enable_instrumentation()
+    transformer.apply_batch(transactions)
+    transformer.apply_report(transactions)
+
+    metrics = get_metrics()
+    masked_fields = sum(bool(t.get("from")) + bool(t.get("to")) for t in transactions)
+    assert metrics["src.widget.mask_account_card"].calls == masked_fields
+    assert metrics["src.widget.get_date"].calls == len(transactions)
+    assert metrics["src.widget.try_mask_account_card"].calls == masked_fields
+
+
+def test_error_reason_hides_numbers():
+    assert error_reason(ValueError("Некорректный формат строки 7000792289606361")) == (
+        "ValueError: Некорректный формат строки"
+    )
+    assert error_reason(ValueError("Номер карты должен содержать 16 цифр")) == (
+        "ValueError: Номер карты должен содержать 16 цифр"
+    )
+
+
+def test_error_reason_unknown_message():
+    assert error_reason(ValueError("Иванов Иван")) == "ValueError"
+    assert error_reason(KeyError("Иванов")) == "KeyError"
+
+
+@pytest.mark.parametrize("payment", ["Иванов", "Счет Иванов", "Visa 12", "Maestro Петров"])
+def test_invalid_input_not_in_labels(instrumented, payment):
+    with pytest.raises(ValueError):
+        widget.mask_account_card(payment)
+    with pytest.raises(ValueError):
+        widget.get_date(payment)
+
+    for metrics in get_metrics().values():
+        for reason in metrics.errors:
+            assert payment not in reason
+            assert payment.split()[-1] not in reason
+
+
+def test_in_memory_sink(instrumented):
+    widget.get_date("2024-03-11")
+    flush_metrics()
+    assert instrumented.snapshots[-1]["src.widget.get_date"]["calls"] == 1
+
+
+def test_logging_sink(caplog):
+    enable_instrumentation(LoggingSink(logging.getLogger("metrics")))
+    try:
+        widget.get_date("2024-03-11")
+        with caplog.at_level(logging.INFO, logger="metrics"):
+            flush_metrics()
+    finally:
+        disable_instrumentation()
+        reset_metrics()
+    assert "src.widget.get_date calls=1" in caplog.text
+
+
+def test_prometheus_sink(tmp_path):
+    path = tmp_path / "widget.prom"
+    enable_instrumentation(PrometheusFileSink(path))
+    try:
+        widget.get_date("2024-03-11")
+        with pytest.raises(ValueError):
+            widget.get_date("bad")
+        flush_metrics()
+    finally:
+        disable_instrumentation()
+        reset_metrics()
+
+    text = path.read_text(encoding="utf-8")
+    assert "# TYPE bank_widget_latency_seconds summary" in text
+    assert 'bank_widget_calls_total{function="src.widget.get_date"} 2' in text
+    assert (
+        'bank_widget_errors_total{function="src.widget.get_date",reason="ValueError: Некорректный формат даты"} 1'
+        in text
+    )
+    assert 'bank_widget_latency_seconds{function="src.widget.get_date",quantile="0.5"}' in text
@@ -0,0 +1,147 @@
+"""
+Тесты для командной строки main.py.
+"""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from main import main
+
+MAIN = Path(__file__).resolve().parent.parent / "main.py"
+
+# Модули, которые не должен загружать сам импорт main
+HEAVY_MODULES = {
+    "argparse",
+    "json",
+    "datetime",
+    "decimal",
+    "src.widget",
+    "src.processing",
+    "src.generators",
+    "src.readers",
+    "src.store",
+    "src.index",
+    "src.timestamps",
+}
+
+# Модули, которые подкоманда не должна загружать
+FORBIDDEN_MODULES = {
+    "mask": {"argparse", "json", "datetime", "decimal", "src.processing", "src.generators", "src.store"},
+    "format-date": {"argparse", "json", "datetime", "decimal", "src.processing", "src.generators", "src.store"},
+    "generate-cards": {
+        "json",
+        "datetime",
+        "decimal",
+        "src.widget",
+        "src.processing",
+        "src.readers",
+        "src.store",
+        "src.index",
+    },
+    "filter": {"datetime", "decimal", "src.widget", "src.store", "src.index", "src.timestamps"},
+    "sort": {"datetime", "decimal", "src.widget", "src.generators", "src.store", "src.index", "src.timestamps"},
+}
+
+# OPERATIONS заменяется путём к файлу с операциями
+COMMAND_ARGS = {
+    "mask": ["Visa Platinum 7000792289606361"],
+    "format-date": ["2024-03-11T02:26:18.671407"],
+    "generate-cards": ["1", "10"],
+    "filter": ["--state", "EXECUTED", "--currency", "USD", "OPERATIONS"],
+    "sort": ["OPERATIONS"],
+}
+
+
+def test_mask(capsys):
+    assert main(["mask", "Visa Platinum 7000792289606361", "Счет 73654108430135874305"]) == 0
+    assert capsys.readouterr().out == "Visa Platinum 7000 79** **** 6361\nСчет **4305\n"
+
+
+def test_mask_errors_continue(capsys, monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("Maestro 1596837868705199\nbad\n\nСчет 64686473678894779589\n"))
+    assert main(["mask"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == "Maestro 1596 83** **** 5199\nСчет **9589\n"
+    assert "Некорректный формат строки bad" in captured.err
+
+
+def test_format_date(capsys, monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("2024-03-11T02:26:18.671407\n2019-07-03\n"))
+    assert main(["format-date"]) == 0
+    assert capsys.readouterr().out == "11.03.2024\n03.07.2019\n"
+
+
+@pytest.mark.parametrize("as_array", [True, False])
+def test_filter_stdin(capsys, monkeypatch, transactions, as_array):
+    text = json.dumps(transactions) if as_array else "\n".join(json.dumps(t) for t in transactions)
+    monkeypatch.setattr(sys, "stdin", io.StringIO(text))
+    assert main(["filter", "--state", "EXECUTED", "--currency", "USD"]) == 0
+    ids = [json.loads(line)["id"] for line in capsys.readouterr().out.splitlines()]
+    assert ids == [939719570, 895315941, 142264268]
+
+
+def test_sort_file(capsys, tmp_path, transactions):
+    path = tmp_path / "operations.json"
+    path.write_text(json.dumps(transactions), encoding="utf-8")
+    assert main(["sort", "--asc", str(path)]) == 0
+    dates = [json.loads(line)["date"] for line in capsys.readouterr().out.splitlines()]
+    assert dates == sorted(t["date"] for t in transactions)
+
+    assert main(["sort", "--memory-budget", "0.0001", str(path)]) == 0
+    dates = [json.loads(line)["date"] for line in capsys.readouterr().out.splitlines()]
+    assert dates == sorted((t["date"] for t in transactions), reverse=True)
+
+
+def test_generate_cards(capsysbinary):
+    assert main(["generate-cards", "1", "3"]) == 0
+    assert capsysbinary.readouterr().out == b"0000 0000 0000 0001\n0000 0000 0000 0002\n0000 0000 0000 0003\n"
+
+
+@pytest.mark.parametrize("command", ["filter", "sort"])
+def test_missing_input_file(capsys, tmp_path, command):
+    missing = tmp_path / "nope.json"
+    assert main([command, str(missing)]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err.startswith("Ошибка: ") and str(missing) in captured.err
+    assert len(captured.err.splitlines()) == 1
+
+
+def test_invalid_command():
+    with pytest.raises(SystemExit):
+        main(["unknown"])
+
+
+def _loaded_modules(code, args=()):
+    """Модули в sys.modules после выполнения code в новом интерпретаторе (в sys.argv — args)."""
+    argv = ["main.py", *args]
+    script = f"import sys; sys.argv = {argv!r}; {code}; sys.stderr.write(chr(10).join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, cwd=MAIN.parent, check=True
+    )
+    return set(result.stderr.splitlines())
+
+
+def test_import_main_is_light():
+    assert not HEAVY_MODULES & _loaded_modules("import main")
+
+
+@pytest.fixture(scope="module")
+def operations_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("operations") / "operations.json"
+    path.write_text(json.dumps([{"id": 1, "state": "EXECUTED", "date": "2019-07-03T18:35:29.512364"}]))
+    return str(path)
+
+
+@pytest.mark.parametrize("command", sorted(COMMAND_ARGS))
+def test_startup_imports(command, operations_file):
+    """Подкоманда загружает только нужные модули; время старта измеряет benchmarks/bench_startup.py."""
+    args = [command, *(operations_file if arg == "OPERATIONS" else arg for arg in COMMAND_ARGS[command])]
+    modules = _loaded_modules("import main; main.main(sys.argv[1:])", args)
+    assert "main" in modules
+    assert not FORBIDDEN_MODULES[command] & modules
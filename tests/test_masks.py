@@ -1,6 +1,16 @@
 import pytest
 
-from src.masks import get_mask_account, get_mask_card_number
+from src.masks import (
+    LUHN_DOUBLED,
+    MaskCache,
+    MaskStatus,
+    get_mask_account,
+    get_mask_card_number,
+    is_luhn_valid,
+    mask_card_numbers,
+    try_get_mask_account,
+    try_get_mask_card_number,
+)
 
 
 def test_get_mask_card_number(card_numbers):
@@ -23,3 +33,102 @@ def test_get_mask_account_invalid_value(invalid_card_accounts):
     for card_num in invalid_card_accounts:
         with pytest.raises(ValueError):
             get_mask_account(card_num)
+
+
+def test_mask_card_numbers(card_numbers):
+    numbers = [card_num for card_num, _ in card_numbers]
+    expected = [masked for _, masked in card_numbers]
+    assert mask_card_numbers(numbers) == expected
+
+
+def test_mask_card_numbers_matches_scalar(card_numbers):
+    numbers = [card_num for card_num, _ in card_numbers]
+    assert mask_card_numbers(iter(numbers)) == [get_mask_card_number(n) for n in numbers]
+
+
+def test_mask_card_numbers_raise(invalid_card_numbers):
+    for card_num in invalid_card_numbers:
+        with pytest.raises(ValueError):
+            mask_card_numbers(["7000792289606361", card_num])
+
+
+def test_mask_card_numbers_skip(invalid_card_numbers):
+    result = mask_card_numbers(["7000792289606361", *invalid_card_numbers], errors="skip")
+    assert result == ["7000 79** **** 6361"]
+
+
+def test_mask_card_numbers_placeholder(invalid_card_numbers):
+    result = mask_card_numbers(invalid_card_numbers, errors="placeholder", placeholder="-")
+    assert result == ["-"] * len(invalid_card_numbers)
+
+
+def test_mask_card_numbers_unknown_policy():
+    with pytest.raises(ValueError):
+        mask_card_numbers([], errors="ignore")  # type: ignore[arg-type]
+
+
+def test_mask_cache_lru():
+    cache = MaskCache(maxsize=2)
+    assert cache.get("7000792289606361", get_mask_card_number) == "7000 79** **** 6361"
+    assert cache.get("73654108430135874305", get_mask_account) == "**4305"
+    assert cache.get("7000792289606361", get_mask_card_number) == "7000 79** **** 6361"
+    cache.get("1111222233334444", get_mask_card_number)
+    # Вытеснен давно не использованный номер счёта
+    assert cache.get("73654108430135874305", lambda value: "recomputed") == "recomputed"
+    assert cache.info() == (1, 4, 2, 2, 2)
+
+
+def test_mask_cache_expires(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("src.masks.monotonic", lambda: now[0])
+    cache = MaskCache(maxsize=10, max_age=60)
+    cache.get("7000792289606361", get_mask_card_number)
+    now[0] += 30
+    assert cache.get("7000792289606361", lambda value: "recomputed") == "7000 79** **** 6361"
+
+    # После истечения срока первый же промах удаляет все старые записи
+    now[0] += 31
+    cache.get("1111222233334444", get_mask_card_number)
+    assert "7000792289606361" not in cache._entries
+    assert cache.info() == (1, 2, 1, 10, 1)
+
+
+def test_mask_cache_invalid_size():
+    with pytest.raises(ValueError):
+        MaskCache(0)
+
+
+def _assert_same_as_raising(try_func, func, value):
+    status, result = try_func(value)
+    try:
+        expected = func(value)
+    except ValueError as e:
+        assert status != MaskStatus.OK
+        assert result == str(e)
+    else:
+        assert (status, result) == (MaskStatus.OK, expected)
+
+
+def test_try_get_mask_card_number(card_numbers, invalid_card_numbers):
+    for value in [number for number, _ in card_numbers] + invalid_card_numbers:
+        _assert_same_as_raising(try_get_mask_card_number, get_mask_card_number, value)
+    assert try_get_mask_card_number("70007922896")[0] == MaskStatus.INVALID_LENGTH
+    assert try_get_mask_card_number("7000792289606lll")[0] == MaskStatus.INVALID_CHARS
+    assert try_get_mask_card_number(" ")[0] == MaskStatus.EMPTY
+
+
+def test_try_get_mask_account(card_accounts, invalid_card_accounts):
+    for value in [number for number, _ in card_accounts] + invalid_card_accounts:
+        _assert_same_as_raising(try_get_mask_account, get_mask_account, value)
+    assert try_get_mask_account("73")[0] == MaskStatus.INVALID_LENGTH
+
+
+def test_luhn_doubled_table():
+    assert LUHN_DOUBLED == tuple(sum(divmod(digit * 2, 10)) for digit in range(10))
+
+
+@pytest.mark.parametrize(
+    "number, expected", [("4000000000000002", True), ("4000000000000001", False), ("79927398713", True)]
+)
+def test_is_luhn_valid(number, expected):
+    assert is_luhn_valid(number) is expected
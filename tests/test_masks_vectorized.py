@@ -0,0 +1,77 @@
+import pytest
+
+from src.masks import get_mask_account, get_mask_card_number
+from src.masks_vectorized import mask_accounts_array, mask_card_numbers_array
+
+np = pytest.importorskip("numpy")
+
+
+def test_mask_card_numbers_array(card_numbers):
+    numbers = np.array([card_num.encode() for card_num, _ in card_numbers])
+    assert mask_card_numbers_array(numbers) == [masked for _, masked in card_numbers]
+
+
+def test_mask_card_numbers_array_s16_buffer():
+    buffer = b"7000792289606361" + b"1234567812345678"
+    assert mask_card_numbers_array(buffer) == ["7000 79** **** 6361", "1234 56** **** 5678"]
+    assert mask_card_numbers_array(np.frombuffer(buffer, dtype="S16")) == mask_card_numbers_array(buffer)
+
+
+def test_mask_card_numbers_array_matches_scalar():
+    numbers = np.array([f"{n:016d}".encode() for n in range(10**15, 10**15 + 1000, 7)], dtype="S16")
+    expected = [get_mask_card_number(n.decode()) for n in numbers.tolist()]
+    assert mask_card_numbers_array(numbers) == expected
+
+
+def test_mask_card_numbers_array_invalid(invalid_card_numbers):
+    for card_num in invalid_card_numbers:
+        with pytest.raises(ValueError):
+            mask_card_numbers_array(["7000792289606361", card_num])
+
+
+def test_mask_card_numbers_array_bad_buffer():
+    with pytest.raises(ValueError):
+        mask_card_numbers_array(b"700079228960636")
+
+
+def test_mask_accounts_array(card_accounts):
+    numbers = np.array([account.encode() for account, _ in card_accounts])
+    assert mask_accounts_array(numbers) == [masked for _, masked in card_accounts]
+
+
+def test_mask_accounts_array_matches_scalar():
+    numbers = [f"{n:020d}" for n in range(10**19, 10**19 + 1000, 13)] + ["1234", "1234 5678"]
+    expected = [get_mask_account(n) for n in numbers]
+    assert mask_accounts_array(np.array(numbers)) == expected
+    assert mask_accounts_array(np.array([n.encode() for n in numbers], dtype="S20")) == expected
+
+
+def test_mask_accounts_array_invalid(invalid_card_accounts):
+    for account in invalid_card_accounts:
+        with pytest.raises(ValueError):
+            mask_accounts_array(["73654108430135874305", account])
+
+
+@pytest.mark.parametrize("number", ["٣" * 16, "７" * 16, "٣" * 20])
+def test_non_ascii_digits_match_scalar(number):
+    numbers = ["7000792289606361", number]
+    for mask_array, mask_one in (
+        (mask_card_numbers_array, get_mask_card_number),
+        (mask_accounts_array, get_mask_account),
+    ):
+        try:
+            expected = [mask_one(value) for value in numbers]
+        except ValueError:
+            with pytest.raises(ValueError):
+                mask_array(numbers)
+        else:
+            assert mask_array(numbers) == expected
+            assert mask_array(np.array(numbers)) == expected
+
+
+def test_fallback_without_numpy(no_numpy, card_numbers, card_accounts):
+    numbers = [card_num for card_num, _ in card_numbers]
+    assert mask_card_numbers_array(numbers) == [masked for _, masked in card_numbers]
+    assert mask_card_numbers_array(b"7000792289606361") == ["7000 79** **** 6361"]
+    assert mask_accounts_array(b"73654108430135874305" + b"1234".ljust(20, b"\x00")) == ["**4305", "**1234"]
+    assert mask_accounts_array([account for account, _ in card_accounts]) == [masked for _, masked in card_accounts]
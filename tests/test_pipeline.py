@@ -0,0 +1,54 @@
+"""
+Тесты для модуля pipeline.
+"""
+
+import json
+
+import pytest
+
+from src.pipeline import export_masked, mask_transactions_parallel
+from src.widget import get_date, mask_account_card
+
+
+def expected_masked(transaction):
+    masked = dict(transaction)
+    for field in ("from", "to"):
+        if field in masked:
+            masked[field] = mask_account_card(masked[field])
+    masked["date"] = get_date(masked["date"])
+    return masked
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 2), (2, 1), (2, 2), (3, 100)])
+def test_mask_transactions_parallel(transactions, workers, chunk_size):
+    result = list(mask_transactions_parallel(iter(transactions), workers=workers, chunk_size=chunk_size))
+    assert result == [expected_masked(t) for t in transactions]
+
+
+def test_mask_transactions_parallel_keeps_order(transactions):
+    data = [dict(t, id=index) for index in range(50) for t in transactions]
+    result = mask_transactions_parallel(data, workers=2, chunk_size=3)
+    assert [t["id"] for t in result] == [t["id"] for t in data]
+
+
+def test_mask_transactions_parallel_missing_fields():
+    data = [{"id": 1, "to": "Счет 73654108430135874305"}]
+    assert list(mask_transactions_parallel(data, workers=2)) == [{"id": 1, "to": "Счет **4305"}]
+
+
+def test_mask_transactions_parallel_invalid(transactions):
+    data = transactions + [{"id": 0, "from": "Visa 123", "date": "2019-07-03"}]
+    with pytest.raises(ValueError):
+        list(mask_transactions_parallel(data, workers=2, chunk_size=2))
+
+
+def test_mask_transactions_parallel_invalid_chunk_size(transactions):
+    with pytest.raises(ValueError):
+        list(mask_transactions_parallel(transactions, chunk_size=0))
+
+
+def test_export_masked(tmp_path, transactions):
+    path = tmp_path / "masked.ndjson"
+    assert export_masked(transactions, path, workers=2, chunk_size=2) == len(transactions)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [expected_masked(t) for t in transactions]
@@ -1,6 +1,13 @@
 import pytest
 
-from src.processing import filter_by_state, sort_by_date
+from src.processing import (
+    count_by_state,
+    filter_by_state,
+    iter_by_state,
+    latest_operations,
+    partition_by_state,
+    sort_by_date,
+)
 
 
 @pytest.mark.parametrize(
@@ -55,3 +62,87 @@ def test_sort_by_date_same_dates(sample_data_processing):
 def test_sort_by_date_edge_cases(invalid_data, expected):
     """Тест на нестандартные входные данные"""
     assert sort_by_date(invalid_data) == expected
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 4, 10])
+@pytest.mark.parametrize("reverse", [True, False])
+def test_latest_operations_matches_sort_by_date(sample_data_processing, n, reverse):
+    """Совпадает с срезом sort_by_date, включая порядок операций с одинаковой датой"""
+    assert latest_operations(sample_data_processing, n, reverse) == sort_by_date(sample_data_processing, reverse)[:n]
+
+
+def test_latest_operations_missing_date():
+    data = [{"id": 1}, {"id": 2, "date": "2019-07-03T18:35:29"}, {"id": 3}]
+    for reverse in (True, False):
+        for n in range(4):
+            assert latest_operations(iter(data), n, reverse) == sort_by_date(data, reverse)[:n]
+
+
+def test_latest_operations_date_window(sample_data_processing):
+    result = latest_operations(sample_data_processing, 10, date_from="2018-07-01", date_to="2019-01-01")
+    assert [item["id"] for item in result] == [3]
+
+
+def test_latest_operations_date_window_bounds(sample_data_processing):
+    result = latest_operations(sample_data_processing, 10, reverse=False, date_to="2018-06-30T02:08:58")
+    assert [item["id"] for item in result] == [2, 4]
+
+
+def test_latest_operations_date_to_includes_day():
+    data = [{"id": 1, "date": "2019-07-03T18:35:29.512364"}, {"id": 2, "date": "2019-07-04T00:00:00"}]
+    assert [item["id"] for item in latest_operations(data, 10, date_to="2019-07-03")] == [1]
+    assert [item["id"] for item in latest_operations(data, 10, date_from="2019-07-03", date_to="2019-07-03")] == [1]
+
+
+def test_sort_by_date_parse_dates():
+    """Даты с разными часовыми поясами и точностью сравниваются как моменты времени"""
+    data = [
+        {"id": 1, "date": "2019-07-03T18:35:29.5Z"},
+        {"id": 2, "date": "2019-07-03T20:35:29+03:00"},
+        {"id": 3, "date": "2019-07-03T18:35:29.051309"},
+        {"id": 4},
+    ]
+    assert [item["id"] for item in sort_by_date(data, parse_dates=True)] == [1, 3, 2, 4]
+    assert [item["id"] for item in sort_by_date(data, reverse=False, parse_dates=True)] == [4, 2, 3, 1]
+
+
+def test_sort_by_date_parse_dates_same_order(sample_data_processing):
+    assert sort_by_date(sample_data_processing, parse_dates=True) == sort_by_date(sample_data_processing)
+
+
+def test_sort_by_date_parse_dates_invalid():
+    with pytest.raises(ValueError):
+        sort_by_date([{"date": "not-a-date"}], parse_dates=True)
+
+
+def test_partition_by_state(sample_data_processing):
+    operations = sample_data_processing + [{"id": 1, "state": "PENDING"}, {"id": 2}]
+    groups = partition_by_state(iter(operations))
+    assert list(groups) == ["EXECUTED", "CANCELED", "PENDING", None]
+    for state in ("EXECUTED", "CANCELED", "PENDING", "NON_EXISTENT"):
+        assert groups.get(state, []) == filter_by_state(operations, state)
+        assert filter_by_state(groups, state) == filter_by_state(operations, state)
+    # Группы содержат исходные словари, а не копии
+    assert groups["PENDING"][0] is operations[-2]
+    assert count_by_state(operations) == {state: len(group) for state, group in groups.items()}
+
+
+def test_filter_by_state_rejects_plain_dict():
+    """Одна операция вместо списка — ошибка, а не пустой результат."""
+    with pytest.raises(AttributeError):
+        filter_by_state({"id": 1, "state": "EXECUTED"})
+
+
+def test_iter_by_state(sample_data_processing):
+    pairs = list(iter_by_state(sample_data_processing))
+    assert [operation for _, operation in pairs] == sample_data_processing
+    assert all(operation["state"] == state for state, operation in pairs)
+
+    canceled = [operation for _, operation in iter_by_state(iter(sample_data_processing), ["CANCELED"])]
+    assert canceled == filter_by_state(sample_data_processing, "CANCELED")
+
+
+def test_partition_by_state_empty():
+    assert partition_by_state([]) == {}
+    assert count_by_state([]) == {}
+    assert list(iter_by_state([], {"EXECUTED"})) == []
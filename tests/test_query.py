@@ -0,0 +1,69 @@
+"""
+Тесты для модуля query.
+"""
+
+import pytest
+
+from src.generators import filter_by_currency
+from src.processing import filter_by_state, sort_by_date
+from src.query import Transactions
+from src.widget import mask_account_card
+
+
+@pytest.mark.parametrize("state", ["EXECUTED", "CANCELED", "NON_EXISTENT"])
+def test_state_matches_filter_by_state(transactions, state):
+    assert Transactions(transactions).state(state).to_list() == filter_by_state(transactions, state)
+
+
+@pytest.mark.parametrize("currency", ["USD", "RUB", "EUR"])
+def test_currency_matches_filter_by_currency(transactions, currency):
+    assert Transactions(transactions).currency(currency).to_list() == list(filter_by_currency(transactions, currency))
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+def test_sort_matches_sort_by_date(sample_data_processing, reverse):
+    result = Transactions(sample_data_processing).sort_by_date(reverse).to_list()
+    assert result == sort_by_date(sample_data_processing, reverse)
+
+
+def test_chain_matches_functions(transactions):
+    expected = sort_by_date(list(filter_by_currency(filter_by_state(transactions), "USD")))
+    query = Transactions(transactions).state("EXECUTED").currency("USD").sort_by_date()
+    assert query.to_list() == expected
+
+
+def test_chain_order_does_not_matter(transactions):
+    first = Transactions(transactions).sort_by_date().currency("RUB").state("CANCELED").to_list()
+    second = Transactions(transactions).state("CANCELED").currency("RUB").sort_by_date().to_list()
+    assert first == second
+
+
+def test_conflicting_filters(transactions):
+    assert Transactions(transactions).state("EXECUTED").state("CANCELED").to_list() == []
+
+
+def test_query_is_lazy_for_generators(transactions):
+    """Без сортировки источник читается по мере выдачи результатов."""
+    source = iter(transactions)
+    result = iter(Transactions(source).currency("USD"))
+    assert next(result)["id"] == 939719570
+    assert next(source)["id"] == 895315941
+
+
+def test_query_is_immutable(transactions):
+    base = Transactions(transactions)
+    base.state("CANCELED")
+    assert len(base.to_list()) == len(transactions)
+
+
+def test_mask(transactions):
+    result = Transactions(transactions).mask().to_list()
+    for original, masked in zip(transactions, result):
+        assert masked["from"] == mask_account_card(original["from"])
+        assert masked["to"] == mask_account_card(original["to"])
+    assert transactions[0]["from"] == "Счет 75106830613657916952"
+
+
+def test_mask_missing_from():
+    operation = {"id": 1, "state": "EXECUTED", "to": "Счет 73654108430135874305"}
+    assert Transactions([operation]).mask().to_list() == [{"id": 1, "state": "EXECUTED", "to": "Счет **4305"}]
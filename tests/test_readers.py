@@ -0,0 +1,118 @@
+"""
+Тесты для модуля readers.
+"""
+
+import json
+
+import pytest
+
+from src.generators import filter_by_currency
+from src.readers import read_json_array, read_ndjson, read_transactions
+
+TRANSACTIONS = [
+    {"id": 1, "state": "EXECUTED", "operationAmount": {"amount": "1.00", "currency": {"code": "USD"}}},
+    {"id": 2, "state": "CANCELED", "operationAmount": {"amount": "2.00", "currency": {"code": "RUB"}}},
+    {"id": 3, "state": "EXECUTED", "description": "Перевод [с] карты, на {карту}"},
+]
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    path = tmp_path / "operations.json"
+    path.write_text(json.dumps(TRANSACTIONS, ensure_ascii=False, indent=4), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def ndjson_file(tmp_path):
+    path = tmp_path / "operations.ndjson"
+    lines = [json.dumps(t, ensure_ascii=False) for t in TRANSACTIONS]
+    path.write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+    return path
+
+
+def test_read_ndjson(ndjson_file):
+    assert list(read_ndjson(ndjson_file)) == TRANSACTIONS
+
+
+def test_read_ndjson_invalid_line(tmp_path):
+    path = tmp_path / "bad.ndjson"
+    path.write_text('{"id": 1}\n{"id": \n', encoding="utf-8")
+    with pytest.raises(ValueError, match="строке 2"):
+        list(read_ndjson(path))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 65536])
+def test_read_json_array_chunks(json_file, chunk_size):
+    """Результат не зависит от размера блока чтения."""
+    assert list(read_json_array(json_file, chunk_size=chunk_size)) == TRANSACTIONS
+
+
+def test_read_json_array_numbers_across_chunks(tmp_path):
+    path = tmp_path / "numbers.json"
+    path.write_text("[12345, 678]", encoding="utf-8")
+    assert list(read_json_array(path, chunk_size=2)) == [12345, 678]
+
+
+@pytest.mark.parametrize("content", ["[1.5]", "[1e5]", "[1,\n2.5]", "[-0.25E-3, 7]", "[true, 1.0e+2, null]"])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4])
+def test_read_json_array_scalars_across_chunks(tmp_path, content, chunk_size):
+    path = tmp_path / "scalars.json"
+    path.write_text(content, encoding="utf-8")
+    assert list(read_json_array(path, chunk_size=chunk_size)) == json.loads(content)
+
+
+def test_read_json_array_empty(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text(" [ ] ", encoding="utf-8")
+    assert list(read_json_array(path)) == []
+
+
+@pytest.mark.parametrize("content", ['{"id": 1}', "[{}", '[{"id": 1} {"id": 2}]', '[{"id": ]', "", "[1.5,]", "[1.]"])
+def test_read_json_array_invalid(tmp_path, content):
+    path = tmp_path / "bad.json"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(read_json_array(path, chunk_size=4))
+
+
+def test_read_transactions_dispatch(json_file, ndjson_file):
+    assert list(read_transactions(json_file)) == TRANSACTIONS
+    assert list(read_transactions(ndjson_file)) == TRANSACTIONS
+
+
+def test_reader_feeds_generators(json_file):
+    result = list(filter_by_currency(read_json_array(json_file), "USD"))
+    assert [t["id"] for t in result] == [1]
+
+
+def test_read_json_array_bad_element_stops_early(tmp_path, monkeypatch):
+    """Повреждённый элемент в начале большого файла не заставляет дочитывать файл до конца."""
+    path = tmp_path / "big.json"
+    item = json.dumps(TRANSACTIONS[0])
+    path.write_text('[{"id": 1 "state": "EXECUTED"},' + ",".join([item] * 20000) + "]", encoding="utf-8")
+    read = []
+
+    def counting_open(*args, **kwargs):
+        file = open(*args, **kwargs)
+        original = file.read
+
+        def counted(size=-1):
+            chunk = original(size)
+            read.append(len(chunk))
+            return chunk
+
+        file.read = counted
+        return file
+
+    monkeypatch.setattr("src.readers.open", counting_open, raising=False)
+    with pytest.raises(ValueError, match="Некорректный элемент"):
+        list(read_json_array(path, chunk_size=1024))
+    assert sum(read) <= 2048
+
+
+def test_read_json_array_truncated_string_across_chunks(tmp_path):
+    path = tmp_path / "long.json"
+    data = [{"description": "x" * 5000}, {"id": True}]
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert list(read_json_array(path, chunk_size=64)) == data
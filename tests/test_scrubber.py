@@ -0,0 +1,52 @@
+"""
+Тесты для модуля scrubber.
+"""
+
+import pytest
+
+from src.masks import get_mask_account, get_mask_card_number, is_luhn_valid
+from src.scrubber import scrub_descriptions, scrub_text
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Перевод с карты 7000792289606361", "Перевод с карты 7000 79** **** 6361"),
+        ("карта 7000 7922 8960 6361.", "карта 7000 79** **** 6361."),
+        ("карта 7000-7922-8960-6361, спасибо", "карта 7000 79** **** 6361, спасибо"),
+        ("Счет 73654108430135874305", "Счет **4305"),
+        ("7000792289606361 и 73654108430135874305", "7000 79** **** 6361 и **4305"),
+        ("Перевод организации", "Перевод организации"),
+        # Не номера: другая длина, смешанные разделители, часть длинного числа
+        ("заказ 123456789012345", "заказ 123456789012345"),
+        ("7000 7922-8960 6361", "7000 7922-8960 6361"),
+        ("12345678901234567", "12345678901234567"),
+        ("1234567890123456789012", "1234567890123456789012"),
+        ("", ""),
+    ],
+)
+def test_scrub_text(text, expected):
+    assert scrub_text(text) == expected
+
+
+def test_scrub_text_matches_masks(card_numbers, card_accounts):
+    for number, _ in card_numbers:
+        if len(number) == 16:
+            assert scrub_text(f"№{number}") == f"№{get_mask_card_number(number)}"
+    for number, _ in card_accounts:
+        if len(number) == 20:
+            assert scrub_text(f"счет:{number}") == f"счет:{get_mask_account(number)}"
+
+
+def test_scrub_text_luhn():
+    text = "карта 4000000000000002, заказ 4000000000000001, счет 73654108430135874305"
+    assert scrub_text(text, luhn=True) == "карта 4000 00** **** 0002, заказ 4000000000000001, счет **4305"
+    assert is_luhn_valid("4000000000000002")
+    assert not is_luhn_valid("4000000000000001")
+
+
+def test_scrub_descriptions(transactions):
+    operations = transactions + [{"description": "Оплата картой 7000 7922 8960 6361"}, {}]
+    result = list(scrub_descriptions(iter(operations)))
+    assert result[:5] == [t["description"] for t in transactions]
+    assert result[5:] == ["Оплата картой 7000 79** **** 6361", ""]
@@ -0,0 +1,85 @@
+"""
+Тесты для модуля store.
+"""
+
+import pytest
+
+from src.aggregation import aggregate_amounts
+from src.generators import filter_by_currency, transaction_descriptions
+from src.processing import filter_by_state, sort_by_date
+from src.store import TransactionStore
+
+
+@pytest.fixture
+def store(transactions):
+    return TransactionStore.from_dicts(transactions)
+
+
+def test_round_trip(transactions, store):
+    """Данные из тестового набора уже нормализованы и переживают круговое преобразование."""
+    assert store.to_dicts() == transactions
+    assert list(store) == transactions
+    assert len(store) == len(transactions)
+    assert store[-1] == transactions[-1]
+
+
+def test_round_trip_normalization():
+    data = [{"id": 1, "date": "2019-07-03T21:35:29+03:00", "operationAmount": {"amount": "5.5"}}, {"id": 2}]
+    assert TransactionStore.from_dicts(data).to_dicts() == [
+        {
+            "id": 1,
+            "date": "2019-07-03T18:35:29.000000",
+            "operationAmount": {"amount": "5.50", "currency": {"name": "", "code": ""}},
+        },
+        {"id": 2},
+    ]
+
+
+def test_sub_minor_unit_amounts():
+    """Суммы с дробными копейками, которые принимает aggregate_amounts, хранятся без потерь."""
+    data = [
+        {"id": 1, "operationAmount": {"amount": "1.234", "currency": {"name": "dinar", "code": "KWD"}}},
+        {"id": 2, "operationAmount": {"amount": "2.5", "currency": {"name": "dinar", "code": "KWD"}}},
+        {"id": 3, "operationAmount": {"amount": "1E-3", "currency": {"name": "dinar", "code": "KWD"}}},
+    ]
+    store = TransactionStore.from_dicts(data)
+    assert [t["operationAmount"]["amount"] for t in store] == ["1.234", "2.50", "0.001"]
+    assert [t["operationAmount"]["amount"] for t in store.take([2, 0])] == ["0.001", "1.234"]
+    total = aggregate_amounts(data)[("KWD",)].total
+    assert aggregate_amounts(store)[("KWD",)].total == total
+
+
+def test_getitem_out_of_range(store):
+    with pytest.raises(IndexError):
+        store[len(store)]
+
+
+def test_interned_columns(store):
+    assert store.state_values == ["EXECUTED", "CANCELED"]
+    assert [code for code, _ in store.currency_values] == ["USD", "RUB"]
+    assert store.descriptions[0] is store.descriptions[2]
+
+
+@pytest.mark.parametrize("state", ["EXECUTED", "CANCELED", "PENDING"])
+def test_filter_by_state(transactions, store, state):
+    assert filter_by_state(store, state) == filter_by_state(transactions, state)
+
+
+@pytest.mark.parametrize("currency", ["USD", "RUB", "EUR"])
+def test_filter_by_currency(transactions, store, currency):
+    assert list(filter_by_currency(store, currency)) == list(filter_by_currency(transactions, currency))
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+def test_sort_by_date(transactions, store, reverse):
+    assert sort_by_date(store, reverse) == sort_by_date(transactions, reverse)
+
+
+def test_transaction_descriptions(transactions, store):
+    store.append({"id": 1})
+    assert list(transaction_descriptions(store)) == list(transaction_descriptions(transactions)) + [""]
+
+
+def test_take(transactions, store):
+    subset = store.take(store.positions_by_state("CANCELED"))
+    assert subset.to_dicts() == filter_by_state(transactions, "CANCELED")
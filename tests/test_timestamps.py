@@ -0,0 +1,62 @@
+"""
+Тесты для модуля timestamps.
+"""
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from src.timestamps import parse_timestamp
+
+
+def reference(date_str):
+    dt = datetime.fromisoformat(date_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return round((dt - datetime(1970, 1, 1, tzinfo=timezone.utc)).total_seconds() * 10**6)
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "1970-01-01T00:00:00",
+        "2019-07-03T18:35:29",
+        "2019-07-03T18:35:29.051309",
+        "2019-07-03T18:35:29.051",
+        "2026-02-01T02:32:02.000Z",
+        "2019-07-03T21:35:29+03:00",
+        "2019-07-03T13:05:29-0530",
+        "2024-02-29T23:59:59.999999Z",
+        "1900-03-01T00:00:00",
+        "2000-02-29T12:00:00",
+        "2019-07-03 18:35:29",
+        "2019-07-03",
+    ],
+)
+def test_parse_timestamp_matches_datetime(date_str):
+    assert parse_timestamp(date_str) == reference(date_str)
+
+
+def test_parse_timestamp_long_fraction():
+    """Разряды дробной части сверх микросекунд отбрасываются."""
+    assert parse_timestamp("1970-01-01T00:00:00.1234567Z") == 123456
+
+
+def test_parse_timestamp_offsets_equal():
+    assert parse_timestamp("2019-07-03T21:35:29+03:00") == parse_timestamp("2019-07-03T18:35:29Z")
+
+
+def test_parse_timestamp_invalid(invalid_dates):
+    for date in invalid_dates + ["not-a-date", "2023-13-01T00:00:00", "2023-01-01T24:00:00", ""]:
+        with pytest.raises(ValueError):
+            parse_timestamp(date)
+
+
+def test_parse_timestamp_random_dates():
+    rng = random.Random(0)
+    for _ in range(1000):
+        seconds = rng.randrange(-(10**10), 10**10)
+        dt = datetime.fromtimestamp(seconds, timezone.utc).replace(microsecond=rng.randrange(10**6))
+        date_str = dt.replace(tzinfo=None).isoformat()
+        assert parse_timestamp(date_str) == seconds * 10**6 + dt.microsecond
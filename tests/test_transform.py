@@ -0,0 +1,119 @@
+"""
+Тесты для модуля transform.
+"""
+
+import pytest
+
+from src.transform import DEFAULT_SCHEMA, RecordTransformer, RowError
+from src.widget import get_date, mask_operations
+
+
+def test_default_schema(transactions):
+    transformer = RecordTransformer(DEFAULT_SCHEMA)
+    expected = mask_operations(transactions)
+    for operation in expected:
+        operation["date"] = get_date(operation["date"])
+    assert transformer.apply_batch(transactions) == expected
+    assert list(transformer.apply(iter(transactions))) == expected
+
+
+def test_missing_and_empty_fields():
+    transformer = RecordTransformer(DEFAULT_SCHEMA)
+    deposit = {"id": 1, "to": "Счет 64686473678894779589", "from": ""}
+    assert transformer(deposit) == {"id": 1, "to": "Счет **9589", "from": ""}
+    assert transformer({}) == {}
+
+
+def test_source_not_modified():
+    operation = {"from": "Maestro 1596837868705199", "date": "2019-07-03T18:35:29.512364"}
+    assert RecordTransformer(DEFAULT_SCHEMA)(operation) == {
+        "from": "Maestro 1596 83** **** 5199",
+        "date": "03.07.2019",
+    }
+    assert operation == {"from": "Maestro 1596837868705199", "date": "2019-07-03T18:35:29.512364"}
+
+
+def test_actions_and_only_listed_fields():
+    schema = {"id": "pass", "card": "card", "account": "account", "note": "scrub", "amount": float, "from": "auto"}
+    transformer = RecordTransformer(schema, keep_unlisted=False)
+    record = {
+        "id": 7,
+        "card": "7000792289606361",
+        "account": "73654108430135874305",
+        "note": "карта 7000-7922-8960-6361",
+        "amount": "10.5",
+        "from": "",
+        "state": "EXECUTED",
+    }
+    assert transformer(record) == {
+        "id": 7,
+        "card": "7000 79** **** 6361",
+        "account": "**4305",
+        "note": "карта 7000 79** **** 6361",
+        "amount": 10.5,
+        "from": "",
+    }
+    assert transformer({"state": "EXECUTED"}) == {}
+
+
+def test_unknown_action():
+    with pytest.raises(ValueError, match="Неизвестное действие для поля 'from'"):
+        RecordTransformer({"from": "mask"})
+
+
+def test_invalid_value_raises():
+    with pytest.raises(ValueError):
+        RecordTransformer({"card": "card"})({"card": "123"})
+
+
+def test_field_names_are_not_code():
+    field = "x'] = 1; import os; y = record['"
+    assert RecordTransformer({field: str.upper})({field: "abc"}) == {field: "ABC"}
+
+
+def test_apply_report(transactions):
+    transformer = RecordTransformer(DEFAULT_SCHEMA)
+    expected = transformer.apply_batch(transactions)
+    dirty = [dict(t) for t in transactions]
+    dirty[1]["from"] = "Maestro 15968378687051"
+    dirty[3]["date"] = "bad"
+    dirty[3]["to"] = "Счет"
+
+    masked, summary = transformer.apply_report(iter(dirty), placeholder="***")
+    assert masked[0] == expected[0]
+    assert masked[1] == {**expected[1], "from": "***"}
+    assert masked[3] == {**expected[3], "date": "***", "to": "***"}
+    assert (summary.rows, summary.failed_rows, summary.error_count) == (5, 2, 3)
+    assert summary.errors == [
+        RowError(1, "from", "Номер карты должен содержать 16 цифр"),
+        RowError(3, "to", "Некорректный формат строки"),
+        RowError(3, "date", "Некорректный формат даты"),
+    ]
+    assert summary.format().splitlines()[0] == "Строк: 5, с ошибками: 2, ошибок: 3"
+
+
+def test_apply_report_without_errors(transactions):
+    transformer = RecordTransformer(DEFAULT_SCHEMA)
+    masked, summary = transformer.apply_report(transactions)
+    assert masked == transformer.apply_batch(transactions)
+    assert summary.error_count == summary.failed_rows == 0
+    assert summary.format() == "Строк: 5, с ошибками: 0, ошибок: 0"
+
+
+def test_apply_report_compiles_once(transactions, monkeypatch):
+    transformer = RecordTransformer(DEFAULT_SCHEMA)
+    transformer.apply_report(transactions)
+    monkeypatch.setattr(transformer, "_compile", None)
+    masked, summary = transformer.apply_report([{"to": "Счет"}], placeholder="***")
+    assert masked == [{"to": "***"}]
+    assert summary.error_count == 1
+
+
+def test_apply_report_custom_actions_and_limit():
+    transformer = RecordTransformer({"amount": float, "note": "scrub"}, keep_unlisted=False)
+    records = [{"amount": "x: 1"}, {"amount": "2", "note": 5}, {"amount": "y"}]
+    masked, summary = transformer.apply_report(records, max_errors=1)
+    assert masked == [{"amount": None}, {"amount": 2.0, "note": None}, {"amount": None}]
+    assert summary.error_count == 3
+    assert summary.errors == [RowError(0, "amount", "could not convert string to float")]
+    assert summary.counts[("amount", "could not convert string to float")] == 2
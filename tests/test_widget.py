@@ -1,6 +1,21 @@
+from datetime import datetime
+
 import pytest
 
-from src.widget import get_date, mask_account_card
+from src.masks import MaskStatus
+from src.widget import (
+    clear_mask_cache,
+    configure_date_cache,
+    configure_mask_cache,
+    date_cache_info,
+    get_date,
+    mask_account_card,
+    mask_cache_info,
+    mask_operations,
+    parse_payment_info,
+    try_get_date,
+    try_mask_account_card,
+)
 
 
 def test_get_mask_account_card(payment_info):
@@ -23,3 +38,164 @@ def test_get_date_invalid_value(invalid_dates):
     for date in invalid_dates:
         with pytest.raises(ValueError):
             get_date(date)
+
+
+@pytest.mark.parametrize(
+    "date",
+    [
+        "2024-03-11T02:26:18.671407",
+        "2024-03-11",
+        "2024-02-29T23:59:59Z",
+        "2024-03-11T02:26:18+03:00",
+        "2024-03-11T02:26:18.1234567",
+        "2024-03-11T02:26",
+        " 2024-03-11 T02:26:18 ",
+        "0999-01-01",
+    ],
+)
+def test_get_date_matches_fromisoformat(date):
+    """Быстрый путь даёт тот же результат, что и datetime.fromisoformat."""
+    expected = datetime.fromisoformat(date.replace(" ", "")).strftime("%d.%m.%Y")
+    assert get_date(date) == expected
+
+
+@pytest.mark.parametrize("date", ["2023-02-29T10:00:00", "2023-04-31", "0000-01-01", "2023-01-01T24:00:00"])
+def test_get_date_invalid_calendar_date(date):
+    with pytest.raises(ValueError, match="Некорректный формат даты"):
+        get_date(date)
+
+
+def test_date_cache_stats():
+    configure_date_cache(2)
+    try:
+        get_date("2024-03-11T02:26:18.671407")
+        get_date("2024-03-11T05:00:00")
+        get_date("2024-03-12T05:00:00")
+        get_date("2024-03-13T05:00:00")
+        info = date_cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 3, 2, 2)
+    finally:
+        configure_date_cache()
+
+
+def test_date_cache_disabled():
+    configure_date_cache(0)
+    try:
+        assert get_date("2024-03-11") == "11.03.2024"
+        assert date_cache_info().currsize == 0
+    finally:
+        configure_date_cache()
+
+
+def test_mask_cache(payment_info):
+    configure_mask_cache(2)
+    try:
+        for payment, expected in payment_info * 2:
+            assert mask_account_card(payment) == expected
+        assert mask_account_card("Visa 7000792289606361") == mask_account_card("Visa 7000792289606361")
+        assert mask_cache_info() == (1, 2 * len(payment_info) + 1, 2 * len(payment_info) - 1, 2, 2)
+
+        clear_mask_cache()
+        assert mask_cache_info() == (0, 0, 0, 2, 0)
+    finally:
+        configure_mask_cache(0)
+    assert mask_cache_info() == (0, 0, 0, 0, 0)
+
+
+def test_mask_cache_errors_not_cached(invalid_payment_info):
+    configure_mask_cache()
+    try:
+        for payment in invalid_payment_info:
+            with pytest.raises(ValueError):
+                mask_account_card(payment)
+        assert mask_cache_info().currsize == 0
+    finally:
+        configure_mask_cache(0)
+
+
+@pytest.mark.parametrize(
+    "payment, expected",
+    [
+        ("Счет 73654108430135874305", ("Счет", True, "73654108430135874305")),
+        ("СЧЕТ 73654108430135874305", ("СЧЕТ", True, "73654108430135874305")),
+        ("Visa Classic 6831982476737658", ("Visa Classic", False, "6831982476737658")),
+        ("  Unknown Bank Card 6831982476737658 ", ("Unknown Bank Card", False, "6831982476737658")),
+        ("Visa  Gold 6831982476737658", ("Visa  Gold", False, "6831982476737658")),
+    ],
+)
+def test_parse_payment_info(payment, expected):
+    assert parse_payment_info(payment) == expected
+
+
+@pytest.mark.parametrize(
+    "payment, expected",
+    [
+        ("MasterCard 7158300734726758", "MasterCard 7158 30** **** 6758"),
+        ("счет 1234", "счет **1234"),
+        ("Мой Счет 73654108430135874305", None),
+        ("Visa Classic 68319824767376ab", None),
+    ],
+)
+def test_mask_account_card_edge_cases(payment, expected):
+    if expected is None:
+        with pytest.raises(ValueError):
+            mask_account_card(payment)
+    else:
+        assert mask_account_card(payment) == expected
+
+
+def test_mask_operations(transactions):
+    result = mask_operations(transactions)
+    assert [t["from"] for t in result[:2]] == ["Счет **6952", "Visa Classic 6831 98** **** 7658"]
+    assert [t["to"] for t in result[:2]] == ["Счет **6702", "Visa Platinum 8990 92** **** 5229"]
+    assert transactions[0]["from"] == "Счет 75106830613657916952"
+
+
+def test_mask_operations_missing_fields():
+    operations = [{"id": 1, "to": "Счет 73654108430135874305"}, {"id": 2, "from": "", "to": None}]
+    assert mask_operations(iter(operations)) == [{"id": 1, "to": "Счет **4305"}, {"id": 2, "from": "", "to": None}]
+
+
+@pytest.mark.parametrize(
+    "payment",
+    [
+        "Visa Platinum 7000792289606361",
+        "Счет 73654108430135874305",
+        "Visa Classic 7000 7922 8960 6361",
+        "Мой Счет 73654108430135874305",
+        "Visa Classic 68319824767376ab",
+        "Счет 73",
+        "Visa Platinum",
+        "",
+        None,
+    ],
+)
+def test_try_mask_account_card(payment):
+    status, result = try_mask_account_card(payment)
+    try:
+        expected = mask_account_card(payment)
+    except ValueError as e:
+        assert status != MaskStatus.OK
+        assert str(e).startswith(result)
+    else:
+        assert (status, result) == (MaskStatus.OK, expected)
+
+
+def test_try_mask_account_card_not_string():
+    assert try_mask_account_card(7000792289606361)[0] == MaskStatus.INVALID_FORMAT
+    with pytest.raises(ValueError, match="Некорректный формат строки 7000792289606361"):
+        mask_account_card(7000792289606361)
+
+
+@pytest.mark.parametrize(
+    "date",
+    ["2024-03-11T02:26:18.671407", "2019-07-03", "20240311", "2023-02-30T10:00:00", "2023/10/25", "bad", "", None],
+)
+def test_try_get_date(date):
+    status, result = try_get_date(date)
+    try:
+        expected = get_date(date)
+    except ValueError:
+        assert (status, result) == (MaskStatus.INVALID_DATE, "Некорректный формат даты")
+    else:
+        assert (status, result) == (MaskStatus.OK, expected)